@@ -0,0 +1,353 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# In[1]:
+
+
+#*******************************************************************************************
+ #
+ #  File Name:  CryptoClusteringAssignment.py
+ #
+ #  File Description:
+ #      This Python script, CryptoClusteringAssignment.py, contains the Python
+ #      functions that persist a fitted cluster model (scaler, PCA projection,
+ #      and centroids) to a compressed npz file and assign new rows to its
+ #      clusters without refitting.  The script imports only NumPy, so a
+ #      service can load it without the plotting and logging libraries, and it
+ #      prints its error messages.  Here is the list:
+ #
+ #      SaveClusterModelFunction
+ #      ReturnClusterModelDictionaryFunction
+ #      ReturnAssignedClustersFunction
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     agent
+ #  10/18/2026      Keeps the scaler mean in float64 and checks
+ #                  the batch columns                       agent
+ #
+ #******************************************************************************************/
+
+import numpy as np
+
+
+# In[2]:
+
+
+CONSTANT_LOCAL_FILE_NAME \
+    = 'CryptoClusteringAssignment.py'
+
+
+# In[3]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  SaveClusterModelFunction
+ #
+ #  Function Description:
+ #      This function saves the centroids of a fitted cluster model and, when
+ #      present, the scaler's means and scales, the PCA projection's means and
+ #      components, and the input column names to a compressed npz file.  The
+ #      scaler's means and scales stay in float64, since raw features can be
+ #      large next to their spread, and the other arrays are float32.  The
+ #      scaler is any object with mean_ and scale_ attributes,
+ #      such as a StandardScaler, and the projection is any object with mean_
+ #      and components_ attributes, such as a PCA, or a projection Dictionary
+ #      with 'mean' and 'components' entries.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  String
+ #          filePathString
+ #                          The parameter is the npz file path.
+ #  Array
+ #          centersFloatArray
+ #                          The parameter is the k x d array of centroids.
+ #  Object
+ #          scalerObject
+ #                          The parameter is the fitted scaler or None.
+ #  Object or Dictionary
+ #          projectionObject
+ #                          The parameter is the fitted projection or None.
+ #  List
+ #          columnNamesStringList
+ #                          The parameter is the input column names or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Saves the scaler in float64                 agent
+ #
+ #******************************************************************************************/
+
+def SaveClusterModelFunction \
+        (filePathString,
+         centersFloatArray,
+         scalerObject \
+            = None,
+         projectionObject \
+            = None,
+         columnNamesStringList \
+            = None):
+
+    try:
+
+        modelArrayDictionary \
+            = {'centers': np.asarray(centersFloatArray, dtype = np.float32)}
+
+        if scalerObject != None:
+
+            modelArrayDictionary['scaler_mean'] \
+                = np.asarray(scalerObject.mean_, dtype = np.float64)
+
+            modelArrayDictionary['scaler_scale'] \
+                = np.asarray(scalerObject.scale_, dtype = np.float64)
+
+        if isinstance(projectionObject, dict):
+
+            modelArrayDictionary['pca_mean'] \
+                = np.asarray(projectionObject['mean'], dtype = np.float32)
+
+            modelArrayDictionary['pca_components'] \
+                = np.asarray(projectionObject['components'], dtype = np.float32)
+
+        elif projectionObject != None:
+
+            modelArrayDictionary['pca_mean'] \
+                = np.asarray(projectionObject.mean_, dtype = np.float32)
+
+            modelArrayDictionary['pca_components'] \
+                = np.asarray(projectionObject.components_, dtype = np.float32)
+
+        if columnNamesStringList != None:
+
+            modelArrayDictionary['column_names'] \
+                = np.array([str(nameString) for nameString in columnNamesStringList])
+
+
+        np.savez_compressed \
+            (filePathString,
+             **modelArrayDictionary)
+
+    except:
+
+        print \
+            (f'The function, SaveClusterModelFunction, '
+             + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+             + f'was unable to save the cluster model to {filePathString}.')
+
+
+# In[4]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnClusterModelDictionaryFunction
+ #
+ #  Function Description:
+ #      This function loads a saved cluster model and folds the scaler, the
+ #      projection, and the centroids into a float64 shift s, one d x k float32
+ #      matrix, and a k bias, so that the nearest centroid of a row x is the
+ #      argmin of (x - s) M + b: with the projected row z = (x - s) W + c, the
+ #      squared distance to centroid j is |z|^2 - 2 z.centroid_j +
+ #      |centroid_j|^2, and |z|^2 is the same for every centroid.  The shift is
+ #      the scaler's mean, which stays out of the float32 bias, since raw
+ #      features can be large next to their spread.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  String
+ #          filePathString
+ #                          The parameter is the npz file path.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Added the float64 shift                     agent
+ #
+ #******************************************************************************************/
+
+def ReturnClusterModelDictionaryFunction \
+        (filePathString):
+
+    try:
+
+        with np.load(filePathString, allow_pickle = False) as npzFileObject:
+
+            clusterModelDictionary \
+                = {keyString: npzFileObject[keyString]
+                   for keyString in npzFileObject.files}
+
+
+        centersFloatArray \
+            = clusterModelDictionary['centers'].astype(np.float64)
+
+        # The projection is accumulated in float64 and stored in float32: the
+        # row x maps to (x - s) W + c.
+        featureCountInteger \
+            = len(clusterModelDictionary['scaler_mean']) \
+              if 'scaler_mean' in clusterModelDictionary \
+              else clusterModelDictionary['pca_components'].shape[1] \
+              if 'pca_components' in clusterModelDictionary \
+              else centersFloatArray.shape[1]
+
+        weightFloatArray \
+            = np.eye(featureCountInteger)
+
+        offsetFloatArray \
+            = np.zeros(featureCountInteger)
+
+        shiftFloatArray \
+            = np.zeros(featureCountInteger)
+
+        if 'scaler_mean' in clusterModelDictionary:
+
+            weightFloatArray \
+                = weightFloatArray \
+                  / clusterModelDictionary['scaler_scale'].astype(np.float64)
+
+            shiftFloatArray \
+                = clusterModelDictionary['scaler_mean'].astype(np.float64)
+
+        if 'pca_components' in clusterModelDictionary:
+
+            componentsFloatArray \
+                = clusterModelDictionary['pca_components'].astype(np.float64)
+
+            weightFloatArray \
+                = weightFloatArray @ componentsFloatArray.T
+
+            offsetFloatArray \
+                = (offsetFloatArray \
+                   - clusterModelDictionary['pca_mean'].astype(np.float64)) \
+                  @ componentsFloatArray.T
+
+
+        clusterModelDictionary['assignment_shift'] \
+            = shiftFloatArray
+
+        clusterModelDictionary['assignment_matrix'] \
+            = (-2.0 * weightFloatArray @ centersFloatArray.T) \
+                .astype(np.float32)
+
+        clusterModelDictionary['assignment_bias'] \
+            = ((centersFloatArray ** 2).sum(axis = 1) \
+               - 2.0 * offsetFloatArray @ centersFloatArray.T) \
+                .astype(np.float32)
+
+
+        return clusterModelDictionary
+
+    except:
+
+        print \
+            (f'The function, ReturnClusterModelDictionaryFunction, '
+             + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+             + f'was unable to load the cluster model from {filePathString}.')
+
+        return \
+            None
+
+
+# In[5]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnAssignedClustersFunction
+ #
+ #  Function Description:
+ #      This function returns the nearest-centroid cluster of every row in a
+ #      batch of raw feature rows with one float32 matrix product after the
+ #      float64 shift.  When the batch is a DataFrame and the model saved its
+ #      column names, the function reorders the batch's columns to the saved
+ #      order and raises a ValueError if any saved column is missing or any
+ #      other column is present.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  Dictionary
+ #          clusterModelDictionary
+ #                          The parameter is the loaded cluster model.
+ #  Array or DataFrame
+ #          batchFloatArray
+ #                          The parameter is the n x d batch of raw rows.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Added the shift and the column check        agent
+ #
+ #******************************************************************************************/
+
+def ReturnAssignedClustersFunction \
+        (clusterModelDictionary,
+         batchFloatArray):
+
+    # A DataFrame's columns are checked against the saved column names outside
+    # of the error handling, so a mismatch reaches the caller.
+    if hasattr(batchFloatArray, 'columns') \
+        and 'column_names' in clusterModelDictionary:
+
+        columnNamesStringList \
+            = [str(nameString) for nameString in clusterModelDictionary['column_names']]
+
+        batchColumnNamesStringList \
+            = [str(nameString) for nameString in batchFloatArray.columns]
+
+        if sorted(batchColumnNamesStringList) != sorted(columnNamesStringList):
+
+            raise \
+                ValueError \
+                    (f'The batch columns, {batchColumnNamesStringList}, '
+                     + f'do not match the cluster model columns, '
+                     + f'{columnNamesStringList}.')
+
+        batchFloatArray \
+            = batchFloatArray \
+                .set_axis \
+                    (batchColumnNamesStringList,
+                     axis = 1) \
+                [columnNamesStringList]
+
+    try:
+
+        return \
+            np.argmin \
+                ((np.asarray(batchFloatArray, dtype = np.float64) \
+                  - clusterModelDictionary['assignment_shift']) \
+                 .astype(np.float32) \
+                 @ clusterModelDictionary['assignment_matrix'] \
+                 + clusterModelDictionary['assignment_bias'],
+                 axis = 1)
+
+    except:
+
+        print \
+            (f'The function, ReturnAssignedClustersFunction, '
+             + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+             + f'was unable to assign the batch to the clusters.')
+
+        return \
+            None
+
+
+# In[ ]:
+
+
+
+
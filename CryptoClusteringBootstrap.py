@@ -0,0 +1,407 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# In[1]:
+
+
+#*******************************************************************************************
+ #
+ #  File Name:  CryptoClusteringBootstrap.py
+ #
+ #  File Description:
+ #      This Python script, CryptoClusteringBootstrap.py, contains the Python
+ #      functions of the parallel bootstrap cluster stability analysis.  Here is
+ #      the list:
+ #
+ #      ReturnBootstrapLabelsFunction
+ #      ReturnBootstrapStabilityTupleFunction
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     agent
+ #
+ #******************************************************************************************/
+
+import CryptoClusteringConstants as crypto_constant
+import CryptoClusteringSharedMemory as crypto_shared_memory
+import CryptoClusteringSweep as crypto_sweep
+import PyLogSubRoutines as log_subroutine
+
+import numpy as np
+import pandas as pd
+
+from concurrent.futures import as_completed
+from sklearn.cluster import KMeans
+from sklearn.metrics import adjusted_rand_score
+from threadpoolctl import threadpool_limits
+
+
+# In[2]:
+
+
+CONSTANT_LOCAL_FILE_NAME \
+    = 'CryptoClusteringBootstrap.py'
+
+
+# In[3]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnBootstrapLabelsFunction
+ #
+ #  Function Description:
+ #      This function is the task for one bootstrap resample: it draws the rows
+ #      with replacement from a seed that derives from the random state, the k
+ #      value, and the resample index, fits k-means to the resample, and returns
+ #      the int16 cluster predictions of all of the rows.  With sample weights,
+ #      every drawn row keeps its weight in the fit.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame or Dictionary
+ #          featureSourceObject
+ #                          The parameter is a DataFrame or a shared feature
+ #                          matrix descriptor.
+ #  Integer
+ #          kValueInteger
+ #                          The parameter is the number of clusters.
+ #  Integer
+ #          resampleInteger
+ #                          The parameter is the resample index.
+ #  String
+ #          algorithmString
+ #                          The parameter is the k-means backend.
+ #  NumPy Array
+ #          sampleWeightFloatArray
+ #                          The parameter is the weight of every row or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Added the sample weight parameter           agent
+ #
+ #******************************************************************************************/
+
+def ReturnBootstrapLabelsFunction \
+        (featureSourceObject,
+         kValueInteger,
+         resampleInteger,
+         algorithmString,
+         sampleWeightFloatArray \
+            = None):
+
+    try:
+
+        featureFloatArray \
+            = crypto_shared_memory.ReturnFeatureDataFrameFunction \
+                (featureSourceObject) \
+              .to_numpy()
+
+        # The third spawn key element keeps these seeds apart from the restart
+        # chunks' seeds.
+        randomGeneratorObject \
+            = np.random.default_rng \
+                (np.random.SeedSequence \
+                     (crypto_constant.RANDOM_STATE_INTEGER,
+                      spawn_key = (int(kValueInteger), int(resampleInteger), 0)))
+
+        resampleIndexIntegerArray \
+            = randomGeneratorObject \
+                .integers \
+                    (0,
+                     len(featureFloatArray),
+                     len(featureFloatArray))
+
+        with threadpool_limits \
+                (limits = crypto_constant.SWEEP_THREADS_PER_FIT_INTEGER):
+
+            modelKMeansObject \
+                = KMeans \
+                    (n_clusters = kValueInteger,
+                     n_init = crypto_constant.BOOTSTRAP_N_INIT_INTEGER,
+                     random_state \
+                         = int(randomGeneratorObject.integers(2 ** 31 - 1)),
+                     algorithm = algorithmString) \
+                  .fit \
+                      (featureFloatArray[resampleIndexIntegerArray],
+                       sample_weight \
+                           = None \
+                             if sampleWeightFloatArray is None \
+                             else sampleWeightFloatArray[resampleIndexIntegerArray])
+
+
+            return \
+                modelKMeansObject \
+                    .predict \
+                        (featureFloatArray) \
+                    .astype(np.int16)
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnBootstrapLabelsFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the bootstrap cluster predictions.')
+
+        return \
+            None
+
+
+# In[4]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnBootstrapStabilityTupleFunction
+ #
+ #  Function Description:
+ #      This function measures the stability of the k-means clusters for every
+ #      k value over bootstrap resamples, which run in a process pool over the
+ #      shared feature matrix.  As every resample's predictions arrive, the
+ #      function scores their adjusted Rand index against the cached full-data
+ #      model and reads the k x k contingency table of the full-data and
+ #      resample clusters: a full-data cluster's pairs that stay together are
+ #      the pairs within its cells, and a row's share of its full-data
+ #      cluster mates that stay with it is its cell's count less one over its
+ #      cluster's size less one.  The memory is O(n + k²) per k value.  It
+ #      returns a DataFrame of the mean and standard deviation of the adjusted
+ #      Rand index and the mean co-assignment frequency of the full-data
+ #      clusters' pairs for every k value, and a float32 DataFrame of every
+ #      row's mean co-assignment frequency with its full-data cluster mates,
+ #      one column per k value (NaN for single-row clusters).  With sample
+ #      weights, the full-data and resample fits weight the rows, and the
+ #      co-assignment frequencies still count rows.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          normalizedDataFrame
+ #                          The parameter is the normalized input DataFrame.
+ #  List
+ #          kValueIntegerList
+ #                          The parameter is a List of k values.
+ #  Integer
+ #          resamplesInteger
+ #                          The parameter is the number of bootstrap resamples.
+ #  Integer
+ #          maxWorkersInteger
+ #                          The parameter is the number of worker processes.
+ #  Series
+ #          sampleWeightSeries
+ #                          The parameter is the weight of every row or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Added the sample weight parameter           agent
+ #
+ #******************************************************************************************/
+
+def ReturnBootstrapStabilityTupleFunction \
+        (normalizedDataFrame,
+         kValueIntegerList,
+         resamplesInteger \
+            = None,
+         maxWorkersInteger \
+            = None,
+         sampleWeightSeries \
+            = None):
+
+    executorObject \
+        = None
+
+    sharedMemoryObject \
+        = None
+
+    try:
+
+        if resamplesInteger == None:
+
+            resamplesInteger \
+                = crypto_constant.BOOTSTRAP_RESAMPLES_INTEGER
+
+        if maxWorkersInteger == None:
+
+            maxWorkersInteger \
+                = crypto_constant.SWEEP_MAX_WORKERS_INTEGER
+
+
+        sampleWeightFloatArray \
+            = crypto_sweep.ReturnSampleWeightFloatArrayFunction \
+                (normalizedDataFrame,
+                 sampleWeightSeries)
+
+        executorObject, featureSourceObject, sharedMemoryObject \
+            = crypto_sweep.ReturnFeatureMatrixExecutorTupleFunction \
+                (normalizedDataFrame,
+                 maxWorkersInteger)
+
+        stabilityDictionaryList \
+            = []
+
+        rowStabilityDataFrame \
+            = pd.DataFrame \
+                (index = normalizedDataFrame.index,
+                 columns = pd.Index(kValueIntegerList, name = 'k'),
+                 dtype = np.float32)
+
+        for kValueInteger in kValueIntegerList:
+
+            referenceLabelsIntegerArray \
+                = crypto_sweep.ReturnFittedKMeansModelFunction \
+                    (normalizedDataFrame,
+                     kValueInteger,
+                     sampleWeightFloatArray = sampleWeightFloatArray) \
+                  .labels_
+
+            algorithmString \
+                = crypto_sweep.ReturnKMeansAlgorithmStringFunction \
+                    (len(normalizedDataFrame),
+                     normalizedDataFrame.shape[1],
+                     kValueInteger,
+                     crypto_constant.BOOTSTRAP_N_INIT_INTEGER,
+                     fullBatchFlagBoolean = True)
+
+            argumentTupleList \
+                = [(featureSourceObject,
+                    kValueInteger,
+                    resampleInteger,
+                    algorithmString,
+                    sampleWeightFloatArray)
+                   for resampleInteger in range(resamplesInteger)]
+
+            # The resamples' predictions are consumed as they finish, so only
+            # the running sums stay in memory.
+            if executorObject == None:
+
+                labelsIteratorObject \
+                    = (ReturnBootstrapLabelsFunction(*argumentTuple)
+                       for argumentTuple in argumentTupleList)
+
+            else:
+
+                labelsIteratorObject \
+                    = (futureObject.result()
+                       for futureObject \
+                           in as_completed \
+                                  ([executorObject \
+                                        .submit \
+                                            (ReturnBootstrapLabelsFunction,
+                                             *argumentTuple)
+                                    for argumentTuple in argumentTupleList]))
+
+            clusterSizeFloatArray \
+                = np.bincount \
+                    (referenceLabelsIntegerArray,
+                     minlength = kValueInteger) \
+                  .astype(np.float64)
+
+            # A full-data cluster of one row has no pairs.
+            rowMatesFloatArray \
+                = np.where \
+                    (clusterSizeFloatArray > 1,
+                     clusterSizeFloatArray - 1,
+                     np.nan) \
+                    [referenceLabelsIntegerArray]
+
+            pairCountFloat \
+                = float \
+                    ((clusterSizeFloatArray * (clusterSizeFloatArray - 1)).sum())
+
+            adjustedRandFloatList \
+                = []
+
+            coAssignedPairsFloat \
+                = 0.0
+
+            rowCoAssignmentFloatArray \
+                = np.zeros(len(normalizedDataFrame))
+
+            for labelsIntegerArray in labelsIteratorObject:
+
+                adjustedRandFloatList \
+                    .append \
+                        (adjusted_rand_score \
+                             (referenceLabelsIntegerArray,
+                              labelsIntegerArray))
+
+                cellIntegerArray \
+                    = referenceLabelsIntegerArray * kValueInteger \
+                      + labelsIntegerArray
+
+                contingencyFloatArray \
+                    = np.bincount \
+                        (cellIntegerArray,
+                         minlength = kValueInteger * kValueInteger) \
+                      .astype(np.float64)
+
+                coAssignedPairsFloat \
+                    += float \
+                           ((contingencyFloatArray \
+                             * (contingencyFloatArray - 1)).sum())
+
+                rowCoAssignmentFloatArray \
+                    += contingencyFloatArray[cellIntegerArray] - 1
+
+
+            # The resamples finish in any order, so the scores are sorted to
+            # give the same sums in the serial and parallel runs.
+            adjustedRandFloatArray \
+                = np.sort(adjustedRandFloatList)
+
+            rowStabilityDataFrame[kValueInteger] \
+                = (rowCoAssignmentFloatArray \
+                   / (rowMatesFloatArray * resamplesInteger)) \
+                  .astype(np.float32)
+
+            stabilityDictionaryList \
+                .append \
+                    ({'Mean ARI': np.mean(adjustedRandFloatArray),
+                      'Std ARI': np.std(adjustedRandFloatArray),
+                      'Mean Co-Assignment': \
+                          coAssignedPairsFloat \
+                          / (pairCountFloat * resamplesInteger) \
+                          if pairCountFloat > 0 \
+                          else np.nan})
+
+
+        return \
+            pd.DataFrame \
+                (stabilityDictionaryList,
+                 index = pd.Index(kValueIntegerList, name = 'k')), \
+            rowStabilityDataFrame
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnBootstrapStabilityTupleFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the bootstrap cluster stability.')
+
+        return \
+            None, None
+
+    finally:
+
+        crypto_shared_memory.ShutdownFeatureMatrixExecutor \
+            (executorObject,
+             sharedMemoryObject)
+
+
+# In[ ]:
+
+
+
+
@@ -0,0 +1,378 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# In[1]:
+
+
+#*******************************************************************************************
+ #
+ #  File Name:  CryptoClusteringConstants.py
+ #
+ #  File Description:
+ #      This Python script, CryptoClusteringConstants.py, contains the Python
+ #      constants and global variables for the k-means model selection and
+ #      clustering routines in CryptoClusteringFunctions.py and its engine and
+ #      pipeline scripts.
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     agent
+ #
+ #******************************************************************************************/
+
+from collections import OrderedDict
+
+
+# In[2]:
+
+
+CONSTANT_LOCAL_FILE_NAME \
+    = 'CryptoClusteringConstants.py'
+
+
+# In[3]:
+
+
+# These constants are the default k-means parameters for the k-sweep.  The
+# algorithm is 'lloyd', 'elkan', 'minibatch', 'bisecting', or 'auto', which
+# picks the backend with the lowest predicted time for every fit and calibrates
+# its cost model with a micro-benchmark of a few seconds on first use; the
+# models returned to the caller are always full-batch KMeans.
+K_VALUE_INTEGER_LIST \
+    = list(range(2, 11))
+
+N_INIT_INTEGER \
+    = 100
+
+RANDOM_STATE_INTEGER \
+    = 10
+
+ALGORITHM_STRING \
+    = 'lloyd'
+
+
+# These constants configure the 'auto' backend selection: the fewest rows for
+# the approximate 'minibatch' and 'bisecting' backends, the benchmark grid of
+# rows, features, and k values for the cost model calibration, the benchmark
+# repeats, and a preset cost model (None calibrates on first use), a Dictionary
+# of backend names and [intercept, log rows, log features, log k] coefficients.
+BACKEND_APPROXIMATE_MIN_ROWS_INTEGER \
+    = 100000
+
+BACKEND_BENCHMARK_ROWS_INTEGER_LIST \
+    = [2000, 50000]
+
+BACKEND_BENCHMARK_FEATURES_INTEGER_LIST \
+    = [2, 16]
+
+BACKEND_BENCHMARK_K_VALUE_INTEGER_LIST \
+    = [2, 16]
+
+BACKEND_BENCHMARK_REPEATS_INTEGER \
+    = 2
+
+BACKEND_COST_MODEL_DICTIONARY \
+    = None
+
+
+# This constant is the memory cap in bytes for the fitted model cache.
+MODEL_CACHE_MAX_BYTES_INTEGER \
+    = 256 * 1024 * 1024
+
+# This constant is the memory cap in bytes for the pipeline's stage cache.
+PIPELINE_STAGES_MAX_BYTES_INTEGER \
+    = 256 * 1024 * 1024
+
+
+# These constants configure the process pool for the k-sweep.  One worker runs
+# the sweep in this process, and a chunk size of None fits all of the restarts
+# for a k value in one task.
+SWEEP_MAX_WORKERS_INTEGER \
+    = 1
+
+N_INIT_CHUNK_INTEGER \
+    = None
+
+# Every sweep fit runs with this many native threads (None for no limit); the
+# multithreaded KMeans update sums per-thread results in arbitrary order, so
+# only a fixed thread count gives bit-identical serial and parallel results.
+SWEEP_THREADS_PER_FIT_INTEGER \
+    = 1
+
+# This constant is the data type of the shared feature matrix that the process
+# pool workers read; 'float32' halves its size but changes the fitted models.
+SHARED_MEMORY_DTYPE_STRING \
+    = 'float64'
+
+
+# These constants configure adaptive k-means restarts, which are off by
+# default: with a batch size, such as 10, the restarts run in batches of this
+# size and stop once the best inertia has not improved by more than the
+# relative tolerance for the patience number of batches; N_INIT_INTEGER is the
+# upper bound.  None runs all N_INIT_INTEGER restarts.
+ADAPTIVE_N_INIT_BATCH_INTEGER \
+    = None
+
+ADAPTIVE_N_INIT_PATIENCE_INTEGER \
+    = 2
+
+ADAPTIVE_N_INIT_TOLERANCE_FLOAT \
+    = 1e-4
+
+
+# These constants select the sweep mode: 'cold' fits every k value with all of
+# the restarts, and 'warm' seeds each k value from the previous solution plus
+# fresh restarts; fewer than about ten fresh restarts lose up to a fifth of
+# the fit quality at some k values on the market data.
+SWEEP_MODE_STRING \
+    = 'cold'
+
+WARM_START_RESTARTS_INTEGER \
+    = 10
+
+
+# These constants configure the mini-batch mode for out-of-core data: the rows
+# per chunk for array sources, the passes over the data for training, and the
+# size of the uniform row sample for silhouette scores.
+MINI_BATCH_CHUNK_ROWS_INTEGER \
+    = 10000
+
+MINI_BATCH_EPOCHS_INTEGER \
+    = 3
+
+MINI_BATCH_SAMPLE_ROWS_INTEGER \
+    = 10000
+
+
+# These constants configure the WCSS Elbow Method's Kneedle knee detection: the
+# sensitivity (larger values need a clearer knee) and, for the early stop, the
+# smallest ratio of the largest swept k value to the knee.
+KNEEDLE_SENSITIVITY_FLOAT \
+    = 1.0
+
+KNEEDLE_TAIL_RATIO_FLOAT \
+    = 3.0
+
+
+# These constants configure the early stop policy of the k-sweep: the method
+# whose optimum ends the sweep ('Wcss Elbow', 'Calinski Harabasz', 'Silhouette',
+# or 'Davies Bouldin'; None sweeps every k value) and the number of k values
+# after the optimum without improvement.  A wide k range such as
+# list(range(2, 201)) is practical only with an early stop method.
+EARLY_STOP_METHOD_STRING \
+    = None
+
+EARLY_STOP_PATIENCE_INTEGER \
+    = 3
+
+
+# These constants configure the pairwise distance matrix for the silhouette
+# scores: its data type ('float32' halves its size), its memory cap (larger
+# inputs score from the features), the working memory in MB for each row chunk,
+# and the number of matrices to cache (the original and the PCA input).
+DISTANCE_MATRIX_DTYPE_STRING \
+    = 'float64'
+
+DISTANCE_MATRIX_MAX_BYTES_INTEGER \
+    = 512*1024*1024
+
+DISTANCE_WORKING_MEMORY_MB_INTEGER \
+    = 64
+
+DISTANCE_CACHE_MAX_ENTRIES_INTEGER \
+    = 2
+
+
+# These constants configure the silhouette scores: the mode ('auto', 'exact',
+# 'sampled', or 'simplified'), the largest input for exact scores in the 'auto'
+# mode, the mode for larger inputs, and the stratified samples' size, repeats,
+# and confidence interval z value.
+SILHOUETTE_MODE_STRING \
+    = 'auto'
+
+SILHOUETTE_EXACT_MAX_ROWS_INTEGER \
+    = 20000
+
+SILHOUETTE_LARGE_INPUT_MODE_STRING \
+    = 'sampled'
+
+SILHOUETTE_SAMPLE_ROWS_INTEGER \
+    = 5000
+
+SILHOUETTE_SAMPLE_REPEATS_INTEGER \
+    = 5
+
+SILHOUETTE_CONFIDENCE_Z_FLOAT \
+    = 1.96
+
+
+# These constants configure the dimensionality reduction for the k-sweep: the
+# cumulative explained variance ratio for the component selection, the most
+# components to fit, the fewest features for the randomized SVD and its
+# oversamples and power iterations, and the fewest rows for IncrementalPCA.
+REDUCTION_VARIANCE_THRESHOLD_FLOAT \
+    = 0.9
+
+REDUCTION_MAX_COMPONENTS_INTEGER \
+    = 50
+
+REDUCTION_RANDOMIZED_MIN_FEATURES_INTEGER \
+    = 200
+
+REDUCTION_OVERSAMPLES_INTEGER \
+    = 10
+
+REDUCTION_POWER_ITERATIONS_INTEGER \
+    = 4
+
+REDUCTION_INCREMENTAL_MIN_ROWS_INTEGER \
+    = 100000
+
+
+# These constants select the clustering engine for the optimal k values and the
+# cluster predictions ('kmeans', 'ward', 'coreset', whose predictions refine the
+# coreset centers on every row, or 'minibatch', which trains over the row
+# chunks as the out-of-core sweep does) and the number of nearest neighbors in
+# the Ward engine's connectivity graph.
+CLUSTERING_ENGINE_STRING \
+    = 'kmeans'
+
+WARD_N_NEIGHBORS_INTEGER \
+    = 10
+
+
+# These constants configure the 'coreset' engine: the number of weighted rows
+# in the coreset and the method whose optimal k value gets the full-data check
+# and refinement.
+CORESET_ROWS_INTEGER \
+    = 2000
+
+CORESET_CHECK_METHOD_STRING \
+    = 'Silhouette'
+
+
+# These constants configure the outlier screen before the k-sweep: the scoring
+# method ('median' or 'kmeans'), the robust z value above which a row is an
+# outlier, the action for the outliers ('exclude', 'downweight', or 'none'), and
+# the 'kmeans' method's provisional k value, restarts, and smallest share of the
+# weight for a cluster whose centroid counts.
+OUTLIER_METHOD_STRING \
+    = 'median'
+
+OUTLIER_THRESHOLD_FLOAT \
+    = 3.5
+
+OUTLIER_ACTION_STRING \
+    = 'exclude'
+
+OUTLIER_PROVISIONAL_K_INTEGER \
+    = 3
+
+OUTLIER_N_INIT_INTEGER \
+    = 10
+
+OUTLIER_MIN_CLUSTER_SHARE_FLOAT \
+    = 0.05
+
+
+# These constants configure the gap statistic: the number of uniform reference
+# datasets and the k-means restarts for every reference fit.
+GAP_REFERENCES_INTEGER \
+    = 10
+
+GAP_N_INIT_INTEGER \
+    = 10
+
+
+# These constants configure the feature subset search: the column subset sizes
+# and the method whose score ranks the subsets.
+FEATURE_SUBSET_SIZES_INTEGER_LIST \
+    = [2, 3]
+
+FEATURE_SUBSET_RANK_METHOD_STRING \
+    = 'Silhouette'
+
+
+# These constants configure the bootstrap cluster stability analysis: the number
+# of resamples for every k value and the k-means restarts for every resample.
+BOOTSTRAP_RESAMPLES_INTEGER \
+    = 100
+
+BOOTSTRAP_N_INIT_INTEGER \
+    = 10
+
+
+# This constant is the number of snapshots in every rolling re-clustering window.
+ROLLING_WINDOW_SNAPSHOTS_INTEGER \
+    = 7
+
+
+# This constant is the pipeline's default number of principal components.
+PIPELINE_PCA_COMPONENTS_INTEGER \
+    = 3
+
+
+# This dictionary holds the k-sweep results keyed by the input content hash
+# and the sweep parameters.
+sweepResultsDictionary \
+    = {}
+
+
+# This ordered dictionary holds the fitted KMeans models, least recently used
+# first, keyed by the input content hash and the model parameters.
+fittedModelsOrderedDictionary \
+    = OrderedDict()
+
+fittedModelsCacheBytesInteger \
+    = 0
+
+
+# This ordered dictionary holds the pairwise distance matrices, least recently
+# used first, keyed by the input content hash and the data type.
+distanceMatricesOrderedDictionary \
+    = OrderedDict()
+
+
+# This dictionary holds the Ward linkage matrices keyed by the input content
+# hash and the number of nearest neighbors.
+wardLinkageMatricesDictionary \
+    = {}
+
+
+# This dictionary holds the gap statistic's reference log inertias keyed by the
+# input content hash and the reference parameters.
+gapReferenceDictionary \
+    = {}
+
+
+# This ordered dictionary holds the pipeline's fitted scalers and PCAs and their
+# output DataFrames, least recently used first, keyed by the stage name, the
+# stage input content hash, and the stage parameters.
+pipelineStagesOrderedDictionary \
+    = OrderedDict()
+
+pipelineStagesCacheBytesInteger \
+    = 0
+
+
+# These dictionaries hold the calibrated backend cost model and the backend
+# decisions keyed by the rows, features, k value, restarts, and full-batch flag.
+backendCostModelDictionary \
+    = None
+
+backendDecisionsDictionary \
+    = {}
+
+
+# This dictionary holds, in a worker process, the attached shared feature
+# matrices and their DataFrame views keyed by shared memory name.
+attachedFeatureMatrixDictionary \
+    = {}
+
+
+# In[ ]:
+
+
+
+
@@ -0,0 +1,654 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# In[1]:
+
+
+#*******************************************************************************************
+ #
+ #  File Name:  CryptoClusteringCoreset.py
+ #
+ #  File Description:
+ #      This Python script, CryptoClusteringCoreset.py, contains the Python
+ #      functions of the weighted-coreset engine, which selects k on a coreset
+ #      and checks the choice with full-data models.  Here is the list:
+ #
+ #      ReturnCoresetTupleFunction
+ #      ReturnCoresetKMeansModelFunction
+ #      ReturnRefinedCoresetKMeansModelFunction
+ #      ReturnCoresetSweepDictionaryFunction
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     agent
+ #
+ #******************************************************************************************/
+
+import CryptoClusteringConstants as crypto_constant
+import CryptoClusteringSweep as crypto_sweep
+import PyLogSubRoutines as log_subroutine
+
+import numpy as np
+import pandas as pd
+
+from sklearn.cluster import KMeans
+from sklearn.metrics import pairwise_distances_argmin_min
+from threadpoolctl import threadpool_limits
+
+
+# In[2]:
+
+
+CONSTANT_LOCAL_FILE_NAME \
+    = 'CryptoClusteringCoreset.py'
+
+
+# In[3]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnCoresetTupleFunction
+ #
+ #  Function Description:
+ #      This function returns a lightweight coreset of a feature matrix and its
+ #      sample weights.  Every row is drawn with a probability that mixes the
+ #      uniform probability with its share of the squared distances to the
+ #      mean, and its weight is the inverse of its expected draws, so weighted
+ #      sums over the coreset estimate sums over every row.  An input with no
+ #      more rows than the coreset size is its own coreset with unit weights.
+ #      With sample weights, both shares and the coreset weights scale with the
+ #      row weights, so the weighted sums estimate the weighted sums over every
+ #      row.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  NumPy Array
+ #          featureFloatArray
+ #                          The parameter is the feature matrix.
+ #  Integer
+ #          coresetRowsInteger
+ #                          The parameter is the number of coreset rows.
+ #  NumPy Array
+ #          sampleWeightFloatArray
+ #                          The parameter is the weight of every row or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnCoresetTupleFunction \
+        (featureFloatArray,
+         coresetRowsInteger \
+            = None,
+         sampleWeightFloatArray \
+            = None):
+
+    try:
+
+        if coresetRowsInteger == None:
+
+            coresetRowsInteger \
+                = crypto_constant.CORESET_ROWS_INTEGER
+
+
+        rowCountInteger \
+            = len(featureFloatArray)
+
+        if rowCountInteger <= coresetRowsInteger:
+
+            return \
+                featureFloatArray, \
+                np.ones(rowCountInteger) \
+                if sampleWeightFloatArray is None \
+                else sampleWeightFloatArray
+
+
+        squaredDistanceFloatArray \
+            = ((featureFloatArray \
+                - np.average \
+                      (featureFloatArray,
+                       axis = 0,
+                       weights = sampleWeightFloatArray)) ** 2) \
+              .sum(axis = 1)
+
+        if sampleWeightFloatArray is None:
+
+            sampleWeightFloatArray \
+                = np.ones(rowCountInteger)
+
+            uniformProbabilityFloatArray \
+                = 1.0 / rowCountInteger
+
+        else:
+
+            squaredDistanceFloatArray \
+                = sampleWeightFloatArray * squaredDistanceFloatArray
+
+            uniformProbabilityFloatArray \
+                = sampleWeightFloatArray / sampleWeightFloatArray.sum()
+
+        probabilityFloatArray \
+            = 0.5 * uniformProbabilityFloatArray \
+              + 0.5 * squaredDistanceFloatArray / squaredDistanceFloatArray.sum()
+
+        indexIntegerArray \
+            = np.random.default_rng \
+                (crypto_constant.RANDOM_STATE_INTEGER) \
+              .choice \
+                  (rowCountInteger,
+                   coresetRowsInteger,
+                   p = probabilityFloatArray)
+
+
+        return \
+            featureFloatArray[indexIntegerArray], \
+            sampleWeightFloatArray[indexIntegerArray] \
+            / (coresetRowsInteger * probabilityFloatArray[indexIntegerArray])
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnCoresetTupleFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a coreset.')
+
+        return \
+            None, None
+
+
+# In[4]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnCoresetKMeansModelFunction
+ #
+ #  Function Description:
+ #      This function fits the restarts for one k value on a weighted coreset
+ #      with full-batch KMeans, which the coreset weights need, and returns the
+ #      model.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  NumPy Array
+ #          coresetFloatArray
+ #                          The parameter is the coreset feature matrix.
+ #  NumPy Array
+ #          weightFloatArray
+ #                          The parameter is the coreset weights.
+ #  Integer
+ #          kValueInteger
+ #                          The parameter is the number of clusters.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnCoresetKMeansModelFunction \
+        (coresetFloatArray,
+         weightFloatArray,
+         kValueInteger):
+
+    try:
+
+        with threadpool_limits \
+                (limits = crypto_constant.SWEEP_THREADS_PER_FIT_INTEGER):
+
+            return \
+                KMeans \
+                    (n_clusters = kValueInteger,
+                     n_init = crypto_constant.N_INIT_INTEGER,
+                     random_state = crypto_constant.RANDOM_STATE_INTEGER,
+                     algorithm \
+                         = crypto_sweep.ReturnKMeansAlgorithmStringFunction \
+                               (coresetFloatArray.shape[0],
+                                coresetFloatArray.shape[1],
+                                kValueInteger,
+                                crypto_constant.N_INIT_INTEGER,
+                                fullBatchFlagBoolean = True)) \
+                  .fit \
+                      (coresetFloatArray,
+                       sample_weight = weightFloatArray)
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnCoresetKMeansModelFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to fit a coreset KMeans model.')
+
+        return \
+            None
+
+
+# In[5]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnRefinedCoresetKMeansModelFunction
+ #
+ #  Function Description:
+ #      This function returns the coreset engine's full-data model for one k
+ #      value: one Lloyd run on every row that starts from the coreset model's
+ #      centers.  Without centers, the function draws the coreset and fits it
+ #      as the coreset sweep does, so every k value, swept or not, warm-starts
+ #      from the same centers.  The models are cached with the fitted models
+ #      by the content of the input, the k value, the coreset parameters, and
+ #      the sample weights, so the predictions of the coreset sweep's check k
+ #      value reuse its refined model.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          normalizedDataFrame
+ #                          The parameter is the normalized input DataFrame.
+ #  Integer
+ #          kValueInteger
+ #                          The parameter is the number of clusters.
+ #  NumPy Array
+ #          sampleWeightFloatArray
+ #                          The parameter is the weight of every row or None.
+ #  NumPy Array
+ #          centersFloatArray
+ #                          The parameter is the coreset model's centers or
+ #                          None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnRefinedCoresetKMeansModelFunction \
+        (normalizedDataFrame,
+         kValueInteger,
+         sampleWeightFloatArray \
+            = None,
+         centersFloatArray \
+            = None):
+
+    try:
+
+        modelKeyTuple \
+            = ('coreset',
+               crypto_sweep.ReturnDataFrameContentHashStringFunction \
+                   (normalizedDataFrame),
+               int(kValueInteger),
+               crypto_constant.CORESET_ROWS_INTEGER,
+               crypto_constant.N_INIT_INTEGER,
+               crypto_constant.RANDOM_STATE_INTEGER,
+               crypto_constant.ALGORITHM_STRING,
+               crypto_sweep.ReturnSampleWeightHashStringFunction \
+                   (sampleWeightFloatArray))
+
+        if modelKeyTuple in crypto_constant.fittedModelsOrderedDictionary:
+
+            crypto_constant \
+                .fittedModelsOrderedDictionary \
+                    .move_to_end \
+                        (modelKeyTuple)
+
+            return \
+                crypto_constant \
+                    .fittedModelsOrderedDictionary \
+                        [modelKeyTuple]
+
+
+        if centersFloatArray is None:
+
+            coresetFloatArray, weightFloatArray \
+                = ReturnCoresetTupleFunction \
+                    (np.ascontiguousarray \
+                         (normalizedDataFrame \
+                              .to_numpy \
+                                  (dtype = np.float64)),
+                     sampleWeightFloatArray = sampleWeightFloatArray)
+
+            centersFloatArray \
+                = ReturnCoresetKMeansModelFunction \
+                    (coresetFloatArray,
+                     weightFloatArray,
+                     kValueInteger) \
+                  .cluster_centers_
+
+        with threadpool_limits \
+                (limits = crypto_constant.SWEEP_THREADS_PER_FIT_INTEGER):
+
+            refinedKMeansObject \
+                = KMeans \
+                    (n_clusters = kValueInteger,
+                     init = centersFloatArray,
+                     n_init = 1,
+                     algorithm \
+                         = crypto_sweep.ReturnKMeansAlgorithmStringFunction \
+                               (normalizedDataFrame.shape[0],
+                                normalizedDataFrame.shape[1],
+                                kValueInteger,
+                                1,
+                                fullBatchFlagBoolean = True)) \
+                  .fit \
+                      (normalizedDataFrame,
+                       sample_weight = sampleWeightFloatArray)
+
+
+        return \
+            crypto_sweep.ReturnCachedKMeansModelFunction \
+                (modelKeyTuple,
+                 refinedKMeansObject)
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnRefinedCoresetKMeansModelFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a refined coreset KMeans model.')
+
+        return \
+            None
+
+
+# In[6]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnCoresetSweepDictionaryFunction
+ #
+ #  Function Description:
+ #      This function is the coreset counterpart of
+ #      ReturnKMeansSweepDictionaryFunction and returns a Dictionary with the same
+ #      layout.  It runs the restarts for every k value on a weighted coreset
+ #      instead of every row and scores the fits with weighted inertia,
+ #      Calinski-Harabasz, Davies-Bouldin, and silhouette scores, in which a
+ #      coreset row with weight w counts as w rows.
+ #
+ #      At the optimal k value of the check method, the function assigns every
+ #      row to the coreset centers to measure the full-data inertia, refines the
+ #      centers with one Lloyd run on the full data, and stores the result in a
+ #      'Coreset Check' Dictionary: the k value, the coreset and full-data
+ #      inertia, their relative deviation, and the refined KMeans model, which
+ #      the coreset engine's predictions reuse.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          normalizedDataFrame
+ #                          The parameter is the normalized input DataFrame.
+ #  List
+ #          kValueIntegerList
+ #                          The parameter is a List of k values.
+ #  String
+ #          checkMethodString
+ #                          The parameter is the method whose optimal k value
+ #                          gets the full-data check.
+ #  NumPy Array
+ #          sampleWeightFloatArray
+ #                          The parameter is the weight of every row or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Caches the refined model                    agent
+ #  10/18/2026          Weights the silhouette scores              agent
+ #
+ #******************************************************************************************/
+
+def ReturnCoresetSweepDictionaryFunction \
+        (normalizedDataFrame,
+         kValueIntegerList \
+            = None,
+         checkMethodString \
+            = None,
+         sampleWeightFloatArray \
+            = None):
+
+    try:
+
+        if kValueIntegerList == None:
+
+            kValueIntegerList \
+                = crypto_constant.K_VALUE_INTEGER_LIST
+
+        if checkMethodString == None:
+
+            checkMethodString \
+                = crypto_constant.CORESET_CHECK_METHOD_STRING
+
+
+        kValueNumbersIntegerList \
+            = [int(kValueInteger) for kValueInteger in kValueIntegerList]
+
+        sweepKeyTuple \
+            = ('coreset',
+               crypto_sweep.ReturnDataFrameContentHashStringFunction \
+                   (normalizedDataFrame),
+               tuple(kValueNumbersIntegerList),
+               crypto_constant.CORESET_ROWS_INTEGER,
+               crypto_constant.N_INIT_INTEGER,
+               crypto_constant.RANDOM_STATE_INTEGER,
+               crypto_constant.ALGORITHM_STRING,
+               checkMethodString,
+               crypto_sweep.ReturnSampleWeightHashStringFunction \
+                   (sampleWeightFloatArray))
+
+        if sweepKeyTuple in crypto_constant.sweepResultsDictionary:
+
+            return \
+                crypto_constant \
+                    .sweepResultsDictionary \
+                        [sweepKeyTuple]
+
+
+        featureFloatArray \
+            = np.ascontiguousarray \
+                (normalizedDataFrame \
+                     .to_numpy \
+                         (dtype = np.float64))
+
+        coresetFloatArray, weightFloatArray \
+            = ReturnCoresetTupleFunction \
+                (featureFloatArray,
+                 sampleWeightFloatArray = sampleWeightFloatArray)
+
+        weightSumFloat \
+            = weightFloatArray.sum()
+
+        totalSumOfSquaresFloat \
+            = np.dot \
+                (weightFloatArray,
+                 ((coresetFloatArray \
+                   - np.average \
+                         (coresetFloatArray,
+                          axis = 0,
+                          weights = weightFloatArray)) ** 2) \
+                 .sum(axis = 1))
+
+        # The silhouette scores of every k value read one distance matrix of the
+        # coreset, if it fits within the memory cap.
+        distanceFloatArray \
+            = crypto_sweep.ReturnPairwiseDistanceMatrixFunction \
+                (pd.DataFrame \
+                     (coresetFloatArray,
+                      copy = False),
+                 'float64',
+                 cacheFlagBoolean = False)
+
+        modelKMeansObjectList \
+            = []
+
+        calinskiHarabaszFloatList \
+            = []
+
+        silhouetteFloatList \
+            = []
+
+        daviesBouldinFloatList \
+            = []
+
+        with threadpool_limits \
+                (limits = crypto_constant.SWEEP_THREADS_PER_FIT_INTEGER):
+
+            for kValueNumberInteger in kValueNumbersIntegerList:
+
+                modelKMeansObject \
+                    = ReturnCoresetKMeansModelFunction \
+                        (coresetFloatArray,
+                         weightFloatArray,
+                         kValueNumberInteger)
+
+                modelKMeansObjectList \
+                    .append \
+                        (modelKMeansObject)
+
+                # The weighted inertia estimates the within-cluster dispersion of
+                # every row, as the weight sum estimates the row count.
+                inertiaFloat \
+                    = modelKMeansObject.inertia_
+
+                calinskiHarabaszFloatList \
+                    .append \
+                        (((totalSumOfSquaresFloat - inertiaFloat) \
+                          / (kValueNumberInteger - 1)) \
+                         / (inertiaFloat / (weightSumFloat - kValueNumberInteger)))
+
+                ownDistanceFloatArray \
+                    = np.sqrt \
+                        (((coresetFloatArray \
+                           - modelKMeansObject.cluster_centers_ \
+                                 [modelKMeansObject.labels_]) ** 2) \
+                         .sum(axis = 1))
+
+                daviesBouldinFloatList \
+                    .append \
+                        (crypto_sweep.ReturnDaviesBouldinFloatFunction \
+                             (np.bincount \
+                                  (modelKMeansObject.labels_,
+                                   weights = weightFloatArray * ownDistanceFloatArray,
+                                   minlength = kValueNumberInteger) \
+                              / np.maximum \
+                                  (np.bincount \
+                                       (modelKMeansObject.labels_,
+                                        weights = weightFloatArray,
+                                        minlength = kValueNumberInteger),
+                                   np.finfo(np.float64).tiny),
+                              modelKMeansObject.cluster_centers_))
+
+                # A coreset row with weight w counts as w rows, as it does in the
+                # fits.
+                silhouetteFloatList \
+                    .append \
+                        (crypto_sweep.ReturnWeightedSilhouetteFloatFunction \
+                             (coresetFloatArray,
+                              modelKMeansObject.labels_,
+                              weightFloatArray,
+                              distanceFloatArray))
+
+
+        sweepDictionary \
+            = crypto_sweep.ReturnSweepDictionaryFromScoresFunction \
+                (kValueNumbersIntegerList,
+                 [modelKMeansObject.inertia_ \
+                  for modelKMeansObject in modelKMeansObjectList],
+                 calinskiHarabaszFloatList,
+                 silhouetteFloatList,
+                 daviesBouldinFloatList,
+                 [modelKMeansObject.n_iter_ \
+                  for modelKMeansObject in modelKMeansObjectList])
+
+
+        # These lines of code check the coreset inertia on every row at the
+        # optimal k value and refine its centers on the full data.
+        checkKValueInteger \
+            = int(sweepDictionary[checkMethodString][0])
+
+        coresetKMeansObject \
+            = modelKMeansObjectList \
+                [kValueNumbersIntegerList.index(checkKValueInteger)]
+
+        fullDistanceFloatArray \
+            = pairwise_distances_argmin_min \
+                (featureFloatArray,
+                 coresetKMeansObject.cluster_centers_)[1]
+
+        fullInertiaFloat \
+            = float \
+                (np.dot \
+                     (fullDistanceFloatArray \
+                      if sampleWeightFloatArray is None \
+                      else sampleWeightFloatArray * fullDistanceFloatArray,
+                      fullDistanceFloatArray))
+
+        refinedKMeansObject \
+            = ReturnRefinedCoresetKMeansModelFunction \
+                (normalizedDataFrame,
+                 checkKValueInteger,
+                 sampleWeightFloatArray,
+                 coresetKMeansObject.cluster_centers_)
+
+
+        sweepDictionary['Coreset Check'] \
+            = {'k': checkKValueInteger,
+               'coreset inertia': float(coresetKMeansObject.inertia_),
+               'full inertia': fullInertiaFloat,
+               'relative deviation': \
+                   (float(coresetKMeansObject.inertia_) - fullInertiaFloat) \
+                   / fullInertiaFloat,
+               'model': refinedKMeansObject}
+
+        log_subroutine \
+            .PrintAndDebugWriteText \
+                (f'The coreset inertia at k = {checkKValueInteger} deviates '
+                 + f'{sweepDictionary["Coreset Check"]["relative deviation"]:.2%} '
+                 + f'from the full-data inertia.')
+
+        crypto_constant \
+            .sweepResultsDictionary \
+                [sweepKeyTuple] \
+            = sweepDictionary
+
+
+        return sweepDictionary
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnCoresetSweepDictionaryFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the coreset k-sweep results.')
+
+        return \
+            None
+
+
+# In[ ]:
+
+
+
+
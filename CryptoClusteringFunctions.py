@@ -13,10 +13,15 @@
  #      Python functions for completing common tasks in the CryptoClustering
  #      Challenge.  Here is the list:
  #
+ #      ReturnOutlierScreenTupleFunction
+ #      ReturnSweepDictionaryFunction
+ #
  #      ReturnOptimalKWithWCSSElbowFunction
  #      ReturnOptimalKWithCalinskiHarabaszFunction
  #      ReturnOptimalKWithSilhouetteFunction
  #      ReturnOptimalKWithDaviesBouldinFunction
+ #      ReturnOptimalKWithGapStatisticFunction
+ #      ReturnFeatureSubsetRankingDataFrameFunction
  #
  #      ReturnSubplotTraceListFunction
  #      ReturnHeightWidthRowsColumnsFunction
@@ -24,6 +29,8 @@
  #      ReturnMaxRowAndColumnFunction
  #      
  #      ReturnClusterPredictionsFunction
+ #      ReturnClusterDiagnosticsDataFrameFunction
+ #      ReturnRollingClusterMembershipTupleFunction
  #      ReturnKClustersScatterPlotFunction
  #      ReturnKClusters3DScatterPlotFunction
  #      
@@ -31,24 +38,88 @@
  #  Date            Description                             Programmer
  #  ----------      ------------------------------------    ------------------
  #  11/21/2023      Initial Development                     N. James George
+ #  10/18/2026      Added ReturnDataFrameContentHashStringFunction,
+ #                        ReturnOptimalKFromWCSSElbowSeriesFunction,
+ #                        ReturnKMeansSweepDictionaryFunction
+ #                                                          agent
+ #  10/18/2026      Added ReturnFittedKMeansModelFunction, a shared cache
+ #                  of fitted models for the sweep, predictions, and plots
+ #                                                          agent
+ #  10/18/2026      Added a process pool mode with restart chunks to
+ #                  ReturnKMeansSweepDictionaryFunction
+ #                                                          agent
+ #  10/18/2026      Added a shared memory feature matrix for the process
+ #                  pool workers                            agent
+ #  10/18/2026      Added a mini-batch mode for out-of-core data sources
+ #                                                          agent
+ #  10/18/2026      Added a warm-started sweep mode         agent
+ #  10/18/2026      Added a configurable k value range and an early
+ #                  stop policy to the k-sweep              agent
+ #  10/18/2026      Added a cached pairwise distance matrix for the
+ #                  silhouette scores                       agent
+ #  10/18/2026      Added the sampled and simplified silhouette
+ #                  modes                                   agent
+ #  10/18/2026      Davies-Bouldin scores come from the sweep's centers
+ #                  and labels and select the minimum       agent
+ #  10/18/2026      Added a Ward hierarchy engine for the optimal k
+ #                  values and the cluster predictions      agent
+ #  10/18/2026      Added a coreset engine for the optimal k values
+ #                                                          agent
+ #  10/18/2026      Added adaptive k-means restarts         agent
+ #  10/18/2026      Added automatic k-means backend selection from a
+ #                  calibrated cost model                   agent
+ #  10/18/2026      Added CryptoClusteringPipeline, a scale, PCA, and
+ #                  cluster pipeline with cached stages     agent
+ #  10/18/2026      Added randomized SVD and IncrementalPCA reductions
+ #                  for wide and tall sources               agent
+ #  10/18/2026      Added CryptoClusteringPipeline.SaveClusterModel for
+ #                  the CryptoClusteringAssignment service  agent
+ #  10/18/2026      Added ReturnRollingClusterMembershipTupleFunction
+ #                                                          agent
+ #  10/18/2026      Added the bootstrap cluster stability analysis
+ #                                                          agent
+ #  10/18/2026      Added ReturnOptimalKWithGapStatisticFunction
+ #                                                          agent
+ #  10/18/2026      The WCSS Elbow Method finds the knee with the
+ #                  vectorized Kneedle method               agent
+ #  10/18/2026      Added the feature subset search         agent
+ #  10/18/2026      Added sample weights to the k-means sweep, fits,
+ #                  and plots and the duplicate row collapse
+ #                                                          agent
+ #  10/18/2026      Added ReturnClusterDiagnosticsDataFrameFunction
+ #                                                          agent
+ #  10/18/2026      Added an outlier screen before the k-sweep
+ #                                                          agent
+ #  10/18/2026      Moved the k-means engines and the pipeline
+ #                  to their own modules                    agent
  #
  #******************************************************************************************/
 
+import CryptoClusteringConstants as crypto_constant
+import CryptoClusteringCoreset as crypto_coreset
+import CryptoClusteringSharedMemory as crypto_shared_memory
+import CryptoClusteringSweep as crypto_sweep
+import CryptoClusteringWard as crypto_ward
 import PyConstants as constant
 import PyLogSubRoutines as log_subroutine
 
+import itertools
 import hvplot.pandas
 import math
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
+from concurrent.futures import ProcessPoolExecutor
 from plotly.subplots import make_subplots
+from scipy.optimize import linear_sum_assignment
 from sklearn.cluster import KMeans
 from sklearn.decomposition import PCA
 from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import calinski_harabasz_score 
 from sklearn.metrics import davies_bouldin_score
+from sklearn.metrics import pairwise_distances_argmin_min
 from sklearn.metrics import silhouette_score 
 
 
@@ -62,6 +133,405 @@ CONSTANT_LOCAL_FILE_NAME \
 # In[3]:
 
 
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnOutlierScreenTupleFunction
+ #
+ #  Function Description:
+ #      This function screens the rows for outliers before the k-sweep, so
+ #      that single extreme rows do not take a k value of their own.  Every row
+ #      scores the robust z value of its distance to a center: the
+ #      coordinate-wise median ('median') or the nearest centroid of a
+ #      provisional k-means fit whose clusters hold at least the minimum share
+ #      of the weight ('kmeans'), so a row that the fit isolates still scores
+ #      its distance to the bulk of the data.  The z value is the distance less
+ #      the median distance over 1.4826 times the median absolute deviation.
+ #
+ #      The rows above the threshold are the outliers.  The 'exclude' action
+ #      drops them, the 'downweight' action scales their weights by the ratio
+ #      of the threshold to their scores, and the 'none' action only scores
+ #      them.  The function returns the DataFrame and the sample weight Series
+ #      (None for unweighted rows) for the sweep and a screen Dictionary with
+ #      the method, action, threshold, scores, outliers' index, and fit
+ #      weights; ReturnClusterPredictionsFunction reads the Dictionary to fit
+ #      without the excluded rows and assign them with the fitted model's
+ #      predictions.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          normalizedDataFrame
+ #                          The parameter is the normalized input DataFrame.
+ #  String
+ #          methodString
+ #                          The parameter is the scoring method ('median' or
+ #                          'kmeans').
+ #  Float
+ #          thresholdFloat
+ #                          The parameter is the robust z value above which a
+ #                          row is an outlier.
+ #  String
+ #          actionString
+ #                          The parameter is the action for the outliers
+ #                          ('exclude', 'downweight', or 'none').
+ #  Series
+ #          sampleWeightSeries
+ #                          The parameter is the weight of every row or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnOutlierScreenTupleFunction \
+        (normalizedDataFrame,
+         methodString \
+            = None,
+         thresholdFloat \
+            = None,
+         actionString \
+            = None,
+         sampleWeightSeries \
+            = None):
+
+    try:
+
+        if methodString == None:
+
+            methodString \
+                = crypto_constant.OUTLIER_METHOD_STRING
+
+        if thresholdFloat == None:
+
+            thresholdFloat \
+                = crypto_constant.OUTLIER_THRESHOLD_FLOAT
+
+        if actionString == None:
+
+            actionString \
+                = crypto_constant.OUTLIER_ACTION_STRING
+
+
+        featureFloatArray \
+            = normalizedDataFrame \
+                .to_numpy \
+                    (dtype = np.float64)
+
+        sampleWeightFloatArray \
+            = crypto_sweep.ReturnSampleWeightFloatArrayFunction \
+                (normalizedDataFrame,
+                 sampleWeightSeries)
+
+        rowWeightFloatArray \
+            = np.ones(len(featureFloatArray)) \
+              if sampleWeightFloatArray is None \
+              else sampleWeightFloatArray
+
+        if methodString == 'kmeans':
+
+            kValueInteger \
+                = min(crypto_constant.OUTLIER_PROVISIONAL_K_INTEGER,
+                      len(featureFloatArray))
+
+            provisionalKMeansObject \
+                = crypto_sweep.ReturnKMeansRestartsModelFunction \
+                    (normalizedDataFrame,
+                     kValueInteger,
+                     crypto_constant.OUTLIER_N_INIT_INTEGER,
+                     crypto_constant.RANDOM_STATE_INTEGER,
+                     crypto_sweep.ReturnKMeansAlgorithmStringFunction \
+                         (featureFloatArray.shape[0],
+                          featureFloatArray.shape[1],
+                          kValueInteger,
+                          crypto_constant.OUTLIER_N_INIT_INTEGER),
+                     crypto_constant.SWEEP_THREADS_PER_FIT_INTEGER,
+                     sampleWeightFloatArray)
+
+            clusterShareFloatArray \
+                = np.bincount \
+                    (provisionalKMeansObject.labels_,
+                     weights = rowWeightFloatArray,
+                     minlength = kValueInteger) \
+                  / rowWeightFloatArray.sum()
+
+            # Without a cluster of the minimum share, every centroid counts.
+            centersFloatArray \
+                = provisionalKMeansObject.cluster_centers_ \
+                    [clusterShareFloatArray \
+                         >= crypto_constant.OUTLIER_MIN_CLUSTER_SHARE_FLOAT] \
+                  if clusterShareFloatArray.max() \
+                         >= crypto_constant.OUTLIER_MIN_CLUSTER_SHARE_FLOAT \
+                  else provisionalKMeansObject.cluster_centers_
+
+        else:
+
+            centersFloatArray \
+                = np.median \
+                    (featureFloatArray,
+                     axis = 0)[np.newaxis, :]
+
+
+        distanceFloatArray \
+            = pairwise_distances_argmin_min \
+                (featureFloatArray,
+                 centersFloatArray)[1]
+
+        medianDistanceFloat \
+            = np.median(distanceFloatArray)
+
+        # The mean absolute deviation scales the scores when more than half of
+        # the distances are equal.
+        scaleFloat \
+            = 1.4826 \
+              * np.median \
+                    (np.abs(distanceFloatArray - medianDistanceFloat))
+
+        if scaleFloat == 0:
+
+            scaleFloat \
+                = 1.2533 \
+                  * np.mean \
+                        (np.abs(distanceFloatArray - medianDistanceFloat))
+
+        scoreFloatArray \
+            = (distanceFloatArray - medianDistanceFloat) \
+              / scaleFloat \
+              if scaleFloat > 0 \
+              else np.zeros(len(distanceFloatArray))
+
+        outlierBooleanArray \
+            = scoreFloatArray > thresholdFloat
+
+        log_subroutine \
+            .PrintAndDebugWriteText \
+                (f'The outlier screen found {int(outlierBooleanArray.sum())} '
+                 + f'of {len(outlierBooleanArray)} rows above a robust z value '
+                 + f'of {thresholdFloat}.')
+
+
+        if actionString == 'downweight':
+
+            rowWeightFloatArray \
+                = rowWeightFloatArray \
+                  * np.minimum \
+                        (1.0,
+                         thresholdFloat \
+                         / np.maximum \
+                               (scoreFloatArray,
+                                np.finfo(np.float64).tiny))
+
+            sampleWeightFloatArray \
+                = rowWeightFloatArray
+
+        elif actionString == 'exclude' \
+            and sampleWeightFloatArray is not None:
+
+            sampleWeightFloatArray \
+                = sampleWeightFloatArray[~outlierBooleanArray]
+
+        screenedDataFrame \
+            = normalizedDataFrame[~outlierBooleanArray] \
+              if actionString == 'exclude' \
+              else normalizedDataFrame
+
+        screenedWeightSeries \
+            = None \
+              if sampleWeightFloatArray is None \
+              else pd.Series \
+                       (sampleWeightFloatArray,
+                        index = screenedDataFrame.index,
+                        name = 'Weight')
+
+
+        return \
+            screenedDataFrame, \
+            screenedWeightSeries, \
+            {'method': methodString,
+             'action': actionString,
+             'threshold': thresholdFloat,
+             'scores': \
+                 pd.Series \
+                     (scoreFloatArray,
+                      index = normalizedDataFrame.index,
+                      name = 'Outlier Score'),
+             'outliers': normalizedDataFrame.index[outlierBooleanArray],
+             'weights': screenedWeightSeries}
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnOutlierScreenTupleFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to screen the rows for outliers.')
+
+        return \
+            None, None, None
+
+
+# In[4]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnSweepDictionaryFunction
+ #
+ #  Function Description:
+ #      This function returns the k-sweep results of the selected clustering
+ #      engine: 'kmeans' fits k-means models, 'ward' cuts one Ward hierarchy,
+ #      'coreset' fits k-means models on a weighted coreset, and 'minibatch'
+ #      trains mini-batch k-means models over the row chunks of the input, as
+ #      the out-of-core sweep does for a file or memory-mapped source, and
+ #      caches the results by the input content hash.  The 'kmeans' and
+ #      'coreset' engines weight the rows by the sample weights, which the
+ #      Ward hierarchy and the mini-batch training do not support and ignore.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          normalizedDataFrame
+ #                          The parameter is the normalized input DataFrame.
+ #  List
+ #          kValueIntegerList
+ #                          The parameter is a List of k values.
+ #  String
+ #          silhouetteModeString
+ #                          The parameter is the silhouette mode.
+ #  String
+ #          engineString
+ #                          The parameter is the clustering engine ('kmeans',
+ #                          'ward', 'coreset', or 'minibatch').
+ #  Series
+ #          sampleWeightSeries
+ #                          The parameter is the weight of every row or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Added the mini-batch engine                 agent
+ #
+ #******************************************************************************************/
+
+def ReturnSweepDictionaryFunction \
+        (normalizedDataFrame,
+         kValueIntegerList \
+            = None,
+         silhouetteModeString \
+            = None,
+         engineString \
+            = None,
+         sampleWeightSeries \
+            = None):
+
+    try:
+
+        if engineString == None:
+
+            engineString \
+                = crypto_constant.CLUSTERING_ENGINE_STRING
+
+
+        sampleWeightFloatArray \
+            = crypto_sweep.ReturnSampleWeightFloatArrayFunction \
+                (normalizedDataFrame,
+                 sampleWeightSeries)
+
+
+        if engineString in ['ward', 'minibatch'] \
+            and sampleWeightFloatArray is not None:
+
+            log_subroutine \
+                .PrintAndLogWriteText \
+                    (f'The function, ReturnSweepDictionaryFunction, '
+                     + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                     + f'ignores the sample weights in the {engineString} engine.')
+
+
+        if engineString == 'ward':
+
+            return \
+                crypto_ward.ReturnWardSweepDictionaryFunction \
+                    (normalizedDataFrame,
+                     kValueIntegerList = kValueIntegerList,
+                     silhouetteModeString = silhouetteModeString)
+
+        elif engineString == 'coreset':
+
+            return \
+                crypto_coreset.ReturnCoresetSweepDictionaryFunction \
+                    (normalizedDataFrame,
+                     kValueIntegerList = kValueIntegerList,
+                     sampleWeightFloatArray = sampleWeightFloatArray)
+
+        elif engineString == 'minibatch':
+
+            if kValueIntegerList == None:
+
+                kValueIntegerList \
+                    = crypto_constant.K_VALUE_INTEGER_LIST
+
+            sweepKeyTuple \
+                = ('minibatch',
+                   crypto_sweep.ReturnDataFrameContentHashStringFunction \
+                       (normalizedDataFrame),
+                   tuple(int(kValueInteger) for kValueInteger in kValueIntegerList),
+                   crypto_constant.MINI_BATCH_CHUNK_ROWS_INTEGER,
+                   crypto_constant.MINI_BATCH_EPOCHS_INTEGER,
+                   crypto_constant.MINI_BATCH_SAMPLE_ROWS_INTEGER,
+                   crypto_constant.RANDOM_STATE_INTEGER)
+
+            if sweepKeyTuple not in crypto_constant.sweepResultsDictionary:
+
+                # The in-memory input is an array row source, so the engine
+                # trains exactly as the out-of-core sweep of a memory-mapped
+                # copy of it would.
+                crypto_constant \
+                    .sweepResultsDictionary \
+                        [sweepKeyTuple] \
+                    = crypto_sweep.ReturnMiniBatchKMeansSweepDictionaryFunction \
+                        (normalizedDataFrame \
+                             .to_numpy \
+                                 (dtype = np.float64),
+                         kValueIntegerList = kValueIntegerList)
+
+            return \
+                crypto_constant \
+                    .sweepResultsDictionary \
+                        [sweepKeyTuple]
+
+        else:
+
+            return \
+                crypto_sweep.ReturnKMeansSweepDictionaryFunction \
+                    (normalizedDataFrame,
+                     kValueIntegerList = kValueIntegerList,
+                     silhouetteModeString = silhouetteModeString,
+                     sampleWeightFloatArray = sampleWeightFloatArray)
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnSweepDictionaryFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the k-sweep results.')
+
+        return \
+            None
+
+
+# In[5]:
+
+
 #*******************************************************************************************
  #
  #  Function Name:  ReturnOptimalKWithWCSSElbowFunction
@@ -77,104 +547,60 @@ CONSTANT_LOCAL_FILE_NAME \
  #  DataFrame
  #          normalizedDataFrame
  #                          The parameter is the normalized input DataFrame.
+ #  List
+ #          kValueIntegerList
+ #                          The parameter is a List of k values.
+ #  String
+ #          engineString
+ #                          The parameter is the clustering engine ('kmeans',
+ #                          'ward', 'coreset', or 'minibatch').
+ #  Series
+ #          sampleWeightSeries
+ #                          The parameter is the weight of every row or None.
  #
  #
  #  Date                Description                                 Programmer
  #  ---------------     ------------------------------------        ------------------
  #  11/21/2023          Initial Development                         N. James George
+ #  10/18/2026          Reads the shared k-sweep results            agent
+ #  10/18/2026          Added the k value List parameter            agent
+ #  10/18/2026          Added the Ward engine                       agent
+ #  10/18/2026          Added the sample weight parameter           agent
  #
  #******************************************************************************************/
 
 def ReturnOptimalKWithWCSSElbowFunction \
-        (normalizedDataFrame):
-    
-    try:
-        
-        # This line of code creates a List with the number of k-values from 1 to 11.
-        kValueNumbersIntegerList \
-            = list(range(2, 11))
-    
-        # This line of code creates a List to store the inertia values.
-        inertiaFloatList \
-            = []
-    
-        # This repetition loop computes the inertia with each possible value of k.
-        for kValueNumberInteger in kValueNumbersIntegerList:
-    
-            # This line of code creates a KMeans model using the loop counter 
-            # for the n_clusters.
-            modelKMeansObject \
-                = KMeans \
-                    (n_clusters = kValueNumberInteger, 
-                     random_state = 10, 
-                     n_init = 100)
-
-            # This line of code fits the model to the data using the normalized
-            # cryptocurrency DataFrame.
-            modelKMeansObject \
-                .fit \
-                    (normalizedDataFrame)
-    
-            # This line of code appends the model.inertia_ to the inertia List.
-            inertiaFloatList \
-                .append \
-                    (modelKMeansObject.inertia_)
-    
-
-        inertiaFloatSeries \
-            = pd.Series \
-                (inertiaFloatList, 
-                 index = kValueNumbersIntegerList, 
-                 name = 'Wcss Elbow')
+        (normalizedDataFrame,
+         kValueIntegerList \
+            = None,
+         engineString \
+            = None,
+         sampleWeightSeries \
+            = None):
 
-        
-        inertiaIndexIntegerList \
-            = list \
-                (inertiaFloatSeries.index)
-        
-        percentVarianceFloatList \
-            = []
+    try:
 
-        for numberKValues in inertiaIndexIntegerList:
-        
-            percentVarianceFloatList \
-                .append \
-                    (100 \
-                     * (1 - (inertiaFloatSeries[numberKValues] \
-                             / inertiaFloatSeries[inertiaIndexIntegerList[0]])))
-    
-    
-        thresholdInteger \
-            = len(percentVarianceFloatList) + 1
+        return \
+            ReturnSweepDictionaryFunction \
+                (normalizedDataFrame,
+                 kValueIntegerList = kValueIntegerList,
+                 engineString = engineString,
+                 sampleWeightSeries = sampleWeightSeries) \
+                    ['Wcss Elbow']
 
-        optimalKInteger = 0
-            
-        for index in range(1, thresholdInteger):
-                
-            if abs(percentVarianceFloatList[index] \
-                   - percentVarianceFloatList[index - 1]) \
-                < thresholdInteger:
-                
-                optimalKInteger = index + 1
-                    
-                break
-                
-                
-        return optimalKInteger, inertiaFloatSeries
-    
     except:
-        
+
         log_subroutine \
             .PrintAndLogWriteText \
                 (f'The function, ReturnOptimalKWithWCSSElbowFunction, '
                  + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
                  + f'was unable to return an optimal k value.')
-    
+
         return \
             None
 
 
-# In[4]:
+# In[6]:
 
 
 #*******************************************************************************************
@@ -192,77 +618,60 @@ def ReturnOptimalKWithWCSSElbowFunction \
  #  DataFrame
  #          normalizedDataFrame
  #                          The parameter is the normalized input DataFrame.
+ #  List
+ #          kValueIntegerList
+ #                          The parameter is a List of k values.
+ #  String
+ #          engineString
+ #                          The parameter is the clustering engine ('kmeans',
+ #                          'ward', 'coreset', or 'minibatch').
+ #  Series
+ #          sampleWeightSeries
+ #                          The parameter is the weight of every row or None.
  #
  #
  #  Date                Description                                 Programmer
  #  ---------------     ------------------------------------        ------------------
  #  11/21/2023          Initial Development                         N. James George
+ #  10/18/2026          Reads the shared k-sweep results            agent
+ #  10/18/2026          Added the k value List parameter            agent
+ #  10/18/2026          Added the Ward engine                       agent
+ #  10/18/2026          Added the sample weight parameter           agent
  #
  #******************************************************************************************/
 
 def ReturnOptimalKWithCalinskiHarabaszFunction \
-        (normalizedDataFrame):
-    
+        (normalizedDataFrame,
+         kValueIntegerList \
+            = None,
+         engineString \
+            = None,
+         sampleWeightSeries \
+            = None):
+
     try:
-        
-        # This line of code creates a List with the number of k-values from 1 to 11.
-        kValueNumbersIntegerList \
-            = list(range(2, 11))
-    
-        # This line of code creates an empty List to store the inertia values.
-        inertiaFloatList \
-            = []
-    
-        # This repetition loop computes the inertia with each possible value of k.
-        for kValueNumberInteger in kValueNumbersIntegerList:
-    
-            # This line of code creates a KMeans model using the loop counter 
-            # for the n_clusters.
-            modelKMeansObject \
-                = KMeans \
-                    (n_clusters = kValueNumberInteger, 
-                     random_state = 10, 
-                     n_init = 100)
-
-            # This line of code fits the model to the data using the normalized
-            # cryptocurrency DataFrame.
-            modelKMeansObject \
-                .fit \
-                    (normalizedDataFrame)
-    
-            # This line of code appends the model.inertia_ to the inertia List.
-            inertiaFloatList \
-                .append \
-                    (calinski_harabasz_score \
-                         (normalizedDataFrame,
-                          modelKMeansObject.labels_))
-    
 
-        inertiaFloatSeries \
-            = pd.Series \
-                (inertiaFloatList, 
-                 index = kValueNumbersIntegerList, 
-                 name = 'Calinski Harabasz')
+        return \
+            ReturnSweepDictionaryFunction \
+                (normalizedDataFrame,
+                 kValueIntegerList = kValueIntegerList,
+                 engineString = engineString,
+                 sampleWeightSeries = sampleWeightSeries) \
+                    ['Calinski Harabasz']
 
-        optimalKInteger \
-            = inertiaFloatSeries.idxmax()
-       
-        
-        return optimalKInteger, inertiaFloatSeries
-    
     except:
-        
+
         log_subroutine \
             .PrintAndLogWriteText \
                 (f'The function, ReturnOptimalKWithCalinskiHarabaszFunction, '
                  + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
                  + f'was unable to return an optimal k value.')
-    
+
         return \
-            None        
+            None
 
 
-# In[5]:
+# In[7]:
 
 
 #*******************************************************************************************
@@ -271,6 +680,9 @@ def ReturnOptimalKWithCalinskiHarabaszFunction \
  #
  #  Function Description:
  #      This function returns an optimal k values using the Silhouette Method.
+ #      Above the row threshold, the default 'auto' silhouette mode switches
+ #      from the exact scores to the sampled or simplified scores; the sweep
+ #      Dictionary holds the sampled scores' confidence intervals.
  #
  #
  #  Function Parameters:
@@ -280,90 +692,356 @@ def ReturnOptimalKWithCalinskiHarabaszFunction \
  #  DataFrame
  #          normalizedDataFrame
  #                          The parameter is the normalized input DataFrame.
+ #  List
+ #          kValueIntegerList
+ #                          The parameter is a List of k values.
+ #  String
+ #          silhouetteModeString
+ #                          The parameter is the silhouette mode ('auto',
+ #                          'exact', 'sampled', or 'simplified').
+ #  String
+ #          engineString
+ #                          The parameter is the clustering engine ('kmeans',
+ #                          'ward', 'coreset', or 'minibatch').
+ #  Series
+ #          sampleWeightSeries
+ #                          The parameter is the weight of every row or None.
  #
  #
  #  Date                Description                                 Programmer
  #  ---------------     ------------------------------------        ------------------
  #  11/21/2023          Initial Development                         N. James George
+ #  10/18/2026          Reads the shared k-sweep results            agent
+ #  10/18/2026          Added the k value List parameter            agent
+ #  10/18/2026          Added the silhouette modes                  agent
+ #  10/18/2026          Added the Ward engine                       agent
+ #  10/18/2026          Added the sample weight parameter           agent
  #
  #******************************************************************************************/
 
 def ReturnOptimalKWithSilhouetteFunction \
-        (normalizedDataFrame):
-    
+        (normalizedDataFrame,
+         kValueIntegerList \
+            = None,
+         silhouetteModeString \
+            = None,
+         engineString \
+            = None,
+         sampleWeightSeries \
+            = None):
+
     try:
-        
-        # This line of code creates a List with the number of k-values from 1 to 11.
-        kValueNumbersIntegerList \
-            = list(range(2, 11))
-    
-        # This line of code creates an empty List to store the inertia values.
-        inertiaFloatList \
-            = []
-    
-        # This repetition loop computes the inertia with each possible value of k.
-        for kValueNumberInteger in kValueNumbersIntegerList:
-    
-            # This line of code creates a KMeans model using the loop counter 
-            # for the n_clusters.
-            modelKMeansObject \
-                = KMeans \
-                    (n_clusters = kValueNumberInteger, 
-                     random_state = 10, 
-                     n_init = 100)
-
-            # This line of code fits the model to the data using the normalized
-            # cryptocurrency DataFrame.
-            modelKMeansObject \
-                .fit \
-                    (normalizedDataFrame)
-    
-            # This line of code appends the model.inertia_ to the inertia List.
-            inertiaFloatList \
-                .append \
-                    (silhouette_score \
-                         (normalizedDataFrame,
-                          modelKMeansObject.labels_))
-    
 
-        inertiaFloatSeries \
-            = pd.Series \
-                (inertiaFloatList, 
-                 index = kValueNumbersIntegerList, 
-                 name = 'Silhouette')
+        return \
+            ReturnSweepDictionaryFunction \
+                (normalizedDataFrame,
+                 kValueIntegerList = kValueIntegerList,
+                 silhouetteModeString = silhouetteModeString,
+                 engineString = engineString,
+                 sampleWeightSeries = sampleWeightSeries) \
+                    ['Silhouette']
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnOptimalKWithSilhouetteFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return an optimal k value.')
+
+        return \
+            None
+
+
+# In[8]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnOptimalKWithDaviesBouldinFunction
+ #
+ #  Function Description:
+ #      This function returns an optimal k values using the Davies-Bouldin Method,
+ #      the k value with the lowest score.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          normalizedDataFrame
+ #                          The parameter is the normalized input DataFrame.
+ #  List
+ #          kValueIntegerList
+ #                          The parameter is a List of k values.
+ #  String
+ #          engineString
+ #                          The parameter is the clustering engine ('kmeans',
+ #                          'ward', 'coreset', or 'minibatch').
+ #  Series
+ #          sampleWeightSeries
+ #                          The parameter is the weight of every row or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  11/21/2023          Initial Development                         N. James George
+ #  10/18/2026          Reads the shared k-sweep results            agent
+ #  10/18/2026          Added the k value List parameter            agent
+ #  10/18/2026          Scores with the Davies-Bouldin index        agent
+ #  10/18/2026          Added the Ward engine                       agent
+ #  10/18/2026          Added the sample weight parameter           agent
+ #
+ #******************************************************************************************/
+
+def ReturnOptimalKWithDaviesBouldinFunction \
+        (normalizedDataFrame,
+         kValueIntegerList \
+            = None,
+         engineString \
+            = None,
+         sampleWeightSeries \
+            = None):
+
+    try:
+
+        return \
+            ReturnSweepDictionaryFunction \
+                (normalizedDataFrame,
+                 kValueIntegerList = kValueIntegerList,
+                 engineString = engineString,
+                 sampleWeightSeries = sampleWeightSeries) \
+                    ['Davies Bouldin']
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnOptimalKWithDaviesBouldinFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return an optimal k value.')
+
+        return \
+            None
+
+
+# In[9]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnOptimalKWithGapStatisticFunction
+ #
+ #  Function Description:
+ #      This function returns an optimal k value using the Gap Statistic Method
+ #      (Tibshirani, Walther, and Hastie): the smallest k value whose gap is at
+ #      least the next k value's gap minus its standard error.  The input's
+ #      inertias come from the cached full-batch k-means models, whatever the
+ #      clustering engine, so they compare with the references' full-batch
+ #      k-means inertias; the uniform reference datasets run in a process pool
+ #      and are cached by the input content hash and the reference parameters.
+ #      With sample weights, the input's inertias are weighted, and the
+ #      reference rows carry the same weights, so both sides measure the same
+ #      total weight.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          normalizedDataFrame
+ #                          The parameter is the normalized input DataFrame.
+ #  List
+ #          kValueIntegerList
+ #                          The parameter is a List of k values.
+ #  Integer
+ #          referencesInteger
+ #                          The parameter is the number of reference datasets.
+ #  Integer
+ #          maxWorkersInteger
+ #                          The parameter is the number of worker processes.
+ #  Series
+ #          sampleWeightSeries
+ #                          The parameter is the weight of every row or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Added the sample weight parameter           agent
+ #  10/18/2026          Fits the input with full-batch k-means      agent
+ #
+ #******************************************************************************************/
+
+def ReturnOptimalKWithGapStatisticFunction \
+        (normalizedDataFrame,
+         kValueIntegerList \
+            = None,
+         referencesInteger \
+            = None,
+         maxWorkersInteger \
+            = None,
+         sampleWeightSeries \
+            = None):
+
+    executorObject \
+        = None
+
+    try:
+
+        if referencesInteger == None:
+
+            referencesInteger \
+                = crypto_constant.GAP_REFERENCES_INTEGER
+
+        if maxWorkersInteger == None:
+
+            maxWorkersInteger \
+                = crypto_constant.SWEEP_MAX_WORKERS_INTEGER
+
+
+        sampleWeightFloatArray \
+            = crypto_sweep.ReturnSampleWeightFloatArrayFunction \
+                (normalizedDataFrame,
+                 sampleWeightSeries)
+
+        if kValueIntegerList == None:
+
+            kValueIntegerList \
+                = crypto_constant.K_VALUE_INTEGER_LIST
+
+        kValueIntegerList \
+            = [int(kValueInteger) for kValueInteger in kValueIntegerList]
+
+        inertiaFloatSeries \
+            = pd.Series \
+                ([crypto_sweep.ReturnFittedKMeansModelFunction \
+                      (normalizedDataFrame,
+                       kValueInteger,
+                       sampleWeightFloatArray = sampleWeightFloatArray) \
+                  .inertia_
+                  for kValueInteger in kValueIntegerList],
+                 index = kValueIntegerList)
+
+
+        referenceKeyTuple \
+            = (crypto_sweep.ReturnDataFrameContentHashStringFunction \
+                   (normalizedDataFrame),
+               tuple(kValueIntegerList),
+               referencesInteger,
+               crypto_constant.GAP_N_INIT_INTEGER,
+               crypto_constant.RANDOM_STATE_INTEGER,
+               crypto_sweep.ReturnSampleWeightHashStringFunction \
+                   (sampleWeightFloatArray))
+
+        if referenceKeyTuple not in crypto_constant.gapReferenceDictionary:
+
+            if maxWorkersInteger > 1:
+
+                executorObject \
+                    = ProcessPoolExecutor \
+                        (max_workers = maxWorkersInteger)
+
+            featureFloatArray \
+                = normalizedDataFrame.to_numpy(dtype = np.float64)
+
+            algorithmStringList \
+                = [crypto_sweep.ReturnKMeansAlgorithmStringFunction \
+                       (featureFloatArray.shape[0],
+                        featureFloatArray.shape[1],
+                        kValueInteger,
+                        crypto_constant.GAP_N_INIT_INTEGER,
+                        fullBatchFlagBoolean = True)
+                   for kValueInteger in kValueIntegerList]
+
+            crypto_constant.gapReferenceDictionary[referenceKeyTuple] \
+                = np.array \
+                    (crypto_shared_memory.ReturnTaskResultsListFunction \
+                         (executorObject,
+                          crypto_sweep.ReturnGapReferenceLogWcssListFunction,
+                          [(featureFloatArray.min(axis = 0),
+                            featureFloatArray.max(axis = 0),
+                            featureFloatArray.shape[0],
+                            kValueIntegerList,
+                            algorithmStringList,
+                            referenceInteger,
+                            sampleWeightFloatArray)
+                           for referenceInteger in range(referencesInteger)]))
+
+        referenceLogWcssFloatArray \
+            = crypto_constant.gapReferenceDictionary[referenceKeyTuple]
+
+
+        gapFloatSeries \
+            = pd.Series \
+                (referenceLogWcssFloatArray.mean(axis = 0) \
+                 - np.log(inertiaFloatSeries.to_numpy()),
+                 index = kValueIntegerList,
+                 name = 'Gap Statistic')
+
+        standardErrorFloatArray \
+            = referenceLogWcssFloatArray.std(axis = 0) \
+              * np.sqrt(1.0 + 1.0 / referencesInteger)
+
+        log_subroutine \
+            .PrintAndDebugWriteText \
+                (f'The gap statistic standard errors are '
+                 + f'{dict(zip(kValueIntegerList, standardErrorFloatArray))}.')
+
+
+        # The largest gap is the fallback when no k value meets the criterion.
+        criterionBooleanArray \
+            = gapFloatSeries.to_numpy()[:-1] \
+              >= gapFloatSeries.to_numpy()[1:] - standardErrorFloatArray[1:]
+
+        if criterionBooleanArray.any():
+
+            optimalKValueInteger \
+                = kValueIntegerList[int(np.argmax(criterionBooleanArray))]
+
+        else:
+
+            optimalKValueInteger \
+                = int(gapFloatSeries.idxmax())
+
+
+        return optimalKValueInteger, gapFloatSeries
 
-        pointFloat \
-            = inertiaFloatSeries.max()
-    
-        optimalKInteger \
-            = inertiaFloatSeries \
-                .index \
-                    [inertiaFloatSeries == pointFloat][0]
-    
-            
-        return optimalKInteger, inertiaFloatSeries
-    
     except:
-        
+
         log_subroutine \
             .PrintAndLogWriteText \
-                (f'The function, ReturnOptimalKWithSilhouetteFunction, '
+                (f'The function, ReturnOptimalKWithGapStatisticFunction, '
                  + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
                  + f'was unable to return an optimal k value.')
-    
+
         return \
-            None 
+            None
 
+    finally:
 
-# In[6]:
+        crypto_shared_memory.ShutdownFeatureMatrixExecutor \
+            (executorObject,
+             None)
+
+
+# In[10]:
 
 
 #*******************************************************************************************
  #
- #  Function Name:  ReturnOptimalKWithDaviesBouldinFunction
+ #  Function Name:  ReturnFeatureSubsetRankingDataFrameFunction
  #
  #  Function Description:
- #      This function returns an optimal k values using the Davies-Bouldin Method.
+ #      This function searches every column subset of the given sizes, runs the
+ #      k-sweep on each in a process pool over the shared feature matrix, and
+ #      returns a DataFrame of every subset's optimal k values and scores, best
+ #      first by the ranking method's score.  For the exact silhouette scores,
+ #      the function computes every column's Gram contributions once and shares
+ #      them with the workers, which add up each subset's pairwise distances
+ #      from them.
  #
  #
  #  Function Parameters:
@@ -373,78 +1051,162 @@ def ReturnOptimalKWithSilhouetteFunction \
  #  DataFrame
  #          normalizedDataFrame
  #                          The parameter is the normalized input DataFrame.
+ #  List
+ #          kValueIntegerList
+ #                          The parameter is a List of k values.
+ #  List
+ #          subsetSizesIntegerList
+ #                          The parameter is a List of subset sizes.
+ #  String
+ #          rankMethodString
+ #                          The parameter is the ranking method ('Calinski
+ #                          Harabasz', 'Silhouette', or 'Davies Bouldin').
+ #  Integer
+ #          maxWorkersInteger
+ #                          The parameter is the number of worker processes.
  #
  #
  #  Date                Description                                 Programmer
  #  ---------------     ------------------------------------        ------------------
- #  11/21/2023          Initial Development                         N. James George
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Shares the column Gram contributions        agent
  #
  #******************************************************************************************/
 
-def ReturnOptimalKWithDaviesBouldinFunction \
-        (normalizedDataFrame):
-    
+def ReturnFeatureSubsetRankingDataFrameFunction \
+        (normalizedDataFrame,
+         kValueIntegerList \
+            = None,
+         subsetSizesIntegerList \
+            = None,
+         rankMethodString \
+            = None,
+         maxWorkersInteger \
+            = None):
+
+    executorObject \
+        = None
+
+    sharedMemoryObject \
+        = None
+
+    gramSharedMemoryObject \
+        = None
+
     try:
-    
-        # This line of code creates a List with the number of k-values from 1 to 11.
-        kValueNumbersIntegerList \
-            = list(range(2, 11))
-    
-        # This line of code creates an empty List to store the inertia values.
-        inertiaFloatList \
-            = []
-    
-        # This repetition loop computes the inertia with each possible value of k.
-        for kValueNumberInteger in kValueNumbersIntegerList:
-    
-            # This line of code creates a KMeans model using the loop counter 
-            # for the n_clusters.
-            modelKMeansObject \
-                = KMeans \
-                    (n_clusters = kValueNumberInteger, 
-                     random_state = 10, 
-                     n_init = 100)
-
-            # This line of code fits the model to the data using the normalized
-            # cryptocurrency DataFrame.
-            modelKMeansObject \
-                .fit \
+
+        if kValueIntegerList == None:
+
+            kValueIntegerList \
+                = crypto_constant.K_VALUE_INTEGER_LIST
+
+        if subsetSizesIntegerList == None:
+
+            subsetSizesIntegerList \
+                = crypto_constant.FEATURE_SUBSET_SIZES_INTEGER_LIST
+
+        if rankMethodString == None:
+
+            rankMethodString \
+                = crypto_constant.FEATURE_SUBSET_RANK_METHOD_STRING
+
+        if maxWorkersInteger == None:
+
+            maxWorkersInteger \
+                = crypto_constant.SWEEP_MAX_WORKERS_INTEGER
+
+
+        columnIndexTupleList \
+            = [columnIndexTuple
+               for subsetSizeInteger in subsetSizesIntegerList
+               for columnIndexTuple \
+                   in itertools.combinations \
+                          (range(normalizedDataFrame.shape[1]),
+                           subsetSizeInteger)]
+
+        executorObject, featureSourceObject, sharedMemoryObject \
+            = crypto_sweep.ReturnFeatureMatrixExecutorTupleFunction \
+                (normalizedDataFrame,
+                 maxWorkersInteger)
+
+        # These lines of code compute every column's Gram contributions once for
+        # the subsets' exact silhouette scores and share them with the workers.
+        gramSourceObject \
+            = None
+
+        if crypto_sweep.ReturnSilhouetteModeStringFunction \
+               (len(normalizedDataFrame)) == 'exact':
+
+            gramSourceObject \
+                = crypto_sweep.ReturnColumnGramContributionsDataFrameFunction \
                     (normalizedDataFrame)
-    
-            # This line of code appends the model.inertia_ to the inertia List.
-            inertiaFloatList \
-                .append \
-                    (silhouette_score \
-                         (normalizedDataFrame,
-                          modelKMeansObject.labels_))
-        
 
-        inertiaFloatSeries \
-            = pd.Series \
-                (inertiaFloatList, 
-                 index = kValueNumbersIntegerList, 
-                 name = 'Davies Bouldin')
+        if gramSourceObject is not None \
+            and executorObject != None:
+
+            gramSharedMemoryObject, gramSourceObject \
+                = crypto_shared_memory.ReturnSharedFeatureMatrixTupleFunction \
+                    (gramSourceObject,
+                     'float64')
+
+        scoresDictionaryList \
+            = crypto_shared_memory.ReturnTaskResultsListFunction \
+                (executorObject,
+                 crypto_sweep.ReturnFeatureSubsetScoresDictionaryFunction,
+                 [(featureSourceObject,
+                   columnIndexTuple,
+                   kValueIntegerList,
+                   gramSourceObject)
+                  for columnIndexTuple in columnIndexTupleList])
+
+        rankingDataFrame \
+            = pd.DataFrame \
+                ([{'Wcss Elbow K': scoresDictionary['Wcss Elbow'][0],
+                   **{columnString: valueObject
+                      for methodString \
+                          in ['Calinski Harabasz', 'Silhouette', 'Davies Bouldin']
+                      for columnString, valueObject \
+                          in zip([f'{methodString} K', methodString],
+                                 scoresDictionary[methodString])}}
+                  for scoresDictionary in scoresDictionaryList],
+                 index \
+                     = pd.Index \
+                           ([', '.join(normalizedDataFrame.columns[list(columnIndexTuple)])
+                             for columnIndexTuple in columnIndexTupleList],
+                            name = 'Columns'))
+
+
+        # A lower Davies-Bouldin score is better; the other scores are higher.
+        return \
+            rankingDataFrame \
+                .sort_values \
+                    (rankMethodString,
+                     ascending = rankMethodString == 'Davies Bouldin',
+                     kind = 'stable')
 
-    
-        optimalKInteger \
-            = inertiaFloatSeries.idxmax()
-    
-            
-        return optimalKInteger, inertiaFloatSeries
-    
     except:
-        
+
         log_subroutine \
             .PrintAndLogWriteText \
-                (f'The function, ReturnOptimalKWithDaviesBouldinFunction, '
+                (f'The function, ReturnFeatureSubsetRankingDataFrameFunction, '
                  + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
-                 + f'was unable to return an optimal k value.')
-    
+                 + f'was unable to return the feature subset ranking.')
+
         return \
-            None  
+            None
 
+    finally:
 
-# In[7]:
+        crypto_shared_memory.ShutdownFeatureMatrixExecutor \
+            (executorObject,
+             sharedMemoryObject)
+
+        crypto_shared_memory.ShutdownFeatureMatrixExecutor \
+            (None,
+             gramSharedMemoryObject)
+
+
+# In[11]:
 
 
 #*******************************************************************************************
@@ -530,7 +1292,7 @@ def ReturnSubplotTraceListFunction \
             None          
 
 
-# In[8]:
+# In[12]:
 
 
 #*******************************************************************************************
@@ -626,7 +1388,7 @@ def ReturnHeightWidthRowsColumnsFunction \
             None            
 
 
-# In[9]:
+# In[13]:
 
 
 #*******************************************************************************************
@@ -817,7 +1579,7 @@ def ReturnClusterPlotsFunction \
             None             
 
 
-# In[10]:
+# In[14]:
 
 
 #*******************************************************************************************
@@ -883,7 +1645,7 @@ def ReturnMaxRowAndColumnFunction \
         return None, None  
 
 
-# In[11]:
+# In[15]:
 
 
 #*******************************************************************************************
@@ -891,7 +1653,16 @@ def ReturnMaxRowAndColumnFunction \
  #  Function Name:  ReturnClusterPredictionsFunction
  #
  #  Function Description:
- #      This function returns a k-means cluster predictions.
+ #      This function returns a k-means cluster predictions or, with the Ward
+ #      engine, the labels of the Ward hierarchy's cuts.  The coreset engine
+ #      predicts with the full-data models refined from the coreset centers,
+ #      and the mini-batch engine with the mini-batch models of its sweep, so
+ #      the predictions match the engine's optimal k values.  With an outlier
+ #      screen Dictionary, the k-means models fit the screened rows with the
+ #      screen's weights, and the excluded rows get the models' predictions
+ #      like every other row; the Ward engine cuts the screened rows'
+ #      hierarchy and assigns the excluded rows to the nearest centroid of
+ #      the cut.
  #
  #
  #  Function Parameters:
@@ -904,33 +1675,158 @@ def ReturnMaxRowAndColumnFunction \
  #  List
  #          kValueIntegerList
  #                          The parameter is a List of optimal K values.
+ #  String
+ #          engineString
+ #                          The parameter is the clustering engine ('kmeans',
+ #                          'ward', 'coreset', or 'minibatch').
+ #  Series
+ #          sampleWeightSeries
+ #                          The parameter is the weight of every row or None.
+ #  Dictionary
+ #          outlierScreenDictionary
+ #                          The parameter is the outlier screen Dictionary or
+ #                          None; its weights replace the sample weights.
  #
  #
  #  Date                Description                                 Programmer
  #  ---------------     ------------------------------------        ------------------
  #  11/22/2023          Initial Development                         N. James George
+ #  10/18/2026          Uses the fitted model cache                 agent
+ #  10/18/2026          Added the Ward engine                       agent
+ #  10/18/2026          Added the sample weight parameter           agent
+ #  10/18/2026          Added the outlier screen parameter          agent
+ #  10/18/2026          Added the refined coreset models            agent
+ #  10/18/2026          Added the Ward engine outlier screen        agent
+ #  10/18/2026          Added the mini-batch engine                 agent
  #
  #******************************************************************************************/
 
 def ReturnClusterPredictionsFunction \
         (normalizedDataFrame,
-         kValueIntegerList):
+         kValueIntegerList,
+         engineString \
+            = None,
+         sampleWeightSeries \
+            = None,
+         outlierScreenDictionary \
+            = None):
     
     try:
+
+        if engineString == None:
+
+            engineString \
+                = crypto_constant.CLUSTERING_ENGINE_STRING
+
+
+        fitDataFrame \
+            = normalizedDataFrame
+
+        if outlierScreenDictionary != None:
+
+            if outlierScreenDictionary['action'] == 'exclude':
+
+                fitDataFrame \
+                    = normalizedDataFrame \
+                        .drop \
+                            (index = outlierScreenDictionary['outliers'])
+
+            sampleWeightSeries \
+                = outlierScreenDictionary['weights']
+
+        sampleWeightFloatArray \
+            = crypto_sweep.ReturnSampleWeightFloatArrayFunction \
+                (fitDataFrame,
+                 sampleWeightSeries)
+
+        
+        if engineString in ['ward', 'minibatch'] \
+            and sampleWeightFloatArray is not None:
+
+            log_subroutine \
+                .PrintAndLogWriteText \
+                    (f'The function, ReturnClusterPredictionsFunction, '
+                     + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                     + f'ignores the sample weights in the {engineString} engine.')
+
         
         predictionsIntegerListList \
             = []
         
         for kValue in kValueIntegerList:
+
+            if engineString == 'ward':
+
+                wardLabelsIntegerArray \
+                    = crypto_ward.ReturnWardClusterLabelsFunction \
+                        (fitDataFrame,
+                         kValue)
+
+                # The excluded rows join the nearest centroid of the screened
+                # rows' cut.
+                if len(fitDataFrame) < len(normalizedDataFrame):
+
+                    excludedBooleanArray \
+                        = ~ normalizedDataFrame.index.isin(fitDataFrame.index)
+
+                    labelsIntegerArray \
+                        = np.empty \
+                            (len(normalizedDataFrame),
+                             dtype = wardLabelsIntegerArray.dtype)
+
+                    labelsIntegerArray[~ excludedBooleanArray] \
+                        = wardLabelsIntegerArray
+
+                    labelsIntegerArray[excludedBooleanArray] \
+                        = pairwise_distances_argmin_min \
+                            (normalizedDataFrame[excludedBooleanArray].to_numpy(),
+                             fitDataFrame \
+                                 .groupby(wardLabelsIntegerArray) \
+                                 .mean() \
+                                 .to_numpy())[0]
+
+                    wardLabelsIntegerArray \
+                        = labelsIntegerArray
+
+                predictionsIntegerListList \
+                    .append \
+                        (wardLabelsIntegerArray)
+
+                continue
+
         
-            modelKMeansObject \
-                = KMeans \
-                    (n_clusters = kValue, 
-                     n_init = 100, 
-                     random_state = 10)
-        
-            modelKMeansObject.fit \
-                (normalizedDataFrame)
+            if engineString == 'coreset':
+
+                modelKMeansObject \
+                    = crypto_coreset.ReturnRefinedCoresetKMeansModelFunction \
+                        (fitDataFrame,
+                         kValue,
+                         sampleWeightFloatArray)
+
+            elif engineString == 'minibatch':
+
+                # The mini-batch models train on the array row source of the
+                # engine's sweep, so they predict arrays as well.
+                clusterValuesPredictionIntegerList \
+                    = crypto_sweep.ReturnMiniBatchKMeansModelFunction \
+                        (fitDataFrame.to_numpy(dtype = np.float64),
+                         kValue) \
+                      .predict \
+                          (normalizedDataFrame.to_numpy(dtype = np.float64))
+
+                predictionsIntegerListList \
+                    .append \
+                        (clusterValuesPredictionIntegerList)
+
+                continue
+
+            else:
+
+                modelKMeansObject \
+                    = crypto_sweep.ReturnFittedKMeansModelFunction \
+                        (fitDataFrame,
+                         kValue,
+                         sampleWeightFloatArray = sampleWeightFloatArray)
     
             clusterValuesPredictionIntegerList \
                 = modelKMeansObject.predict \
@@ -954,7 +1850,433 @@ def ReturnClusterPredictionsFunction \
         return None
 
 
-# In[12]:
+# In[16]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnClusterDiagnosticsDataFrameFunction
+ #
+ #  Function Description:
+ #      This function returns a DataFrame of per-cluster diagnostics for one set
+ #      of cluster labels, one row per cluster: the size (and the weight with
+ #      sample weights), the radius (the root mean square distance to the
+ #      centroid), the mean and maximum distances to the centroid, the nearest
+ #      other cluster and the distance between the centroids, and the
+ #      centroid's value for every feature.  Every statistic comes from one
+ #      pass of grouped sums over the labels and the rows' distances to their
+ #      own centroids, with no loop over the clusters, so it costs O(n·d + k²·d).
+ #      Without centers, the centroids are the clusters' (weighted) means.  The
+ #      clusters are a column, so ReturnStylerObjectStandardFormat can hide the
+ #      index.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          normalizedDataFrame
+ #                          The parameter is a DataFrame of normalized values.
+ #  NumPy Array
+ #          labelsIntegerArray
+ #                          The parameter is the cluster label of every row.
+ #  NumPy Array
+ #          centersFloatArray
+ #                          The parameter is the cluster centers or None.
+ #  Series
+ #          sampleWeightSeries
+ #                          The parameter is the weight of every row or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnClusterDiagnosticsDataFrameFunction \
+        (normalizedDataFrame,
+         labelsIntegerArray,
+         centersFloatArray \
+            = None,
+         sampleWeightSeries \
+            = None):
+
+    try:
+
+        featureFloatArray \
+            = normalizedDataFrame \
+                .to_numpy \
+                    (dtype = np.float64)
+
+        labelsIntegerArray \
+            = np.asarray \
+                (labelsIntegerArray,
+                 dtype = np.intp)
+
+        rowCountInteger, featureCountInteger \
+            = featureFloatArray.shape
+
+        clusterCountInteger \
+            = int(labelsIntegerArray.max()) + 1 \
+              if centersFloatArray is None \
+              else len(centersFloatArray)
+
+        sampleWeightFloatArray \
+            = crypto_sweep.ReturnSampleWeightFloatArrayFunction \
+                (normalizedDataFrame,
+                 sampleWeightSeries)
+
+        rowWeightFloatArray \
+            = np.ones(rowCountInteger) \
+              if sampleWeightFloatArray is None \
+              else sampleWeightFloatArray
+
+        sizeIntegerArray \
+            = np.bincount \
+                (labelsIntegerArray,
+                 minlength = clusterCountInteger)
+
+        clusterWeightFloatArray \
+            = np.bincount \
+                (labelsIntegerArray,
+                 weights = rowWeightFloatArray,
+                 minlength = clusterCountInteger)
+
+        # Empty clusters have no mean, so their statistics are NaN.
+        safeClusterWeightFloatArray \
+            = np.where \
+                (clusterWeightFloatArray > 0,
+                 clusterWeightFloatArray,
+                 np.nan)
+
+        if centersFloatArray is None:
+
+            # This line of code sums every (cluster, feature) cell at once: the
+            # flat bin of row i's feature j is label_i·d + j.
+            centersFloatArray \
+                = np.bincount \
+                    ((labelsIntegerArray[:, np.newaxis] * featureCountInteger \
+                      + np.arange(featureCountInteger)[np.newaxis, :]) \
+                     .ravel(),
+                     weights \
+                         = (featureFloatArray \
+                            * rowWeightFloatArray[:, np.newaxis]) \
+                           .ravel(),
+                     minlength = clusterCountInteger * featureCountInteger) \
+                  .reshape \
+                      (clusterCountInteger,
+                       featureCountInteger) \
+                  / safeClusterWeightFloatArray[:, np.newaxis]
+
+        else:
+
+            centersFloatArray \
+                = np.asarray \
+                    (centersFloatArray,
+                     dtype = np.float64)
+
+
+        ownDistanceFloatArray \
+            = np.sqrt \
+                (((featureFloatArray \
+                   - centersFloatArray[labelsIntegerArray]) ** 2) \
+                 .sum(axis = 1))
+
+        maxDistanceFloatArray \
+            = np.full \
+                (clusterCountInteger,
+                 np.nan)
+
+        maxDistanceFloatArray[sizeIntegerArray > 0] \
+            = -np.inf
+
+        np.maximum \
+            .at \
+                (maxDistanceFloatArray,
+                 labelsIntegerArray,
+                 ownDistanceFloatArray)
+
+        # A lone cluster has no other centroid, so its separation is NaN.
+        centerDistanceFloatArray \
+            = np.sqrt \
+                (((centersFloatArray[:, np.newaxis, :] \
+                   - centersFloatArray[np.newaxis, :, :]) ** 2) \
+                 .sum(axis = 2))
+
+        np.fill_diagonal \
+            (centerDistanceFloatArray,
+             np.inf)
+
+        nearestClusterIntegerArray \
+            = np.argmin \
+                (centerDistanceFloatArray,
+                 axis = 1)
+
+        separationFloatArray \
+            = centerDistanceFloatArray \
+                [np.arange(clusterCountInteger), nearestClusterIntegerArray]
+
+        separationFloatArray[np.isinf(separationFloatArray)] \
+            = np.nan
+
+
+        diagnosticsDataFrame \
+            = pd.DataFrame \
+                ({'Cluster': np.arange(clusterCountInteger),
+                  'Size': sizeIntegerArray})
+
+        if sampleWeightFloatArray is not None:
+
+            diagnosticsDataFrame['Weight'] \
+                = clusterWeightFloatArray
+
+        diagnosticsDataFrame['Radius'] \
+            = np.sqrt \
+                (np.bincount \
+                     (labelsIntegerArray,
+                      weights = rowWeightFloatArray * ownDistanceFloatArray ** 2,
+                      minlength = clusterCountInteger) \
+                 / safeClusterWeightFloatArray)
+
+        diagnosticsDataFrame['Mean Distance'] \
+            = np.bincount \
+                (labelsIntegerArray,
+                 weights = rowWeightFloatArray * ownDistanceFloatArray,
+                 minlength = clusterCountInteger) \
+              / safeClusterWeightFloatArray
+
+        diagnosticsDataFrame['Max Distance'] \
+            = maxDistanceFloatArray
+
+        diagnosticsDataFrame['Nearest Cluster'] \
+            = nearestClusterIntegerArray
+
+        diagnosticsDataFrame['Separation'] \
+            = separationFloatArray
+
+
+        return \
+            pd.concat \
+                ([diagnosticsDataFrame,
+                  pd.DataFrame \
+                      (centersFloatArray,
+                       columns = normalizedDataFrame.columns)],
+                 axis = 1)
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnClusterDiagnosticsDataFrameFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the cluster diagnostics.')
+
+        return \
+            None
+
+
+# In[17]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnRollingClusterMembershipTupleFunction
+ #
+ #  Function Description:
+ #      This function re-clusters a time-indexed series of market snapshots in
+ #      rolling windows.  The DataFrame's two-level index holds the snapshot
+ #      time and the coin, and every window holds the rows of the last window
+ #      size of snapshots.  The first window takes the cached cold fit; every
+ #      later window starts Lloyd iterations from the previous centroids, and
+ #      a Hungarian matching on the squared distances between the previous and
+ #      new centroids keeps the cluster labels stable across windows.  The
+ #      function returns an int16 DataFrame of every coin's cluster in every
+ #      snapshot (-1 when the coin is missing) and a float32 array of every
+ #      window's aligned centroids.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          snapshotDataFrame
+ #                          The parameter is the normalized DataFrame indexed by
+ #                          snapshot time and coin.
+ #  Integer
+ #          kValueInteger
+ #                          The parameter is the number of clusters.
+ #  Integer
+ #          windowSnapshotsInteger
+ #                          The parameter is the number of snapshots per window.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnRollingClusterMembershipTupleFunction \
+        (snapshotDataFrame,
+         kValueInteger,
+         windowSnapshotsInteger \
+            = None):
+
+    try:
+
+        if windowSnapshotsInteger == None:
+
+            windowSnapshotsInteger \
+                = crypto_constant.ROLLING_WINDOW_SNAPSHOTS_INTEGER
+
+
+        # These lines of code sort the rows by snapshot and coin so that every
+        # window is one contiguous slice and the row order is reproducible.
+        snapshotDataFrame \
+            = snapshotDataFrame \
+                .sort_index()
+
+        timeIndex \
+            = snapshotDataFrame.index.get_level_values(0)
+
+        snapshotIndex \
+            = timeIndex.unique()
+
+        coinIndex \
+            = snapshotDataFrame.index.get_level_values(1).unique()
+
+        snapshotCodeIntegerArray \
+            = snapshotIndex.get_indexer(timeIndex)
+
+        coinCodeIntegerArray \
+            = coinIndex \
+                .get_indexer \
+                    (snapshotDataFrame.index.get_level_values(1))
+
+        snapshotStartIntegerArray \
+            = np.searchsorted \
+                (snapshotCodeIntegerArray,
+                 np.arange(len(snapshotIndex) + 1))
+
+        featureFloatArray \
+            = snapshotDataFrame.to_numpy(dtype = np.float64)
+
+
+        membershipIntegerArray \
+            = np.full \
+                ((len(snapshotIndex), len(coinIndex)),
+                 -1,
+                 dtype = np.int16)
+
+        centersFloatArray \
+            = np.empty \
+                ((len(snapshotIndex), kValueInteger, featureFloatArray.shape[1]),
+                 dtype = np.float32)
+
+        previousCentersFloatArray \
+            = None
+
+        for snapshotInteger in range(len(snapshotIndex)):
+
+            firstRowInteger \
+                = snapshotStartIntegerArray \
+                    [max(0, snapshotInteger - windowSnapshotsInteger + 1)]
+
+            lastRowInteger \
+                = snapshotStartIntegerArray[snapshotInteger + 1]
+
+            if previousCentersFloatArray is None:
+
+                windowKMeansObject \
+                    = crypto_sweep.ReturnFittedKMeansModelFunction \
+                        (pd.DataFrame \
+                             (featureFloatArray[firstRowInteger:lastRowInteger]),
+                         kValueInteger)
+
+                labelsIntegerArray \
+                    = windowKMeansObject.labels_
+
+                previousCentersFloatArray \
+                    = windowKMeansObject.cluster_centers_
+
+            else:
+
+                windowKMeansObject \
+                    = KMeans \
+                        (n_clusters = kValueInteger,
+                         init = previousCentersFloatArray,
+                         n_init = 1,
+                         algorithm \
+                             = crypto_sweep.ReturnKMeansAlgorithmStringFunction \
+                                   (lastRowInteger - firstRowInteger,
+                                    featureFloatArray.shape[1],
+                                    kValueInteger,
+                                    1,
+                                    fullBatchFlagBoolean = True)) \
+                      .fit \
+                          (featureFloatArray[firstRowInteger:lastRowInteger])
+
+                # The new cluster matched to previous cluster i takes label i.
+                previousIndexIntegerArray, newIndexIntegerArray \
+                    = linear_sum_assignment \
+                        (((previousCentersFloatArray[:, None, :] \
+                           - windowKMeansObject.cluster_centers_[None, :, :]) ** 2) \
+                         .sum(axis = 2))
+
+                labelMapIntegerArray \
+                    = np.empty(kValueInteger, dtype = np.int64)
+
+                labelMapIntegerArray[newIndexIntegerArray] \
+                    = previousIndexIntegerArray
+
+                labelsIntegerArray \
+                    = labelMapIntegerArray[windowKMeansObject.labels_]
+
+                previousCentersFloatArray \
+                    = windowKMeansObject.cluster_centers_[newIndexIntegerArray]
+
+                log_subroutine \
+                    .PrintAndDebugWriteText \
+                        (f'The rolling window ending at {snapshotIndex[snapshotInteger]} '
+                         + f'took {windowKMeansObject.n_iter_} warm-started iterations.')
+
+
+            centersFloatArray[snapshotInteger] \
+                = previousCentersFloatArray
+
+            # The window's last snapshot rows give the snapshot's memberships.
+            snapshotFirstRowInteger \
+                = snapshotStartIntegerArray[snapshotInteger]
+
+            membershipIntegerArray \
+                [snapshotInteger,
+                 coinCodeIntegerArray[snapshotFirstRowInteger:lastRowInteger]] \
+                = labelsIntegerArray[snapshotFirstRowInteger - firstRowInteger:]
+
+
+        return \
+            pd.DataFrame \
+                (membershipIntegerArray,
+                 index = snapshotIndex,
+                 columns = coinIndex), \
+            centersFloatArray
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnRollingClusterMembershipTupleFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the rolling cluster memberships.')
+
+        return \
+            None, None
+
+
+# In[18]:
 
 
 #*******************************************************************************************
@@ -987,11 +2309,16 @@ def ReturnClusterPredictionsFunction \
  #  String
  #          yAxisNameString
  #                          The parameter is a DataFrame column name for the y-axis.
+ #  Series
+ #          sampleWeightSeries
+ #                          The parameter is the weight of every row or None.
  #
  #
  #  Date                Description                                 Programmer
  #  ---------------     ------------------------------------        ------------------
  #  11/22/2023          Initial Development                         N. James George
+ #  10/18/2026          Uses the fitted model cache                 agent
+ #  10/18/2026          Added the sample weight parameter           agent
  #
  #******************************************************************************************/
 
@@ -1001,9 +2328,16 @@ def ReturnKClustersScatterPlotFunction \
          colorsStringList,
          figureTitleString,
          xAxisNameString, 
-         yAxisNameString):
+         yAxisNameString,
+         sampleWeightSeries \
+            = None):
     
     try:
+
+        sampleWeightFloatArray \
+            = crypto_sweep.ReturnSampleWeightFloatArrayFunction \
+                (normalizedDataFrame,
+                 sampleWeightSeries)
     
         titlesStringList \
             = [f'K-Clusters for K = {n}' for n in kValueIntegerList]
@@ -1039,13 +2373,10 @@ def ReturnKClustersScatterPlotFunction \
             for columnInteger in range(1, maxColumnsInteger+1):
             
                 modelKMeansObject \
-                    = KMeans \
-                        (n_clusters = kValueIntegerList[indexInteger], 
-                         n_init = 100, 
-                         random_state = 10)
-    
-                modelKMeansObject.fit \
-                    (normalizedDataFrame)
+                    = crypto_sweep.ReturnFittedKMeansModelFunction \
+                        (normalizedDataFrame,
+                         kValueIntegerList[indexInteger],
+                         sampleWeightFloatArray = sampleWeightFloatArray)
     
                 clusterCentersDataFrame \
                     = pd.DataFrame \
@@ -1192,7 +2523,7 @@ def ReturnKClustersScatterPlotFunction \
         return None  
 
 
-# In[13]:
+# In[19]:
 
 
 #*******************************************************************************************
@@ -1223,11 +2554,16 @@ def ReturnKClustersScatterPlotFunction \
  #          columnNamesStringList
  #                          The parameter is a List of DataFrame column names 
  #                          for dimensions.
+ #  Series
+ #          sampleWeightSeries
+ #                          The parameter is the weight of every row or None.
  #
  #
  #  Date                Description                                 Programmer
  #  ---------------     ------------------------------------        ------------------
  #  11/22/2023          Initial Development                         N. James George
+ #  10/18/2026          Uses the fitted model cache                 agent
+ #  10/18/2026          Added the sample weight parameter           agent
  #
  #******************************************************************************************/
 
@@ -1236,18 +2572,20 @@ def ReturnKClusters3DScatterPlotFunction \
          kValueInteger, 
          colorsStringList,
          figureTitleString,
-         columnNamesStringList):
+         columnNamesStringList,
+         sampleWeightSeries \
+            = None):
     
     try:
     
         modelKMeansObject \
-            = KMeans \
-                (n_clusters = kValueInteger, 
-                 n_init = 100, 
-                 random_state = 10)
-    
-        modelKMeansObject.fit \
-            (normalizedDataFrame)
+            = crypto_sweep.ReturnFittedKMeansModelFunction \
+                (normalizedDataFrame,
+                 kValueInteger,
+                 sampleWeightFloatArray \
+                     = crypto_sweep.ReturnSampleWeightFloatArrayFunction \
+                           (normalizedDataFrame,
+                            sampleWeightSeries))
     
         clusterCentersDataFrame \
             = pd.DataFrame \
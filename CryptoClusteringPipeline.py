@@ -0,0 +1,1141 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# In[1]:
+
+
+#*******************************************************************************************
+ #
+ #  File Name:  CryptoClusteringPipeline.py
+ #
+ #  File Description:
+ #      This Python script, CryptoClusteringPipeline.py, contains the
+ #      CryptoClusteringPipeline class, a scale, PCA, and cluster pipeline with
+ #      cached stages, and the Python function for its stage cache.  Here is the
+ #      list:
+ #
+ #      ReturnCachedPipelineStageTupleFunction
+ #      CryptoClusteringPipeline
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     agent
+ #
+ #******************************************************************************************/
+
+import CryptoClusteringAssignment as crypto_assignment
+import CryptoClusteringConstants as crypto_constant
+import CryptoClusteringCoreset as crypto_coreset
+import CryptoClusteringFunctions as crypto_function
+import CryptoClusteringSweep as crypto_sweep
+import PyLogSubRoutines as log_subroutine
+
+import numpy as np
+import pandas as pd
+
+from sklearn.decomposition import PCA
+from sklearn.preprocessing import StandardScaler
+
+
+# In[2]:
+
+
+CONSTANT_LOCAL_FILE_NAME \
+    = 'CryptoClusteringPipeline.py'
+
+
+# In[3]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnCachedPipelineStageTupleFunction
+ #
+ #  Function Description:
+ #      This function stores a fitted pipeline stage and its output DataFrame in
+ #      the stage cache, evicts the least recently used stages once the cache
+ #      exceeds its memory cap, and returns the stage.  A stage stored under an
+ #      existing key replaces the cached stage and its byte count.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  Tuple
+ #          stageKeyTuple
+ #                          The parameter is the stage cache key.
+ #  Tuple
+ #          stageTuple
+ #                          The parameter is the fitted stage and its output
+ #                          DataFrame.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Replaces a cached stage's byte count        agent
+ #
+ #******************************************************************************************/
+
+def ReturnCachedPipelineStageTupleFunction \
+        (stageKeyTuple,
+         stageTuple):
+
+    try:
+
+        # A stage that replaces one under the same key releases that stage's
+        # bytes first.
+        if stageKeyTuple in crypto_constant.pipelineStagesOrderedDictionary:
+
+            replacedStageTuple \
+                = crypto_constant \
+                    .pipelineStagesOrderedDictionary \
+                        .pop \
+                            (stageKeyTuple)
+
+            crypto_constant.pipelineStagesCacheBytesInteger \
+                -= int(replacedStageTuple[1].memory_usage().sum())
+
+        # The output DataFrame dominates the size of a stage.
+        crypto_constant \
+            .pipelineStagesOrderedDictionary \
+                [stageKeyTuple] \
+            = stageTuple
+
+        crypto_constant.pipelineStagesCacheBytesInteger \
+            += int(stageTuple[1].memory_usage().sum())
+
+        # This repetition loop evicts the least recently used stages until the
+        # cache is within its memory cap, always keeping the newest stage.
+        while crypto_constant.pipelineStagesCacheBytesInteger \
+                > crypto_constant.PIPELINE_STAGES_MAX_BYTES_INTEGER \
+              and len(crypto_constant.pipelineStagesOrderedDictionary) > 1:
+
+            evictedKeyTuple, evictedStageTuple \
+                = crypto_constant \
+                    .pipelineStagesOrderedDictionary \
+                        .popitem \
+                            (last = False)
+
+            crypto_constant.pipelineStagesCacheBytesInteger \
+                -= int(evictedStageTuple[1].memory_usage().sum())
+
+
+        return stageTuple
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnCachedPipelineStageTupleFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to cache a fitted pipeline stage.')
+
+        return \
+            None
+
+
+# In[4]:
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  CryptoClusteringPipeline
+ #
+ #  Class Description:
+ #      This class runs the scale, PCA, and cluster stages of the analysis on an
+ #      input DataFrame.  The fitted scaler and PCA and their output DataFrames
+ #      are cached by the content hash of the stage input and the stage
+ #      parameters in a stage cache with a memory cap, and the per-k models and
+ #      sweep results come from the shared model and k-sweep caches, so a re-run
+ #      with a changed k value List or plotting options repeats only the stages
+ #      whose input changed.
+ #
+ #
+ #  Class Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  Integer
+ #          pcaComponentsInteger
+ #                          The parameter is the number of principal components
+ #                          (None clusters the scaled DataFrame).
+ #  List
+ #          kValueIntegerList
+ #                          The parameter is the default List of k values.
+ #  String
+ #          engineString
+ #                          The parameter is the clustering engine ('kmeans',
+ #                          'ward', 'coreset', or 'minibatch').
+ #  String
+ #          silhouetteModeString
+ #                          The parameter is the silhouette mode ('auto',
+ #                          'exact', 'sampled', or 'simplified').
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Added plot methods and a stage cache cap    agent
+ #
+ #******************************************************************************************/
+
+class CryptoClusteringPipeline:
+
+    def __init__ \
+            (self,
+             pcaComponentsInteger \
+                = crypto_constant.PIPELINE_PCA_COMPONENTS_INTEGER,
+             kValueIntegerList \
+                = None,
+             engineString \
+                = None,
+             silhouetteModeString \
+                = None):
+
+        self.pcaComponentsInteger \
+            = pcaComponentsInteger
+
+        self.kValueIntegerList \
+            = kValueIntegerList
+
+        self.engineString \
+            = engineString
+
+        self.silhouetteModeString \
+            = silhouetteModeString
+
+
+    #*******************************************************************************************
+     #
+     #  Function Name:  ReturnScalerStageTuple
+     #
+     #  Function Description:
+     #      This function returns the fitted StandardScaler and the scaled input
+     #      DataFrame from the stage cache and fits the scaler only for a new
+     #      input.
+     #
+     #
+     #  Function Parameters:
+     #
+     #  Type    Name            Description
+     #  -----   -------------   ----------------------------------------------
+     #  DataFrame
+     #          inputDataFrame
+     #                          The parameter is the input DataFrame.
+     #
+     #
+     #  Date                Description                                 Programmer
+     #  ---------------     ------------------------------------        ------------------
+     #  10/18/2026          Initial Development                         agent
+     #
+     #******************************************************************************************/
+
+    def ReturnScalerStageTuple \
+            (self,
+             inputDataFrame):
+
+        try:
+
+            stageKeyTuple \
+                = ('scaler',
+                   crypto_sweep.ReturnDataFrameContentHashStringFunction \
+                       (inputDataFrame))
+
+            # If the stage is in the cache, this block of code marks it as the
+            # most recently used and returns it.
+            if stageKeyTuple in crypto_constant.pipelineStagesOrderedDictionary:
+
+                log_subroutine \
+                    .PrintAndDebugWriteText \
+                        ('The pipeline reused the fitted scaler.')
+
+                crypto_constant \
+                    .pipelineStagesOrderedDictionary \
+                        .move_to_end \
+                            (stageKeyTuple)
+
+                return \
+                    crypto_constant \
+                        .pipelineStagesOrderedDictionary \
+                            [stageKeyTuple]
+
+
+            scalerObject \
+                = StandardScaler() \
+                    .fit \
+                        (inputDataFrame)
+
+
+            return \
+                ReturnCachedPipelineStageTupleFunction \
+                    (stageKeyTuple,
+                     (scalerObject,
+                      pd.DataFrame \
+                          (scalerObject.transform(inputDataFrame),
+                           index = inputDataFrame.index,
+                           columns = inputDataFrame.columns)))
+
+        except:
+
+            log_subroutine \
+                .PrintAndLogWriteText \
+                    (f'The function, CryptoClusteringPipeline.ReturnScalerStageTuple, '
+                     + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                     + f'was unable to return the scaler stage.')
+
+            return \
+                None
+
+
+    #*******************************************************************************************
+     #
+     #  Function Name:  ReturnPCAStageTuple
+     #
+     #  Function Description:
+     #      This function returns the fitted PCA and its principal components,
+     #      PCA1, PCA2, and so on, for a scaled DataFrame from the stage cache
+     #      and fits the PCA only for a new scaled input or component count.
+     #
+     #
+     #  Function Parameters:
+     #
+     #  Type    Name            Description
+     #  -----   -------------   ----------------------------------------------
+     #  DataFrame
+     #          scaledDataFrame
+     #                          The parameter is the scaled input DataFrame.
+     #
+     #
+     #  Date                Description                                 Programmer
+     #  ---------------     ------------------------------------        ------------------
+     #  10/18/2026          Initial Development                         agent
+     #
+     #******************************************************************************************/
+
+    def ReturnPCAStageTuple \
+            (self,
+             scaledDataFrame):
+
+        try:
+
+            stageKeyTuple \
+                = ('pca',
+                   crypto_sweep.ReturnDataFrameContentHashStringFunction \
+                       (scaledDataFrame),
+                   self.pcaComponentsInteger,
+                   crypto_constant.RANDOM_STATE_INTEGER)
+
+            # If the stage is in the cache, this block of code marks it as the
+            # most recently used and returns it.
+            if stageKeyTuple in crypto_constant.pipelineStagesOrderedDictionary:
+
+                log_subroutine \
+                    .PrintAndDebugWriteText \
+                        ('The pipeline reused the fitted PCA.')
+
+                crypto_constant \
+                    .pipelineStagesOrderedDictionary \
+                        .move_to_end \
+                            (stageKeyTuple)
+
+                return \
+                    crypto_constant \
+                        .pipelineStagesOrderedDictionary \
+                            [stageKeyTuple]
+
+
+            pcaObject \
+                = PCA \
+                    (n_components = self.pcaComponentsInteger,
+                     random_state = crypto_constant.RANDOM_STATE_INTEGER) \
+                  .fit \
+                      (scaledDataFrame)
+
+
+            return \
+                ReturnCachedPipelineStageTupleFunction \
+                    (stageKeyTuple,
+                     (pcaObject,
+                      pd.DataFrame \
+                          (pcaObject.transform(scaledDataFrame),
+                           index = scaledDataFrame.index,
+                           columns \
+                               = [f'PCA{componentInteger + 1}'
+                                  for componentInteger \
+                                      in range(pcaObject.n_components_)])))
+
+        except:
+
+            log_subroutine \
+                .PrintAndLogWriteText \
+                    (f'The function, CryptoClusteringPipeline.ReturnPCAStageTuple, '
+                     + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                     + f'was unable to return the PCA stage.')
+
+            return \
+                None
+
+
+    #*******************************************************************************************
+     #
+     #  Function Name:  ReturnScaledDataFrame
+     #
+     #  Function Description:
+     #      This function returns the input DataFrame scaled with a StandardScaler
+     #      and fits the scaler only for a new input.
+     #
+     #
+     #  Function Parameters:
+     #
+     #  Type    Name            Description
+     #  -----   -------------   ----------------------------------------------
+     #  DataFrame
+     #          inputDataFrame
+     #                          The parameter is the input DataFrame.
+     #
+     #
+     #  Date                Description                                 Programmer
+     #  ---------------     ------------------------------------        ------------------
+     #  10/18/2026          Initial Development                         agent
+     #  10/18/2026          Reads the scaler stage                      agent
+     #
+     #******************************************************************************************/
+
+    def ReturnScaledDataFrame \
+            (self,
+             inputDataFrame):
+
+        try:
+
+            return \
+                self.ReturnScalerStageTuple \
+                    (inputDataFrame)[1]
+
+        except:
+
+            log_subroutine \
+                .PrintAndLogWriteText \
+                    (f'The function, CryptoClusteringPipeline.ReturnScaledDataFrame, '
+                     + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                     + f'was unable to return the scaled DataFrame.')
+
+            return \
+                None
+
+
+    #*******************************************************************************************
+     #
+     #  Function Name:  ReturnFeatureDataFrame
+     #
+     #  Function Description:
+     #      This function returns the DataFrame that the pipeline clusters: the
+     #      scaled input or its principal components, PCA1, PCA2, and so on.  The
+     #      PCA is fitted only for a new scaled input or component count.
+     #
+     #
+     #  Function Parameters:
+     #
+     #  Type    Name            Description
+     #  -----   -------------   ----------------------------------------------
+     #  DataFrame
+     #          inputDataFrame
+     #                          The parameter is the input DataFrame.
+     #
+     #
+     #  Date                Description                                 Programmer
+     #  ---------------     ------------------------------------        ------------------
+     #  10/18/2026          Initial Development                         agent
+     #  10/18/2026          Reads the scaler and PCA stages             agent
+     #
+     #******************************************************************************************/
+
+    def ReturnFeatureDataFrame \
+            (self,
+             inputDataFrame):
+
+        try:
+
+            scaledDataFrame \
+                = self.ReturnScaledDataFrame \
+                    (inputDataFrame)
+
+            if self.pcaComponentsInteger == None:
+
+                return scaledDataFrame
+
+
+            return \
+                self.ReturnPCAStageTuple \
+                    (scaledDataFrame)[1]
+
+        except:
+
+            log_subroutine \
+                .PrintAndLogWriteText \
+                    (f'The function, CryptoClusteringPipeline.ReturnFeatureDataFrame, '
+                     + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                     + f'was unable to return the feature DataFrame.')
+
+            return \
+                None
+
+
+    #*******************************************************************************************
+     #
+     #  Function Name:  ReturnFittedStagesDictionary
+     #
+     #  Function Description:
+     #      This function returns a Dictionary of the fitted scaler and PCA (None
+     #      without a PCA stage) for an input DataFrame.
+     #
+     #
+     #  Function Parameters:
+     #
+     #  Type    Name            Description
+     #  -----   -------------   ----------------------------------------------
+     #  DataFrame
+     #          inputDataFrame
+     #                          The parameter is the input DataFrame.
+     #
+     #
+     #  Date                Description                                 Programmer
+     #  ---------------     ------------------------------------        ------------------
+     #  10/18/2026          Initial Development                         agent
+     #  10/18/2026          Reads the scaler and PCA stages             agent
+     #
+     #******************************************************************************************/
+
+    def ReturnFittedStagesDictionary \
+            (self,
+             inputDataFrame):
+
+        try:
+
+            scalerObject, scaledDataFrame \
+                = self.ReturnScalerStageTuple \
+                    (inputDataFrame)
+
+            pcaObject \
+                = None
+
+            if self.pcaComponentsInteger != None:
+
+                pcaObject \
+                    = self.ReturnPCAStageTuple \
+                        (scaledDataFrame)[0]
+
+
+            return \
+                {'scaler': scalerObject,
+                 'pca': pcaObject}
+
+        except:
+
+            log_subroutine \
+                .PrintAndLogWriteText \
+                    (f'The function, CryptoClusteringPipeline.ReturnFittedStagesDictionary, '
+                     + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                     + f'was unable to return the fitted stages.')
+
+            return \
+                None
+
+
+    #*******************************************************************************************
+     #
+     #  Function Name:  ReturnSweepDictionary
+     #
+     #  Function Description:
+     #      This function returns the k-sweep results for the feature DataFrame
+     #      with the pipeline's engine and silhouette mode.
+     #
+     #
+     #  Function Parameters:
+     #
+     #  Type    Name            Description
+     #  -----   -------------   ----------------------------------------------
+     #  DataFrame
+     #          inputDataFrame
+     #                          The parameter is the input DataFrame.
+     #  List
+     #          kValueIntegerList
+     #                          The parameter is a List of k values (None uses
+     #                          the pipeline's List).
+     #  Series
+     #          sampleWeightSeries
+     #                          The parameter is the weight of every row or None.
+     #
+     #
+     #  Date                Description                                 Programmer
+     #  ---------------     ------------------------------------        ------------------
+     #  10/18/2026          Initial Development                         agent
+     #
+     #******************************************************************************************/
+
+    def ReturnSweepDictionary \
+            (self,
+             inputDataFrame,
+             kValueIntegerList \
+                = None,
+             sampleWeightSeries \
+                = None):
+
+        try:
+
+            if kValueIntegerList == None:
+
+                kValueIntegerList \
+                    = self.kValueIntegerList
+
+
+            return \
+                crypto_function.ReturnSweepDictionaryFunction \
+                    (self.ReturnFeatureDataFrame \
+                         (inputDataFrame),
+                     kValueIntegerList = kValueIntegerList,
+                     silhouetteModeString = self.silhouetteModeString,
+                     engineString = self.engineString,
+                     sampleWeightSeries = sampleWeightSeries)
+
+        except:
+
+            log_subroutine \
+                .PrintAndLogWriteText \
+                    (f'The function, CryptoClusteringPipeline.ReturnSweepDictionary, '
+                     + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                     + f'was unable to return the k-sweep results.')
+
+            return \
+                None
+
+
+    #*******************************************************************************************
+     #
+     #  Function Name:  ReturnOptimalKDictionary
+     #
+     #  Function Description:
+     #      This function returns a Dictionary of the optimal k values of the
+     #      WCSS Elbow, Calinski-Harabasz, Silhouette, and Davies-Bouldin methods.
+     #
+     #
+     #  Function Parameters:
+     #
+     #  Type    Name            Description
+     #  -----   -------------   ----------------------------------------------
+     #  DataFrame
+     #          inputDataFrame
+     #                          The parameter is the input DataFrame.
+     #  List
+     #          kValueIntegerList
+     #                          The parameter is a List of k values (None uses
+     #                          the pipeline's List).
+     #  Series
+     #          sampleWeightSeries
+     #                          The parameter is the weight of every row or None.
+     #
+     #
+     #  Date                Description                                 Programmer
+     #  ---------------     ------------------------------------        ------------------
+     #  10/18/2026          Initial Development                         agent
+     #
+     #******************************************************************************************/
+
+    def ReturnOptimalKDictionary \
+            (self,
+             inputDataFrame,
+             kValueIntegerList \
+                = None,
+             sampleWeightSeries \
+                = None):
+
+        try:
+
+            sweepDictionary \
+                = self.ReturnSweepDictionary \
+                    (inputDataFrame,
+                     kValueIntegerList,
+                     sampleWeightSeries)
+
+
+            return \
+                {methodString: int(sweepDictionary[methodString][0])
+                 for methodString \
+                     in ['Wcss Elbow',
+                         'Calinski Harabasz',
+                         'Silhouette',
+                         'Davies Bouldin']}
+
+        except:
+
+            log_subroutine \
+                .PrintAndLogWriteText \
+                    (f'The function, CryptoClusteringPipeline.ReturnOptimalKDictionary, '
+                     + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                     + f'was unable to return the optimal k values.')
+
+            return \
+                None
+
+
+    #*******************************************************************************************
+     #
+     #  Function Name:  ReturnClusterPredictions
+     #
+     #  Function Description:
+     #      This function returns the cluster predictions for the feature
+     #      DataFrame from the cached per-k models.
+     #
+     #
+     #  Function Parameters:
+     #
+     #  Type    Name            Description
+     #  -----   -------------   ----------------------------------------------
+     #  DataFrame
+     #          inputDataFrame
+     #                          The parameter is the input DataFrame.
+     #  List
+     #          kValueIntegerList
+     #                          The parameter is a List of optimal K values.
+     #  Series
+     #          sampleWeightSeries
+     #                          The parameter is the weight of every row or None.
+     #
+     #
+     #  Date                Description                                 Programmer
+     #  ---------------     ------------------------------------        ------------------
+     #  10/18/2026          Initial Development                         agent
+     #
+     #******************************************************************************************/
+
+    def ReturnClusterPredictions \
+            (self,
+             inputDataFrame,
+             kValueIntegerList,
+             sampleWeightSeries \
+                = None):
+
+        try:
+
+            return \
+                crypto_function.ReturnClusterPredictionsFunction \
+                    (self.ReturnFeatureDataFrame \
+                         (inputDataFrame),
+                     kValueIntegerList,
+                     engineString = self.engineString,
+                     sampleWeightSeries = sampleWeightSeries)
+
+        except:
+
+            log_subroutine \
+                .PrintAndLogWriteText \
+                    (f'The function, CryptoClusteringPipeline.ReturnClusterPredictions, '
+                     + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                     + f'was unable to return the cluster predictions.')
+
+            return \
+                None
+
+
+    #*******************************************************************************************
+     #
+     #  Function Name:  ReturnSweepPlots
+     #
+     #  Function Description:
+     #      This function returns the line plots of the k-sweep's WCSS Elbow,
+     #      Calinski-Harabasz, Silhouette, and Davies-Bouldin scores for the
+     #      feature DataFrame for display.
+     #
+     #
+     #  Function Parameters:
+     #
+     #  Type    Name            Description
+     #  -----   -------------   ----------------------------------------------
+     #  DataFrame
+     #          inputDataFrame
+     #                          The parameter is the input DataFrame.
+     #  List
+     #          lineColorsStringList
+     #                          The parameter is a List of colors for the lines.
+     #  String
+     #          figureTitleString
+     #                          The parameter is a figure title.
+     #  List
+     #          kValueIntegerList
+     #                          The parameter is a List of k values (None uses
+     #                          the pipeline's List).
+     #  Series
+     #          sampleWeightSeries
+     #                          The parameter is the weight of every row or None.
+     #
+     #
+     #  Date                Description                                 Programmer
+     #  ---------------     ------------------------------------        ------------------
+     #  10/18/2026          Initial Development                         agent
+     #
+     #******************************************************************************************/
+
+    def ReturnSweepPlots \
+            (self,
+             inputDataFrame,
+             lineColorsStringList,
+             figureTitleString,
+             kValueIntegerList \
+                = None,
+             sampleWeightSeries \
+                = None):
+
+        try:
+
+            sweepDictionary \
+                = self.ReturnSweepDictionary \
+                    (inputDataFrame,
+                     kValueIntegerList,
+                     sampleWeightSeries)
+
+            methodStringList \
+                = ['Wcss Elbow',
+                   'Calinski Harabasz',
+                   'Silhouette',
+                   'Davies Bouldin']
+
+
+            return \
+                crypto_function.ReturnClusterPlotsFunction \
+                    ([sweepDictionary[methodString][0]
+                      for methodString in methodStringList],
+                     [sweepDictionary[methodString][1]
+                      for methodString in methodStringList],
+                     lineColorsStringList,
+                     figureTitleString)
+
+        except:
+
+            log_subroutine \
+                .PrintAndLogWriteText \
+                    (f'The function, CryptoClusteringPipeline.ReturnSweepPlots, '
+                     + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                     + f'was unable to return the k-sweep plots for display.')
+
+            return \
+                None
+
+
+    #*******************************************************************************************
+     #
+     #  Function Name:  ReturnKClustersScatterPlot
+     #
+     #  Function Description:
+     #      This function returns a group of k-cluster scatter plots of the
+     #      feature DataFrame for display.  The plots show the k-means clusters
+     #      of the shared model cache whatever the pipeline's engine.
+     #
+     #
+     #  Function Parameters:
+     #
+     #  Type    Name            Description
+     #  -----   -------------   ----------------------------------------------
+     #  DataFrame
+     #          inputDataFrame
+     #                          The parameter is the input DataFrame.
+     #  List
+     #          kValueIntegerList
+     #                          The parameter is a List of optimal K values.
+     #  List
+     #          colorsStringList
+     #                          The parameter is a List of colors for the plots.
+     #  String
+     #          figureTitleString
+     #                          The parameter is a figure title.
+     #  String
+     #          xAxisNameString
+     #                          The parameter is a feature column name for the
+     #                          x-axis (None uses the first column).
+     #  String
+     #          yAxisNameString
+     #                          The parameter is a feature column name for the
+     #                          y-axis (None uses the second column).
+     #  Series
+     #          sampleWeightSeries
+     #                          The parameter is the weight of every row or None.
+     #
+     #
+     #  Date                Description                                 Programmer
+     #  ---------------     ------------------------------------        ------------------
+     #  10/18/2026          Initial Development                         agent
+     #
+     #******************************************************************************************/
+
+    def ReturnKClustersScatterPlot \
+            (self,
+             inputDataFrame,
+             kValueIntegerList,
+             colorsStringList,
+             figureTitleString,
+             xAxisNameString \
+                = None,
+             yAxisNameString \
+                = None,
+             sampleWeightSeries \
+                = None):
+
+        try:
+
+            featureDataFrame \
+                = self.ReturnFeatureDataFrame \
+                    (inputDataFrame)
+
+            if xAxisNameString == None:
+
+                xAxisNameString \
+                    = featureDataFrame.columns[0]
+
+            if yAxisNameString == None:
+
+                yAxisNameString \
+                    = featureDataFrame.columns[1]
+
+
+            return \
+                crypto_function.ReturnKClustersScatterPlotFunction \
+                    (featureDataFrame,
+                     kValueIntegerList,
+                     colorsStringList,
+                     figureTitleString,
+                     xAxisNameString,
+                     yAxisNameString,
+                     sampleWeightSeries)
+
+        except:
+
+            log_subroutine \
+                .PrintAndLogWriteText \
+                    (f'The function, CryptoClusteringPipeline.ReturnKClustersScatterPlot, '
+                     + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                     + f'was unable to return a K-Clusters scatter plot for display.')
+
+            return \
+                None
+
+
+    #*******************************************************************************************
+     #
+     #  Function Name:  ReturnKClusters3DScatterPlot
+     #
+     #  Function Description:
+     #      This function returns a 3-D k-cluster scatter plot of the feature
+     #      DataFrame for display.  The plot shows the k-means clusters of the
+     #      shared model cache whatever the pipeline's engine.
+     #
+     #
+     #  Function Parameters:
+     #
+     #  Type    Name            Description
+     #  -----   -------------   ----------------------------------------------
+     #  DataFrame
+     #          inputDataFrame
+     #                          The parameter is the input DataFrame.
+     #  Integer
+     #          kValueInteger
+     #                          The parameter is an optimal k value.
+     #  List
+     #          colorsStringList
+     #                          The parameter is a List of colors for the plots.
+     #  String
+     #          figureTitleString
+     #                          The parameter is a figure title.
+     #  List
+     #          columnNamesStringList
+     #                          The parameter is a List of feature column names
+     #                          for dimensions (None uses the first three).
+     #  Series
+     #          sampleWeightSeries
+     #                          The parameter is the weight of every row or None.
+     #
+     #
+     #  Date                Description                                 Programmer
+     #  ---------------     ------------------------------------        ------------------
+     #  10/18/2026          Initial Development                         agent
+     #
+     #******************************************************************************************/
+
+    def ReturnKClusters3DScatterPlot \
+            (self,
+             inputDataFrame,
+             kValueInteger,
+             colorsStringList,
+             figureTitleString,
+             columnNamesStringList \
+                = None,
+             sampleWeightSeries \
+                = None):
+
+        try:
+
+            featureDataFrame \
+                = self.ReturnFeatureDataFrame \
+                    (inputDataFrame)
+
+            if columnNamesStringList == None:
+
+                columnNamesStringList \
+                    = list(featureDataFrame.columns[:3])
+
+
+            return \
+                crypto_function.ReturnKClusters3DScatterPlotFunction \
+                    (featureDataFrame,
+                     kValueInteger,
+                     colorsStringList,
+                     figureTitleString,
+                     columnNamesStringList,
+                     sampleWeightSeries)
+
+        except:
+
+            log_subroutine \
+                .PrintAndLogWriteText \
+                    (f'The function, CryptoClusteringPipeline.ReturnKClusters3DScatterPlot, '
+                     + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                     + f'was unable to return a 3D K-Clusters scatter plot for display.')
+
+            return \
+                None
+
+
+    #*******************************************************************************************
+     #
+     #  Function Name:  SaveClusterModel
+     #
+     #  Function Description:
+     #      This function saves the fitted scaler, the PCA, and the centroids of
+     #      the pipeline engine's model for a k value to an npz file for the
+     #      assignment functions in CryptoClusteringAssignment.py: the k-means
+     #      model, the coreset engine's refined model, or the mini-batch
+     #      engine's model.  The Ward engine has no centroid model, so the
+     #      function logs the request and saves nothing.
+     #
+     #
+     #  Function Parameters:
+     #
+     #  Type    Name            Description
+     #  -----   -------------   ----------------------------------------------
+     #  DataFrame
+     #          inputDataFrame
+     #                          The parameter is the input DataFrame.
+     #  Integer
+     #          kValueInteger
+     #                          The parameter is the number of clusters.
+     #  String
+     #          filePathString
+     #                          The parameter is the npz file path.
+     #  Series
+     #          sampleWeightSeries
+     #                          The parameter is the weight of every row or None.
+     #
+     #
+     #  Date                Description                                 Programmer
+     #  ---------------     ------------------------------------        ------------------
+     #  10/18/2026          Initial Development                         agent
+     #  10/18/2026          Saves the model of the pipeline's engine    agent
+     #
+     #******************************************************************************************/
+
+    def SaveClusterModel \
+            (self,
+             inputDataFrame,
+             kValueInteger,
+             filePathString,
+             sampleWeightSeries \
+                = None):
+
+        try:
+
+            engineString \
+                = self.engineString
+
+            if engineString == None:
+
+                engineString \
+                    = crypto_constant.CLUSTERING_ENGINE_STRING
+
+            if engineString == 'ward':
+
+                log_subroutine \
+                    .PrintAndLogWriteText \
+                        (f'The function, CryptoClusteringPipeline.SaveClusterModel, '
+                         + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                         + f'cannot save a model for the Ward engine, which has no centroids.')
+
+                return
+
+
+            fittedStagesDictionary \
+                = self.ReturnFittedStagesDictionary \
+                    (inputDataFrame)
+
+            featureDataFrame \
+                = self.ReturnFeatureDataFrame \
+                    (inputDataFrame)
+
+            sampleWeightFloatArray \
+                = crypto_sweep.ReturnSampleWeightFloatArrayFunction \
+                    (featureDataFrame,
+                     sampleWeightSeries)
+
+            if engineString == 'coreset':
+
+                modelKMeansObject \
+                    = crypto_coreset.ReturnRefinedCoresetKMeansModelFunction \
+                        (featureDataFrame,
+                         kValueInteger,
+                         sampleWeightFloatArray)
+
+            elif engineString == 'minibatch':
+
+                if sampleWeightFloatArray is not None:
+
+                    log_subroutine \
+                        .PrintAndLogWriteText \
+                            (f'The function, CryptoClusteringPipeline.SaveClusterModel, '
+                             + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                             + f'ignores the sample weights in the minibatch engine.')
+
+                modelKMeansObject \
+                    = crypto_sweep.ReturnMiniBatchKMeansModelFunction \
+                        (featureDataFrame.to_numpy(dtype = np.float64),
+                         kValueInteger)
+
+            else:
+
+                modelKMeansObject \
+                    = crypto_sweep.ReturnFittedKMeansModelFunction \
+                        (featureDataFrame,
+                         kValueInteger,
+                         sampleWeightFloatArray = sampleWeightFloatArray)
+
+
+            crypto_assignment \
+                .SaveClusterModelFunction \
+                    (filePathString,
+                     modelKMeansObject.cluster_centers_,
+                     fittedStagesDictionary['scaler'],
+                     fittedStagesDictionary['pca'],
+                     list(inputDataFrame.columns))
+
+        except:
+
+            log_subroutine \
+                .PrintAndLogWriteText \
+                    (f'The function, CryptoClusteringPipeline.SaveClusterModel, '
+                     + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                     + f'was unable to save the cluster model.')
+
+
+# In[ ]:
+
+
+
+
@@ -0,0 +1,515 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# In[1]:
+
+
+#*******************************************************************************************
+ #
+ #  File Name:  CryptoClusteringSharedMemory.py
+ #
+ #  File Description:
+ #      This Python script, CryptoClusteringSharedMemory.py, contains the
+ #      Python functions and subroutines that publish a feature matrix to the
+ #      process pool workers through shared memory, attach the workers to it, and
+ #      run and shut down the pool's tasks.  Here is the list:
+ #
+ #      ReturnSharedFeatureMatrixTupleFunction
+ #      AttachSharedFeatureMatrix
+ #      DetachSharedFeatureMatrices
+ #      InitializeFeatureMatrixWorker
+ #      ReturnFeatureDataFrameFunction
+ #      ShutdownFeatureMatrixExecutor
+ #      ReturnTaskResultsListFunction
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     agent
+ #
+ #******************************************************************************************/
+
+import CryptoClusteringConstants as crypto_constant
+import PyLogSubRoutines as log_subroutine
+
+import gc
+
+import numpy as np
+import pandas as pd
+
+from multiprocessing import shared_memory, util
+
+
+# In[2]:
+
+
+CONSTANT_LOCAL_FILE_NAME \
+    = 'CryptoClusteringSharedMemory.py'
+
+
+# In[3]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnSharedFeatureMatrixTupleFunction
+ #
+ #  Function Description:
+ #      This function copies the values of a DataFrame once into a contiguous
+ #      NumPy block in shared memory and returns the SharedMemory object and a
+ #      small descriptor Dictionary.  Worker processes receive the descriptor
+ #      instead of the DataFrame and attach to the block without copying it.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          normalizedDataFrame
+ #                          The parameter is the normalized input DataFrame.
+ #  String
+ #          dtypeString
+ #                          The parameter is the block data type ('float64'
+ #                          or 'float32').
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnSharedFeatureMatrixTupleFunction \
+        (normalizedDataFrame,
+         dtypeString \
+            = None):
+
+    try:
+
+        if dtypeString == None:
+
+            dtypeString \
+                = crypto_constant.SHARED_MEMORY_DTYPE_STRING
+
+
+        featureFloatArray \
+            = normalizedDataFrame \
+                .to_numpy \
+                    (dtype = dtypeString)
+
+        sharedMemoryObject \
+            = shared_memory.SharedMemory \
+                (create = True,
+                 size = max(featureFloatArray.nbytes, 1))
+
+        sharedFloatArray \
+            = np.ndarray \
+                (featureFloatArray.shape,
+                 dtype = dtypeString,
+                 buffer = sharedMemoryObject.buf)
+
+        sharedFloatArray[:] \
+            = featureFloatArray
+
+        descriptorDictionary \
+            = {'name': sharedMemoryObject.name,
+               'shape': featureFloatArray.shape,
+               'dtype': dtypeString,
+               'columns': list(normalizedDataFrame.columns)}
+
+
+        return sharedMemoryObject, descriptorDictionary
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnSharedFeatureMatrixTupleFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a shared feature matrix.')
+
+        return \
+            None, None
+
+
+# In[4]:
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  AttachSharedFeatureMatrix
+ #
+ #  Subroutine Description:
+ #      This subroutine is the process pool initializer: it attaches the worker
+ #      process to a shared feature matrix once and keeps a zero-copy DataFrame
+ #      view of it for the tasks.
+ #
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  Dictionary
+ #          descriptorDictionary
+ #                          The parameter is the shared feature matrix descriptor.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def AttachSharedFeatureMatrix \
+        (descriptorDictionary):
+
+    try:
+
+        sharedMemoryObject \
+            = shared_memory.SharedMemory \
+                (name = descriptorDictionary['name'])
+
+        sharedFloatArray \
+            = np.ndarray \
+                (descriptorDictionary['shape'],
+                 dtype = descriptorDictionary['dtype'],
+                 buffer = sharedMemoryObject.buf)
+
+        crypto_constant \
+            .attachedFeatureMatrixDictionary \
+                [descriptorDictionary['name']] \
+            = (sharedMemoryObject,
+               pd.DataFrame \
+                   (sharedFloatArray,
+                    columns = descriptorDictionary['columns'],
+                    copy = False))
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The subroutine, AttachSharedFeatureMatrix, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to attach to shared feature matrix, '
+                 + f'{descriptorDictionary["name"]}.')
+
+
+# In[5]:
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  DetachSharedFeatureMatrices
+ #
+ #  Subroutine Description:
+ #      This subroutine drops the DataFrame views of the shared feature matrices
+ #      that this process attached to and closes their shared memory handles.
+ #      The process that created a shared feature matrix still unlinks it.
+ #
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def DetachSharedFeatureMatrices():
+
+    try:
+
+        sharedMemoryObjectList \
+            = [attachedTuple[0] \
+               for attachedTuple \
+                   in crypto_constant.attachedFeatureMatrixDictionary.values()]
+
+        crypto_constant \
+            .attachedFeatureMatrixDictionary \
+                .clear()
+
+        # A handle closes only once no view of its buffer is left.
+        gc.collect()
+
+        for sharedMemoryObject in sharedMemoryObjectList:
+
+            sharedMemoryObject \
+                .close()
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The subroutine, DetachSharedFeatureMatrices, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to detach from the shared feature matrices.')
+
+
+# In[6]:
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  InitializeFeatureMatrixWorker
+ #
+ #  Subroutine Description:
+ #      This subroutine is the process pool initializer: it attaches the worker
+ #      process to the shared feature matrix and installs this process's k-means
+ #      backend cost model, so tasks that resolve the 'auto' backend do not
+ #      calibrate it again in every worker.  The worker closes every shared
+ #      feature matrix it attached to when it exits.
+ #
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  Dictionary
+ #          descriptorDictionary
+ #                          The parameter is the shared feature matrix descriptor.
+ #  Dictionary
+ #          backendCostModelDictionary
+ #                          The parameter is the backend cost model or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Closes the attached matrices at exit        agent
+ #
+ #******************************************************************************************/
+
+def InitializeFeatureMatrixWorker \
+        (descriptorDictionary,
+         backendCostModelDictionary):
+
+    try:
+
+        # Pool workers leave through os._exit, which skips the atexit hooks but
+        # runs the multiprocessing exit finalizers.
+        util.Finalize \
+            (None,
+             DetachSharedFeatureMatrices,
+             exitpriority = 0)
+
+        AttachSharedFeatureMatrix \
+            (descriptorDictionary)
+
+        if backendCostModelDictionary != None:
+
+            crypto_constant.backendCostModelDictionary \
+                = backendCostModelDictionary
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The subroutine, InitializeFeatureMatrixWorker, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to initialize a worker process.')
+
+
+# In[7]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnFeatureDataFrameFunction
+ #
+ #  Function Description:
+ #      This function returns the DataFrame for a task's feature source: the
+ #      DataFrame itself in this process or the zero-copy view of the shared
+ #      feature matrix in a worker process.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame or Dictionary
+ #          featureSourceObject
+ #                          The parameter is a DataFrame or a shared feature
+ #                          matrix descriptor.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnFeatureDataFrameFunction \
+        (featureSourceObject):
+
+    try:
+
+        if isinstance(featureSourceObject, pd.DataFrame):
+
+            return featureSourceObject
+
+
+        if featureSourceObject['name'] \
+                not in crypto_constant.attachedFeatureMatrixDictionary:
+
+            AttachSharedFeatureMatrix \
+                (featureSourceObject)
+
+
+        return \
+            crypto_constant \
+                .attachedFeatureMatrixDictionary \
+                    [featureSourceObject['name']][1]
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnFeatureDataFrameFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a feature DataFrame.')
+
+        return \
+            None
+
+
+# In[8]:
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  ShutdownFeatureMatrixExecutor
+ #
+ #  Subroutine Description:
+ #      This subroutine shuts down a process pool and then releases the shared
+ #      feature matrix behind it.
+ #
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  ProcessPoolExecutor
+ #          executorObject
+ #                          The parameter is the process pool or None.
+ #  SharedMemory
+ #          sharedMemoryObject
+ #                          The parameter is the shared memory or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ShutdownFeatureMatrixExecutor \
+        (executorObject,
+         sharedMemoryObject):
+
+    try:
+
+        if executorObject != None:
+
+            executorObject \
+                .shutdown()
+
+        if sharedMemoryObject != None:
+
+            sharedMemoryObject \
+                .close()
+
+            sharedMemoryObject \
+                .unlink()
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The subroutine, ShutdownFeatureMatrixExecutor, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to shut down a process pool.')
+
+
+# In[9]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnTaskResultsListFunction
+ #
+ #  Function Description:
+ #      This function runs a task function once for every argument Tuple and
+ #      returns the results in argument order.  It runs the tasks in a process
+ #      pool if it receives one and in this process otherwise.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  ProcessPoolExecutor
+ #          executorObject
+ #                          The parameter is the process pool or None.
+ #  Function
+ #          taskFunction
+ #                          The parameter is a module-level task function.
+ #  List
+ #          argumentTupleList
+ #                          The parameter is a List of argument Tuples.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnTaskResultsListFunction \
+        (executorObject,
+         taskFunction,
+         argumentTupleList):
+
+    try:
+
+        if executorObject == None:
+
+            return \
+                [taskFunction(*argumentTuple) \
+                 for argumentTuple in argumentTupleList]
+
+
+        futureObjectList \
+            = [executorObject \
+                   .submit \
+                       (taskFunction,
+                        *argumentTuple)
+               for argumentTuple in argumentTupleList]
+
+
+        return \
+            [futureObject.result() \
+             for futureObject in futureObjectList]
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnTaskResultsListFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the task results.')
+
+        return \
+            None
+
+
+# In[ ]:
+
+
+
+
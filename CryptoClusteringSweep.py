@@ -0,0 +1,5150 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# In[1]:
+
+
+#*******************************************************************************************
+ #
+ #  File Name:  CryptoClusteringSweep.py
+ #
+ #  File Description:
+ #      This Python script, CryptoClusteringSweep.py, contains the Python
+ #      functions for the k-means fits and the fitted model cache, the cluster
+ #      scores, and the full-batch, warm-started, and mini-batch k-sweeps with
+ #      their feature reductions for the model selection functions in
+ #      CryptoClusteringFunctions.py.  The script imports no plotting libraries,
+ #      so the process pool workers that run its tasks load it without them.
+ #      Here is the list:
+ #
+ #      ReturnDataFrameContentHashStringFunction
+ #      ReturnSampleWeightFloatArrayFunction
+ #      ReturnSampleWeightHashStringFunction
+ #      ReturnWeightedUniqueRowsTupleFunction
+ #      ReturnKMeansRestartTaskTupleListFunction
+ #      ReturnBackendCostModelDictionaryFunction
+ #      ReturnKMeansAlgorithmStringFunction
+ #      ReturnKMeansRestartsModelFunction
+ #      ReturnAdaptiveNInitKeyTupleFunction
+ #      ReturnAdaptiveKMeansModelTupleFunction
+ #      ReturnBestKMeansModelFunction
+ #      ReturnCachedKMeansModelFunction
+ #      ReturnFittedKMeansModelFunction
+ #      ReturnOptimalKFromWCSSElbowSeriesFunction
+ #      ReturnPairwiseDistanceMatrixFunction
+ #      ReturnStratifiedSampleIndexArrayFunction
+ #      ReturnSampledSilhouetteTupleFunction
+ #      ReturnSimplifiedSilhouetteFloatFunction
+ #      ReturnWeightedSilhouetteFloatFunction
+ #      ReturnDaviesBouldinFloatFunction
+ #      ReturnKMeansScoresTupleFunction
+ #      ReturnFeatureMatrixExecutorTupleFunction
+ #      ReturnWarmStartKMeansModelTupleFunction
+ #      ReturnColdStartKMeansModelListFunction
+ #      ReturnSweepDictionaryFromScoresFunction
+ #      ReturnEarlyStopFlagFunction
+ #      ReturnKMeansSweepDictionaryFunction
+ #      ReturnRowChunkIteratorFunction
+ #      ReturnMiniBatchKMeansModelListFunction
+ #      ReturnMiniBatchKMeansModelFunction
+ #      ReturnMiniBatchKMeansSweepDictionaryFunction
+ #      ReturnRandomizedSVDTupleFunction
+ #      ReturnReducedFeatureTupleFunction
+ #      ReturnSilhouetteModeStringFunction
+ #      ReturnGapReferenceLogWcssListFunction
+ #      ReturnColumnGramContributionsDataFrameFunction
+ #      ReturnSubsetDistanceMatrixFunction
+ #      ReturnFeatureSubsetScoresDictionaryFunction
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     agent
+ #
+ #******************************************************************************************/
+
+import CryptoClusteringConstants as crypto_constant
+import CryptoClusteringSharedMemory as crypto_shared_memory
+import PyLogSubRoutines as log_subroutine
+
+import hashlib
+import math
+import time
+
+import numpy as np
+import pandas as pd
+
+from concurrent.futures import ProcessPoolExecutor
+from scipy.sparse import csr_array
+from sklearn.cluster import BisectingKMeans
+from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.datasets import make_blobs
+from sklearn.decomposition import IncrementalPCA
+from sklearn.decomposition import PCA
+from sklearn.metrics import calinski_harabasz_score 
+from sklearn.metrics import pairwise_distances_argmin_min
+from sklearn.metrics import pairwise_distances_chunked
+from sklearn.metrics import silhouette_score 
+from threadpoolctl import threadpool_limits
+
+
+# In[2]:
+
+
+CONSTANT_LOCAL_FILE_NAME \
+    = 'CryptoClusteringSweep.py'
+
+
+# In[3]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnDataFrameContentHashStringFunction
+ #
+ #  Function Description:
+ #      This function returns a content hash for a DataFrame that serves as the
+ #      key for the k-sweep and model caches.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          inputDataFrame
+ #                          The parameter is the input DataFrame.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnDataFrameContentHashStringFunction \
+        (inputDataFrame):
+
+    try:
+
+        # This line of code hashes the values and index of every row.
+        rowHashIntegerArray \
+            = pd.util \
+                .hash_pandas_object \
+                    (inputDataFrame,
+                     index = True) \
+                .values
+
+        hashObject \
+            = hashlib.sha1 \
+                (rowHashIntegerArray.tobytes())
+
+        # This line of code adds the column names so that relabeled frames differ.
+        hashObject \
+            .update \
+                (str(list(inputDataFrame.columns)).encode())
+
+
+        return hashObject.hexdigest()
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnDataFrameContentHashStringFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a DataFrame content hash.')
+
+        return \
+            None
+
+
+# In[4]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnSampleWeightFloatArrayFunction
+ #
+ #  Function Description:
+ #      This function returns the sample weights for the rows of a DataFrame as
+ #      a float64 NumPy array: a Series aligns to the DataFrame's index, any
+ #      other sequence is read in row order, and None stays None.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          inputDataFrame
+ #                          The parameter is the input DataFrame.
+ #  Series
+ #          sampleWeightSeries
+ #                          The parameter is the weight of every row or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnSampleWeightFloatArrayFunction \
+        (inputDataFrame,
+         sampleWeightSeries \
+            = None):
+
+    try:
+
+        if sampleWeightSeries is None:
+
+            return \
+                None
+
+        elif isinstance(sampleWeightSeries, pd.Series):
+
+            sampleWeightSeries \
+                = sampleWeightSeries \
+                    .reindex \
+                        (inputDataFrame.index)
+
+
+        sampleWeightFloatArray \
+            = np.ascontiguousarray \
+                (sampleWeightSeries,
+                 dtype = np.float64)
+
+        if len(sampleWeightFloatArray) != len(inputDataFrame) \
+            or not np.all(np.isfinite(sampleWeightFloatArray)) \
+            or np.any(sampleWeightFloatArray < 0):
+
+            raise ValueError
+
+
+        return sampleWeightFloatArray
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnSampleWeightFloatArrayFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a finite, non-negative weight for '
+                 + f'every row.')
+
+        return \
+            None
+
+
+# In[5]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnSampleWeightHashStringFunction
+ #
+ #  Function Description:
+ #      This function returns a content hash for the sample weights that joins
+ #      the input content hash in the k-sweep and model cache keys, or None for
+ #      unweighted rows, so unweighted keys stay as they were.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  NumPy Array
+ #          sampleWeightFloatArray
+ #                          The parameter is the weight of every row or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnSampleWeightHashStringFunction \
+        (sampleWeightFloatArray):
+
+    try:
+
+        if sampleWeightFloatArray is None:
+
+            return \
+                None
+
+
+        return \
+            hashlib.sha1 \
+                (np.ascontiguousarray \
+                     (sampleWeightFloatArray,
+                      dtype = np.float64) \
+                 .tobytes()) \
+            .hexdigest()
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnSampleWeightHashStringFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a sample weight hash.')
+
+        return \
+            None
+
+
+# In[6]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnWeightedUniqueRowsTupleFunction
+ #
+ #  Function Description:
+ #      This function collapses the duplicate rows of a DataFrame, such as
+ #      repeated market snapshots, into one row whose weight is the sum of the
+ #      duplicates' weights (their count without weights).  It returns the
+ #      DataFrame of unique rows in the order of their first occurrence, with
+ #      that occurrence's index, the weight Series, and the position of every
+ #      input row's unique row, so unique-row labels map back to the input
+ #      with labelsIntegerArray[inverseIntegerArray].  A weighted fit on the
+ #      unique rows matches the fit on every row.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          inputDataFrame
+ #                          The parameter is the input DataFrame.
+ #  Series
+ #          sampleWeightSeries
+ #                          The parameter is the weight of every row or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnWeightedUniqueRowsTupleFunction \
+        (inputDataFrame,
+         sampleWeightSeries \
+            = None):
+
+    try:
+
+        _, firstIndexIntegerArray, inverseIntegerArray \
+            = np.unique \
+                (inputDataFrame.to_numpy(),
+                 axis = 0,
+                 return_index = True,
+                 return_inverse = True)
+
+        # These lines of code renumber the unique rows, which np.unique sorts,
+        # in the order of their first occurrence.
+        orderIntegerArray \
+            = np.argsort \
+                (firstIndexIntegerArray)
+
+        rankIntegerArray \
+            = np.empty_like \
+                (orderIntegerArray)
+
+        rankIntegerArray[orderIntegerArray] \
+            = np.arange(len(orderIntegerArray))
+
+        inverseIntegerArray \
+            = rankIntegerArray \
+                [inverseIntegerArray.reshape(-1)]
+
+        uniqueDataFrame \
+            = inputDataFrame \
+                .iloc \
+                    [firstIndexIntegerArray[orderIntegerArray]]
+
+
+        return \
+            uniqueDataFrame, \
+            pd.Series \
+                (np.bincount \
+                     (inverseIntegerArray,
+                      weights \
+                          = ReturnSampleWeightFloatArrayFunction \
+                                (inputDataFrame,
+                                 sampleWeightSeries),
+                      minlength = len(uniqueDataFrame)) \
+                 .astype(np.float64),
+                 index = uniqueDataFrame.index,
+                 name = 'Weight'), \
+            inverseIntegerArray
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnWeightedUniqueRowsTupleFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to collapse the duplicate rows.')
+
+        return \
+            None, None, None
+
+
+# In[7]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnKMeansRestartTaskTupleListFunction
+ #
+ #  Function Description:
+ #      This function splits the k-means restarts for one k value into chunks
+ #      and returns a List of (number of restarts, random state) Tuples, one per
+ #      chunk.  Without a chunk size, the List holds one Tuple with all of the
+ #      restarts and the random state itself; otherwise, each chunk seed derives
+ #      from the random state, the k value, and the chunk index, so the chunks
+ #      are the same no matter how many processes fit them.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  Integer
+ #          kValueInteger
+ #                          The parameter is the number of clusters.
+ #  Integer
+ #          nInitInteger
+ #                          The parameter is the number of k-means restarts.
+ #  Integer
+ #          randomStateInteger
+ #                          The parameter is the random state for the model.
+ #  Integer
+ #          nInitChunkInteger
+ #                          The parameter is the number of restarts per chunk.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnKMeansRestartTaskTupleListFunction \
+        (kValueInteger,
+         nInitInteger,
+         randomStateInteger,
+         nInitChunkInteger \
+            = None):
+
+    try:
+
+        if nInitChunkInteger == None \
+            or nInitChunkInteger >= nInitInteger:
+
+            return [(nInitInteger, randomStateInteger)]
+
+
+        restartTaskTupleList \
+            = []
+
+        for chunkIndexInteger, firstRestartInteger \
+                in enumerate(range(0, nInitInteger, nInitChunkInteger)):
+
+            seedSequenceObject \
+                = np.random.SeedSequence \
+                    (randomStateInteger,
+                     spawn_key = (int(kValueInteger), chunkIndexInteger))
+
+            restartTaskTupleList \
+                .append \
+                    ((min(nInitChunkInteger, nInitInteger - firstRestartInteger),
+                      int(seedSequenceObject.generate_state(1)[0])))
+
+
+        return restartTaskTupleList
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnKMeansRestartTaskTupleListFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the k-means restart tasks.')
+
+        return \
+            None
+
+
+# In[8]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnBackendCostModelDictionaryFunction
+ #
+ #  Function Description:
+ #      This function returns the cost model for the k-means backends: for every
+ #      backend, the coefficients of a log-linear model of the fit time in the
+ #      number of rows, features, and clusters.  The first call calibrates the
+ #      model with a micro-benchmark that times one fit of every backend on
+ #      synthetic blobs of a few sizes, unless the constants hold preset
+ #      coefficients, and later calls reuse it.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnBackendCostModelDictionaryFunction():
+
+    try:
+
+        if crypto_constant.backendCostModelDictionary != None:
+
+            return crypto_constant.backendCostModelDictionary
+
+
+        if crypto_constant.BACKEND_COST_MODEL_DICTIONARY != None:
+
+            crypto_constant.backendCostModelDictionary \
+                = {backendString: np.asarray(coefficientFloatList)
+                   for backendString, coefficientFloatList \
+                       in crypto_constant.BACKEND_COST_MODEL_DICTIONARY.items()}
+
+            return crypto_constant.backendCostModelDictionary
+
+
+        sizeTupleList \
+            = [(rowCountInteger, featureCountInteger, kValueInteger)
+               for rowCountInteger in crypto_constant.BACKEND_BENCHMARK_ROWS_INTEGER_LIST
+               for featureCountInteger \
+                   in crypto_constant.BACKEND_BENCHMARK_FEATURES_INTEGER_LIST
+               for kValueInteger in crypto_constant.BACKEND_BENCHMARK_K_VALUE_INTEGER_LIST]
+
+        designFloatArray \
+            = np.log \
+                (np.array \
+                     ([(np.e,) + sizeTuple for sizeTuple in sizeTupleList],
+                      dtype = np.float64))
+
+        secondsFloatArrayDictionary \
+            = {backendString: np.empty(len(sizeTupleList))
+               for backendString in ('lloyd', 'elkan', 'minibatch', 'bisecting')}
+
+        with threadpool_limits \
+                (limits = crypto_constant.SWEEP_THREADS_PER_FIT_INTEGER):
+
+            for sizeIndexInteger, (rowCountInteger, featureCountInteger, kValueInteger) \
+                    in enumerate(sizeTupleList):
+
+                featureDataFrame \
+                    = pd.DataFrame \
+                        (make_blobs \
+                             (n_samples = rowCountInteger,
+                              n_features = featureCountInteger,
+                              centers = kValueInteger,
+                              random_state \
+                                  = crypto_constant.RANDOM_STATE_INTEGER)[0])
+
+                for backendString in secondsFloatArrayDictionary:
+
+                    secondsFloatList \
+                        = []
+
+                    # The fastest repeat is the least disturbed by other work.
+                    for repeatInteger \
+                            in range(crypto_constant.BACKEND_BENCHMARK_REPEATS_INTEGER):
+
+                        startSecondsFloat \
+                            = time.perf_counter()
+
+                        ReturnKMeansRestartsModelFunction \
+                            (featureDataFrame,
+                             kValueInteger,
+                             1,
+                             crypto_constant.RANDOM_STATE_INTEGER,
+                             backendString,
+                             crypto_constant.SWEEP_THREADS_PER_FIT_INTEGER)
+
+                        secondsFloatList \
+                            .append \
+                                (time.perf_counter() - startSecondsFloat)
+
+                    secondsFloatArrayDictionary[backendString][sizeIndexInteger] \
+                        = min(secondsFloatList)
+
+
+        crypto_constant.backendCostModelDictionary \
+            = {backendString: \
+                   np.linalg.lstsq \
+                       (designFloatArray,
+                        np.log(secondsFloatArray),
+                        rcond = None)[0]
+               for backendString, secondsFloatArray \
+                   in secondsFloatArrayDictionary.items()}
+
+        log_subroutine \
+            .PrintAndDebugWriteText \
+                (f'The k-means backend cost model was calibrated: '
+                 + f'{crypto_constant.backendCostModelDictionary}')
+
+
+        return crypto_constant.backendCostModelDictionary
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnBackendCostModelDictionaryFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the backend cost model.')
+
+        return \
+            None
+
+
+# In[9]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnKMeansAlgorithmStringFunction
+ #
+ #  Function Description:
+ #      This function resolves the k-means backend for a fit.  A fixed backend
+ #      passes through; the 'auto' backend is the one with the lowest predicted
+ #      time in the cost model.  Full-batch Lloyd and Elkan are always
+ #      candidates, and mini-batch and bisecting k-means, which find different
+ #      solutions, join them from the row threshold up unless the caller needs
+ #      full-batch KMeans.  Every decision is recorded in the decisions
+ #      Dictionary and the debug log.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  Integer
+ #          rowCountInteger
+ #                          The parameter is the number of rows.
+ #  Integer
+ #          featureCountInteger
+ #                          The parameter is the number of features.
+ #  Integer
+ #          kValueInteger
+ #                          The parameter is the number of clusters.
+ #  Integer
+ #          nInitInteger
+ #                          The parameter is the number of k-means restarts.
+ #  String
+ #          algorithmString
+ #                          The parameter is the backend ('lloyd', 'elkan',
+ #                          'minibatch', 'bisecting', or 'auto').
+ #  Boolean
+ #          fullBatchFlagBoolean
+ #                          The parameter indicates whether the fit needs
+ #                          full-batch KMeans.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnKMeansAlgorithmStringFunction \
+        (rowCountInteger,
+         featureCountInteger,
+         kValueInteger,
+         nInitInteger,
+         algorithmString \
+            = None,
+         fullBatchFlagBoolean \
+            = False):
+
+    try:
+
+        if algorithmString == None:
+
+            algorithmString \
+                = crypto_constant.ALGORITHM_STRING
+
+        if algorithmString != 'auto':
+
+            return algorithmString
+
+
+        decisionKeyTuple \
+            = (int(rowCountInteger),
+               int(featureCountInteger),
+               int(kValueInteger),
+               int(nInitInteger),
+               fullBatchFlagBoolean)
+
+        if decisionKeyTuple in crypto_constant.backendDecisionsDictionary:
+
+            return \
+                crypto_constant \
+                    .backendDecisionsDictionary \
+                        [decisionKeyTuple] \
+                            ['algorithm']
+
+
+        candidateStringList \
+            = ['lloyd', 'elkan']
+
+        if fullBatchFlagBoolean == False \
+            and rowCountInteger \
+                >= crypto_constant.BACKEND_APPROXIMATE_MIN_ROWS_INTEGER:
+
+            candidateStringList \
+                += ['minibatch', 'bisecting']
+
+
+        sizeFloatArray \
+            = np.log \
+                (np.array \
+                     ([np.e,
+                       max(rowCountInteger, 1),
+                       max(featureCountInteger, 1),
+                       max(kValueInteger, 1)],
+                      dtype = np.float64))
+
+        costModelDictionary \
+            = ReturnBackendCostModelDictionaryFunction()
+
+        # The restarts are independent fits, so the cost grows with their count.
+        secondsFloatDictionary \
+            = {candidateString: \
+                   float \
+                       (nInitInteger \
+                        * np.exp \
+                              (np.dot \
+                                   (costModelDictionary[candidateString],
+                                    sizeFloatArray)))
+               for candidateString in candidateStringList}
+
+        # The first candidate wins ties.
+        chosenAlgorithmString \
+            = min(secondsFloatDictionary,
+                  key = secondsFloatDictionary.get)
+
+        crypto_constant \
+            .backendDecisionsDictionary \
+                [decisionKeyTuple] \
+            = {'algorithm': chosenAlgorithmString,
+               'predicted seconds': secondsFloatDictionary}
+
+        log_subroutine \
+            .PrintAndDebugWriteText \
+                (f'The k-means backend for {rowCountInteger} rows, '
+                 + f'{featureCountInteger} features, k = {kValueInteger}, and '
+                 + f'{nInitInteger} restarts is {chosenAlgorithmString}: '
+                 + f'{secondsFloatDictionary}')
+
+
+        return chosenAlgorithmString
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnKMeansAlgorithmStringFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a k-means backend.')
+
+        return \
+            'lloyd'
+
+
+# In[10]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnKMeansRestartsModelFunction
+ #
+ #  Function Description:
+ #      This function fits and returns one k-means model for a chunk of restarts
+ #      with the KMeans, MiniBatchKMeans, or BisectingKMeans backend.
+ #      The sweep runs it in this process or in a worker process, and the fit
+ #      is limited to a fixed number of native threads so that both give
+ #      bit-identical models.  The model's total_n_iter_ attribute holds the
+ #      Lloyd iterations of all of the chunk's restarts.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame or Dictionary
+ #          featureSourceObject
+ #                          The parameter is the normalized input DataFrame or
+ #                          a shared feature matrix descriptor.
+ #  Integer
+ #          kValueInteger
+ #                          The parameter is the number of clusters.
+ #  Integer
+ #          nInitInteger
+ #                          The parameter is the number of k-means restarts.
+ #  Integer
+ #          randomStateInteger
+ #                          The parameter is the random state for the model.
+ #  String
+ #          algorithmString
+ #                          The parameter is the k-means backend ('lloyd',
+ #                          'elkan', 'minibatch', or 'bisecting').
+ #  Integer
+ #          threadsInteger
+ #                          The parameter is the number of native threads for
+ #                          the fit (None for no limit).
+ #  NumPy Array
+ #          sampleWeightFloatArray
+ #                          The parameter is the weight of every row or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Counts the iterations of every restart      agent
+ #
+ #******************************************************************************************/
+
+def ReturnKMeansRestartsModelFunction \
+        (featureSourceObject,
+         kValueInteger,
+         nInitInteger,
+         randomStateInteger,
+         algorithmString,
+         threadsInteger,
+         sampleWeightFloatArray \
+            = None):
+
+    try:
+
+        if algorithmString == 'minibatch':
+
+            modelKMeansObject \
+                = MiniBatchKMeans \
+                    (n_clusters = kValueInteger,
+                     n_init = nInitInteger,
+                     random_state = randomStateInteger)
+
+        elif algorithmString == 'bisecting':
+
+            modelKMeansObject \
+                = BisectingKMeans \
+                    (n_clusters = kValueInteger,
+                     n_init = nInitInteger,
+                     random_state = randomStateInteger)
+
+        else:
+
+            modelKMeansObject \
+                = None
+
+
+        featureDataFrame \
+            = crypto_shared_memory.ReturnFeatureDataFrameFunction \
+                (featureSourceObject)
+
+        with threadpool_limits(limits = threadsInteger):
+
+            if modelKMeansObject != None:
+
+                modelKMeansObject \
+                    .fit \
+                        (featureDataFrame,
+                         sample_weight = sampleWeightFloatArray)
+
+                # BisectingKMeans does not report its iterations.
+                if algorithmString == 'bisecting':
+
+                    modelKMeansObject.n_iter_ = 0
+
+                modelKMeansObject.total_n_iter_ \
+                    = modelKMeansObject.n_iter_
+
+                return modelKMeansObject
+
+
+            # KMeans reports the iterations of its best restart only, so this
+            # repetition loop fits the restarts one at a time.  They share one
+            # random state, which draws the same initial centers as a single
+            # fit with all of the restarts, and a restart replaces the best one
+            # on the same terms as inside KMeans: a lower inertia and a
+            # different partition.
+            randomStateObject \
+                = np.random.RandomState \
+                    (randomStateInteger)
+
+            iterationsInteger = 0
+
+            for restartInteger in range(nInitInteger):
+
+                restartKMeansObject \
+                    = KMeans \
+                        (n_clusters = kValueInteger,
+                         n_init = 1,
+                         random_state = randomStateObject,
+                         algorithm = algorithmString) \
+                      .fit \
+                          (featureDataFrame,
+                           sample_weight = sampleWeightFloatArray)
+
+                iterationsInteger \
+                    += restartKMeansObject.n_iter_
+
+                if modelKMeansObject == None:
+
+                    modelKMeansObject \
+                        = restartKMeansObject
+
+                elif restartKMeansObject.inertia_ < modelKMeansObject.inertia_ \
+                    and len(np.unique(modelKMeansObject.labels_ * kValueInteger
+                                      + restartKMeansObject.labels_)) \
+                        != len(np.unique(modelKMeansObject.labels_)):
+
+                    modelKMeansObject \
+                        = restartKMeansObject
+
+
+        modelKMeansObject.total_n_iter_ \
+            = iterationsInteger
+
+
+        return modelKMeansObject
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnKMeansRestartsModelFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a fitted KMeans model.')
+
+        return \
+            None
+
+
+# In[11]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnAdaptiveNInitKeyTupleFunction
+ #
+ #  Function Description:
+ #      This function returns the adaptive restart settings for the model and
+ #      k-sweep cache keys or None if the restarts are not adaptive.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnAdaptiveNInitKeyTupleFunction():
+
+    try:
+
+        if crypto_constant.ADAPTIVE_N_INIT_BATCH_INTEGER == None:
+
+            return None
+
+
+        return \
+            (crypto_constant.ADAPTIVE_N_INIT_BATCH_INTEGER,
+             crypto_constant.ADAPTIVE_N_INIT_PATIENCE_INTEGER,
+             crypto_constant.ADAPTIVE_N_INIT_TOLERANCE_FLOAT)
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnAdaptiveNInitKeyTupleFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the adaptive restart settings.')
+
+        return \
+            None
+
+
+# In[12]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnAdaptiveKMeansModelTupleFunction
+ #
+ #  Function Description:
+ #      This function runs the k-means restarts in batches, with the restart
+ #      chunks' seeds, and stops once the best inertia has not improved by more
+ #      than the relative tolerance for the patience number of batches or the
+ #      restarts reach the upper bound.  It returns the best model and the
+ #      number of restarts used.  The sweep runs it in this process or in a
+ #      worker process.  The model's total_n_iter_ attribute holds the Lloyd
+ #      iterations of all of the batches.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame or Dictionary
+ #          featureSourceObject
+ #                          The parameter is the normalized input DataFrame or
+ #                          a shared feature matrix descriptor.
+ #  Integer
+ #          kValueInteger
+ #                          The parameter is the number of clusters.
+ #  Integer
+ #          nInitInteger
+ #                          The parameter is the upper bound on the restarts.
+ #  Integer
+ #          randomStateInteger
+ #                          The parameter is the random state for the model.
+ #  String
+ #          algorithmString
+ #                          The parameter is the KMeans algorithm name.
+ #  Integer
+ #          threadsInteger
+ #                          The parameter is the number of native threads for
+ #                          the fit (None for no limit).
+ #  NumPy Array
+ #          sampleWeightFloatArray
+ #                          The parameter is the weight of every row or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Counts the iterations of every batch        agent
+ #
+ #******************************************************************************************/
+
+def ReturnAdaptiveKMeansModelTupleFunction \
+        (featureSourceObject,
+         kValueInteger,
+         nInitInteger,
+         randomStateInteger,
+         algorithmString,
+         threadsInteger,
+         sampleWeightFloatArray \
+            = None):
+
+    try:
+
+        bestKMeansObject \
+            = None
+
+        restartsInteger = 0
+
+        iterationsInteger = 0
+
+        staleBatchesInteger = 0
+
+        for batchNInitInteger, batchRandomStateInteger \
+                in ReturnKMeansRestartTaskTupleListFunction \
+                       (kValueInteger,
+                        nInitInteger,
+                        randomStateInteger,
+                        crypto_constant.ADAPTIVE_N_INIT_BATCH_INTEGER):
+
+            batchKMeansObject \
+                = ReturnKMeansRestartsModelFunction \
+                    (featureSourceObject,
+                     kValueInteger,
+                     batchNInitInteger,
+                     batchRandomStateInteger,
+                     algorithmString,
+                     threadsInteger,
+                     sampleWeightFloatArray)
+
+            restartsInteger \
+                += batchNInitInteger
+
+            iterationsInteger \
+                += batchKMeansObject.total_n_iter_
+
+            if bestKMeansObject == None:
+
+                bestKMeansObject \
+                    = batchKMeansObject
+
+                continue
+
+
+            if batchKMeansObject.inertia_ \
+                    < bestKMeansObject.inertia_ \
+                      * (1 - crypto_constant.ADAPTIVE_N_INIT_TOLERANCE_FLOAT):
+
+                staleBatchesInteger = 0
+
+            else:
+
+                staleBatchesInteger += 1
+
+
+            # As in ReturnBestKMeansModelFunction, the earlier batch wins ties.
+            if batchKMeansObject.inertia_ < bestKMeansObject.inertia_:
+
+                bestKMeansObject \
+                    = batchKMeansObject
+
+            if staleBatchesInteger \
+                    >= crypto_constant.ADAPTIVE_N_INIT_PATIENCE_INTEGER:
+
+                break
+
+
+        bestKMeansObject.total_n_iter_ \
+            = iterationsInteger
+
+
+        return bestKMeansObject, restartsInteger
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnAdaptiveKMeansModelTupleFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return an adaptively fitted KMeans model.')
+
+        return \
+            None, None
+
+
+# In[13]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnBestKMeansModelFunction
+ #
+ #  Function Description:
+ #      This function returns the KMeans model with the lowest inertia from a List
+ #      of models fitted on restart chunks; the earliest chunk wins ties, as
+ #      the earliest restart does inside KMeans.  The returned model's
+ #      total_n_iter_ attribute holds the Lloyd iterations of all of the chunks.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  List
+ #          modelKMeansObjectList
+ #                          The parameter is a List of fitted KMeans models in
+ #                          chunk order.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Sums the iterations of the chunks           agent
+ #
+ #******************************************************************************************/
+
+def ReturnBestKMeansModelFunction \
+        (modelKMeansObjectList):
+
+    try:
+
+        bestKMeansObject \
+            = modelKMeansObjectList[0]
+
+        for modelKMeansObject in modelKMeansObjectList[1:]:
+
+            if modelKMeansObject.inertia_ < bestKMeansObject.inertia_:
+
+                bestKMeansObject \
+                    = modelKMeansObject
+
+
+        bestKMeansObject.total_n_iter_ \
+            = sum(getattr(modelKMeansObject, 'total_n_iter_', modelKMeansObject.n_iter_)
+                  for modelKMeansObject in modelKMeansObjectList)
+
+
+        return bestKMeansObject
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnBestKMeansModelFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the best KMeans model.')
+
+        return \
+            None
+
+
+# In[14]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnCachedKMeansModelFunction
+ #
+ #  Function Description:
+ #      This function stores a fitted KMeans model in the model cache, evicts the
+ #      least recently used models once the cache exceeds its memory cap, and
+ #      returns the model.  A model stored under an existing key replaces the
+ #      cached model and its byte count.  Without the cache flag, the function
+ #      returns the model without storing it.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  Tuple
+ #          modelKeyTuple
+ #                          The parameter is the model cache key.
+ #  KMeans
+ #          modelKMeansObject
+ #                          The parameter is the fitted KMeans model.
+ #  Boolean
+ #          cacheFlagBoolean
+ #                          The parameter indicates whether the model goes
+ #                          into the model cache.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Replaces a cached model's byte count        agent
+ #  10/18/2026          Added the cache flag                        agent
+ #
+ #******************************************************************************************/
+
+def ReturnCachedKMeansModelFunction \
+        (modelKeyTuple,
+         modelKMeansObject,
+         cacheFlagBoolean \
+            = True):
+
+    try:
+
+        if cacheFlagBoolean == False:
+
+            return modelKMeansObject
+
+
+        # The labels and cluster centers dominate the size of a fitted model.
+        modelBytesInteger \
+            = modelKMeansObject.labels_.nbytes \
+              + modelKMeansObject.cluster_centers_.nbytes
+
+        # A model that replaces one under the same key releases that model's
+        # bytes first.
+        if modelKeyTuple in crypto_constant.fittedModelsOrderedDictionary:
+
+            replacedKMeansObject \
+                = crypto_constant \
+                    .fittedModelsOrderedDictionary \
+                        .pop \
+                            (modelKeyTuple)
+
+            crypto_constant.fittedModelsCacheBytesInteger \
+                -= replacedKMeansObject.labels_.nbytes \
+                   + replacedKMeansObject.cluster_centers_.nbytes
+
+        crypto_constant \
+            .fittedModelsOrderedDictionary \
+                [modelKeyTuple] \
+            = modelKMeansObject
+
+        crypto_constant.fittedModelsCacheBytesInteger \
+            += modelBytesInteger
+
+        # This repetition loop evicts the least recently used models until the
+        # cache is within its memory cap, always keeping the newest model.
+        while crypto_constant.fittedModelsCacheBytesInteger \
+                > crypto_constant.MODEL_CACHE_MAX_BYTES_INTEGER \
+              and len(crypto_constant.fittedModelsOrderedDictionary) > 1:
+
+            evictedKeyTuple, evictedKMeansObject \
+                = crypto_constant \
+                    .fittedModelsOrderedDictionary \
+                        .popitem \
+                            (last = False)
+
+            crypto_constant.fittedModelsCacheBytesInteger \
+                -= evictedKMeansObject.labels_.nbytes \
+                   + evictedKMeansObject.cluster_centers_.nbytes
+
+
+        return modelKMeansObject
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnCachedKMeansModelFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to cache a fitted KMeans model.')
+
+        return \
+            None
+
+
+# In[15]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnFittedKMeansModelFunction
+ #
+ #  Function Description:
+ #      This function returns a fitted KMeans model from the model cache and fits
+ #      and caches the model only if no model with the same input content and
+ #      parameters exists.  The cache evicts the least recently used models once
+ #      its memory cap is exceeded.  With adaptive restarts, the number of
+ #      restarts is the upper bound, and the restarts used go to the debug log.
+ #      The model is a full-batch KMeans unless the caller, such as the k-sweep,
+ #      accepts the approximate 'auto' backends.  Without the cache flag, the
+ #      function neither reads nor stores the model cache.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          normalizedDataFrame
+ #                          The parameter is the normalized input DataFrame.
+ #  Integer
+ #          kValueInteger
+ #                          The parameter is the number of clusters.
+ #  Integer
+ #          nInitInteger
+ #                          The parameter is the number of k-means restarts.
+ #  Integer
+ #          randomStateInteger
+ #                          The parameter is the random state for the model.
+ #  String
+ #          algorithmString
+ #                          The parameter is the k-means backend or 'auto'.
+ #  Integer
+ #          nInitChunkInteger
+ #                          The parameter is the number of restarts per chunk.
+ #  NumPy Array
+ #          sampleWeightFloatArray
+ #                          The parameter is the weight of every row or None.
+ #  Boolean
+ #          fullBatchFlagBoolean
+ #                          The parameter indicates whether the model must be
+ #                          a full-batch KMeans.
+ #  Boolean
+ #          cacheFlagBoolean
+ #                          The parameter indicates whether the model goes
+ #                          through the model cache.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Added the cache flag                        agent
+ #
+ #******************************************************************************************/
+
+def ReturnFittedKMeansModelFunction \
+        (normalizedDataFrame,
+         kValueInteger,
+         nInitInteger \
+            = None,
+         randomStateInteger \
+            = None,
+         algorithmString \
+            = None,
+         nInitChunkInteger \
+            = None,
+         sampleWeightFloatArray \
+            = None,
+         fullBatchFlagBoolean \
+            = True,
+         cacheFlagBoolean \
+            = True):
+
+    try:
+
+        if nInitInteger == None:
+
+            nInitInteger \
+                = crypto_constant.N_INIT_INTEGER
+
+        if randomStateInteger == None:
+
+            randomStateInteger \
+                = crypto_constant.RANDOM_STATE_INTEGER
+
+        if algorithmString == None:
+
+            algorithmString \
+                = crypto_constant.ALGORITHM_STRING
+
+        if nInitChunkInteger == None:
+
+            nInitChunkInteger \
+                = crypto_constant.N_INIT_CHUNK_INTEGER
+
+
+        algorithmString \
+            = ReturnKMeansAlgorithmStringFunction \
+                (normalizedDataFrame.shape[0],
+                 normalizedDataFrame.shape[1],
+                 kValueInteger,
+                 nInitInteger,
+                 algorithmString,
+                 fullBatchFlagBoolean)
+
+        adaptiveKeyTuple \
+            = ReturnAdaptiveNInitKeyTupleFunction()
+
+        modelKeyTuple \
+            = (ReturnDataFrameContentHashStringFunction \
+                   (normalizedDataFrame),
+               int(kValueInteger),
+               nInitInteger,
+               randomStateInteger,
+               algorithmString,
+               nInitChunkInteger,
+               adaptiveKeyTuple,
+               ReturnSampleWeightHashStringFunction \
+                   (sampleWeightFloatArray))
+
+        # If the model is in the cache, this block of code marks it as the most
+        # recently used and returns it.
+        if cacheFlagBoolean == True \
+            and modelKeyTuple in crypto_constant.fittedModelsOrderedDictionary:
+
+            crypto_constant \
+                .fittedModelsOrderedDictionary \
+                    .move_to_end \
+                        (modelKeyTuple)
+
+            return \
+                crypto_constant \
+                    .fittedModelsOrderedDictionary \
+                        [modelKeyTuple]
+
+
+        if adaptiveKeyTuple != None:
+
+            modelKMeansObject, restartsInteger \
+                = ReturnAdaptiveKMeansModelTupleFunction \
+                    (normalizedDataFrame,
+                     kValueInteger,
+                     nInitInteger,
+                     randomStateInteger,
+                     algorithmString,
+                     crypto_constant.SWEEP_THREADS_PER_FIT_INTEGER,
+                     sampleWeightFloatArray)
+
+            log_subroutine \
+                .PrintAndDebugWriteText \
+                    (f'The adaptive k-means fit for k = {kValueInteger} used '
+                     + f'{restartsInteger} of {nInitInteger} restarts.')
+
+            return \
+                ReturnCachedKMeansModelFunction \
+                    (modelKeyTuple,
+                     modelKMeansObject,
+                     cacheFlagBoolean)
+
+
+        modelKMeansObjectList \
+            = [ReturnKMeansRestartsModelFunction \
+                   (normalizedDataFrame,
+                    kValueInteger,
+                    chunkNInitInteger,
+                    chunkRandomStateInteger,
+                    algorithmString,
+                    crypto_constant.SWEEP_THREADS_PER_FIT_INTEGER,
+                    sampleWeightFloatArray)
+               for chunkNInitInteger, chunkRandomStateInteger \
+                   in ReturnKMeansRestartTaskTupleListFunction \
+                          (kValueInteger,
+                           nInitInteger,
+                           randomStateInteger,
+                           nInitChunkInteger)]
+
+
+        return \
+            ReturnCachedKMeansModelFunction \
+                (modelKeyTuple,
+                 ReturnBestKMeansModelFunction \
+                     (modelKMeansObjectList),
+                 cacheFlagBoolean)
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnFittedKMeansModelFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a fitted KMeans model.')
+
+        return \
+            None
+
+
+# In[16]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnOptimalKFromWCSSElbowSeriesFunction
+ #
+ #  Function Description:
+ #      This function returns the knee of a WCSS (inertia) Series with the
+ #      Kneedle method (Satopaa, Albrecht, Irwin, and Raghavan) or 0 if no knee
+ #      is confirmed yet.  With k values and inertias normalized to [0, 1], the
+ #      difference curve, 1 - x - y, measures how far every point falls below
+ #      the chord from the first to the last point; a local maximum of the
+ #      difference curve is confirmed once a later point drops below its
+ #      threshold, the maximum less the sensitivity times the mean normalized
+ #      k step, before a higher point appears.  The knee is the first confirmed
+ #      local maximum, so the function also runs online on the k values swept
+ #      so far.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  Series
+ #          inertiaFloatSeries
+ #                          The parameter is a Series of inertia values indexed
+ #                          by k value.
+ #  Float
+ #          sensitivityFloat
+ #                          The parameter is the Kneedle sensitivity; larger
+ #                          values confirm fewer knees.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  11/21/2023          Initial Development                         N. James George
+ #  10/18/2026          Moved out of ReturnOptimalKWithWCSSElbowFunction
+ #                                                                  agent
+ #  10/18/2026          Added the threshold parameter               agent
+ #  10/18/2026          Finds the knee with the vectorized Kneedle method
+ #                                                                  agent
+ #
+ #******************************************************************************************/
+
+def ReturnOptimalKFromWCSSElbowSeriesFunction \
+        (inertiaFloatSeries,
+         sensitivityFloat \
+            = None):
+
+    try:
+
+        if sensitivityFloat == None:
+
+            sensitivityFloat \
+                = crypto_constant.KNEEDLE_SENSITIVITY_FLOAT
+
+
+        kValueFloatArray \
+            = inertiaFloatSeries.index.to_numpy(dtype = np.float64)
+
+        inertiaFloatArray \
+            = inertiaFloatSeries.to_numpy(dtype = np.float64)
+
+        # A knee needs a point on each side, and a flat curve has none.
+        if len(inertiaFloatArray) < 3 \
+            or np.ptp(inertiaFloatArray) == 0.0:
+
+            return 0
+
+
+        normalizedKFloatArray \
+            = (kValueFloatArray - kValueFloatArray[0]) \
+              / (kValueFloatArray[-1] - kValueFloatArray[0])
+
+        differenceFloatArray \
+            = 1.0 \
+              - normalizedKFloatArray \
+              - (inertiaFloatArray - inertiaFloatArray.min()) \
+                / np.ptp(inertiaFloatArray)
+
+        maximumIndexIntegerArray \
+            = 1 \
+              + np.flatnonzero \
+                    ((differenceFloatArray[1:-1] >= differenceFloatArray[:-2]) \
+                     & (differenceFloatArray[1:-1] > differenceFloatArray[2:]))
+
+        thresholdFloatArray \
+            = differenceFloatArray[maximumIndexIntegerArray] \
+              - sensitivityFloat * np.diff(normalizedKFloatArray).mean()
+
+
+        # These lines of code find, for every local maximum at once, the first
+        # later point below its threshold and the first later point above it;
+        # argmax returns 0 when there is none, which becomes the Series length.
+        laterBooleanArray \
+            = np.arange(len(differenceFloatArray))[None, :] \
+              > maximumIndexIntegerArray[:, None]
+
+        belowBooleanArray \
+            = laterBooleanArray \
+              & (differenceFloatArray[None, :] < thresholdFloatArray[:, None])
+
+        aboveBooleanArray \
+            = laterBooleanArray \
+              & (differenceFloatArray[None, :] \
+                 > differenceFloatArray[maximumIndexIntegerArray][:, None])
+
+        firstBelowIntegerArray \
+            = np.where \
+                (belowBooleanArray.any(axis = 1),
+                 belowBooleanArray.argmax(axis = 1),
+                 len(differenceFloatArray))
+
+        firstAboveIntegerArray \
+            = np.where \
+                (aboveBooleanArray.any(axis = 1),
+                 aboveBooleanArray.argmax(axis = 1),
+                 len(differenceFloatArray))
+
+        confirmedIndexIntegerArray \
+            = maximumIndexIntegerArray \
+                [(firstBelowIntegerArray < len(differenceFloatArray)) \
+                 & (firstBelowIntegerArray < firstAboveIntegerArray)]
+
+        if len(confirmedIndexIntegerArray) == 0:
+
+            return 0
+
+
+        return \
+            inertiaFloatSeries.index[confirmedIndexIntegerArray[0]]
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnOptimalKFromWCSSElbowSeriesFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return an optimal k value.')
+
+        return \
+            None
+
+
+# In[17]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnPairwiseDistanceMatrixFunction
+ #
+ #  Function Description:
+ #      This function returns the Euclidean pairwise distance matrix of a
+ #      DataFrame for the silhouette scores.  It fills the matrix in row chunks
+ #      within the working memory budget, stores it in the distance data type,
+ #      and caches it by the content of the DataFrame, so every k value and
+ #      later sweeps on the same data, whether the original or the PCA input,
+ #      reuse it.  Without the cache flag, the function neither reads nor
+ #      stores the cache.  The function returns None if the matrix would
+ #      exceed its memory cap, and the scores then use the features.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          normalizedDataFrame
+ #                          The parameter is the normalized input DataFrame.
+ #  String
+ #          dtypeString
+ #                          The parameter is the matrix data type ('float64'
+ #                          or 'float32').
+ #  Boolean
+ #          cacheFlagBoolean
+ #                          The parameter indicates whether the matrix goes
+ #                          through the distance matrix cache.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Added the cache flag                        agent
+ #
+ #******************************************************************************************/
+
+def ReturnPairwiseDistanceMatrixFunction \
+        (normalizedDataFrame,
+         dtypeString \
+            = None,
+         cacheFlagBoolean \
+            = True):
+
+    try:
+
+        if dtypeString == None:
+
+            dtypeString \
+                = crypto_constant.DISTANCE_MATRIX_DTYPE_STRING
+
+
+        rowCountInteger \
+            = len(normalizedDataFrame)
+
+        if rowCountInteger ** 2 * np.dtype(dtypeString).itemsize \
+                > crypto_constant.DISTANCE_MATRIX_MAX_BYTES_INTEGER:
+
+            return None
+
+
+        distanceKeyTuple \
+            = (ReturnDataFrameContentHashStringFunction \
+                   (normalizedDataFrame),
+               dtypeString)
+
+        if cacheFlagBoolean == True \
+            and distanceKeyTuple in crypto_constant.distanceMatricesOrderedDictionary:
+
+            crypto_constant \
+                .distanceMatricesOrderedDictionary \
+                    .move_to_end \
+                        (distanceKeyTuple)
+
+            return \
+                crypto_constant \
+                    .distanceMatricesOrderedDictionary \
+                        [distanceKeyTuple]
+
+
+        # The distance computations round differently for row-major and
+        # column-major input, so the matrix always comes from a row-major
+        # array.
+        featureFloatArray \
+            = np.ascontiguousarray \
+                (normalizedDataFrame \
+                     .to_numpy \
+                         (dtype = np.float64))
+
+        distanceFloatArray \
+            = np.empty \
+                ((rowCountInteger, rowCountInteger),
+                 dtype = dtypeString)
+
+        firstRowInteger = 0
+
+        # This repetition loop copies every row chunk into the matrix, so
+        # only one float64 chunk exists besides the matrix itself.
+        for chunkFloatArray \
+                in pairwise_distances_chunked \
+                       (featureFloatArray,
+                        working_memory \
+                            = crypto_constant.DISTANCE_WORKING_MEMORY_MB_INTEGER):
+
+            distanceFloatArray \
+                [firstRowInteger:firstRowInteger + len(chunkFloatArray)] \
+                = chunkFloatArray
+
+            firstRowInteger \
+                += len(chunkFloatArray)
+
+
+        if cacheFlagBoolean == False:
+
+            return distanceFloatArray
+
+
+        crypto_constant \
+            .distanceMatricesOrderedDictionary \
+                [distanceKeyTuple] \
+            = distanceFloatArray
+
+        # This repetition loop evicts the least recently used matrices.
+        while len(crypto_constant.distanceMatricesOrderedDictionary) \
+                > crypto_constant.DISTANCE_CACHE_MAX_ENTRIES_INTEGER:
+
+            crypto_constant \
+                .distanceMatricesOrderedDictionary \
+                    .popitem \
+                        (last = False)
+
+
+        return distanceFloatArray
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnPairwiseDistanceMatrixFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a pairwise distance matrix.')
+
+        return \
+            None
+
+
+# In[18]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnStratifiedSampleIndexArrayFunction
+ #
+ #  Function Description:
+ #      This function returns the sorted row indexes of a sample that draws from
+ #      every cluster in proportion to its size and at least two rows from every
+ #      cluster that has them, so small clusters keep their silhouette values.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  NumPy Array
+ #          labelsIntegerArray
+ #                          The parameter is the cluster label of every row.
+ #  Integer
+ #          sampleRowsInteger
+ #                          The parameter is the approximate sample size.
+ #  Generator
+ #          generatorObject
+ #                          The parameter is the NumPy random generator.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnStratifiedSampleIndexArrayFunction \
+        (labelsIntegerArray,
+         sampleRowsInteger,
+         generatorObject):
+
+    try:
+
+        clusterSizeIntegerArray \
+            = np.bincount \
+                (labelsIntegerArray)
+
+        clusterSampleIntegerArray \
+            = np.minimum \
+                (clusterSizeIntegerArray,
+                 np.maximum \
+                     (np.rint \
+                          (sampleRowsInteger \
+                           * clusterSizeIntegerArray \
+                           / len(labelsIntegerArray)) \
+                      .astype(np.int64),
+                      2))
+
+        # The rows sort by cluster label, so every cluster is one contiguous slice
+        # of the sorted order.
+        sortedIndexIntegerArray \
+            = np.argsort \
+                (labelsIntegerArray,
+                 kind = 'stable')
+
+        firstRowIntegerArray \
+            = np.concatenate \
+                (([0],
+                  np.cumsum(clusterSizeIntegerArray)[:-1]))
+
+        return \
+            np.sort \
+                (np.concatenate \
+                     ([generatorObject \
+                           .choice \
+                               (sortedIndexIntegerArray \
+                                    [firstRowInteger:firstRowInteger + sizeInteger],
+                                sampleInteger,
+                                replace = False)
+                       for firstRowInteger, sizeInteger, sampleInteger \
+                           in zip(firstRowIntegerArray,
+                                  clusterSizeIntegerArray,
+                                  clusterSampleIntegerArray)]))
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnStratifiedSampleIndexArrayFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a stratified sample.')
+
+        return \
+            None
+
+
+# In[19]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnSampledSilhouetteTupleFunction
+ #
+ #  Function Description:
+ #      This function estimates the silhouette score from several stratified
+ #      samples and returns the mean and the lower and upper bounds of its normal
+ #      confidence interval.  The sample seeds derive from the random state and
+ #      the k value, as the restart chunks' seeds do.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  NumPy Array
+ #          featureFloatArray
+ #                          The parameter is the feature matrix.
+ #  NumPy Array
+ #          labelsIntegerArray
+ #                          The parameter is the cluster label of every row.
+ #  Integer
+ #          kValueInteger
+ #                          The parameter is the number of clusters.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnSampledSilhouetteTupleFunction \
+        (featureFloatArray,
+         labelsIntegerArray,
+         kValueInteger):
+
+    try:
+
+        silhouetteFloatList \
+            = []
+
+        for repeatInteger \
+                in range(crypto_constant.SILHOUETTE_SAMPLE_REPEATS_INTEGER):
+
+            sampleIndexIntegerArray \
+                = ReturnStratifiedSampleIndexArrayFunction \
+                    (labelsIntegerArray,
+                     crypto_constant.SILHOUETTE_SAMPLE_ROWS_INTEGER,
+                     np.random.default_rng \
+                         (np.random.SeedSequence \
+                              (crypto_constant.RANDOM_STATE_INTEGER,
+                               spawn_key = (int(kValueInteger), repeatInteger))))
+
+            silhouetteFloatList \
+                .append \
+                    (silhouette_score \
+                         (featureFloatArray[sampleIndexIntegerArray],
+                          labelsIntegerArray[sampleIndexIntegerArray]))
+
+
+        meanFloat \
+            = float(np.mean(silhouetteFloatList))
+
+        if len(silhouetteFloatList) < 2:
+
+            return meanFloat, meanFloat, meanFloat
+
+
+        marginFloat \
+            = crypto_constant.SILHOUETTE_CONFIDENCE_Z_FLOAT \
+              * np.std(silhouetteFloatList, ddof = 1) \
+              / math.sqrt(len(silhouetteFloatList))
+
+
+        return meanFloat, meanFloat - marginFloat, meanFloat + marginFloat
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnSampledSilhouetteTupleFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a sampled silhouette score.')
+
+        return \
+            None
+
+
+# In[20]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnSimplifiedSilhouetteFloatFunction
+ #
+ #  Function Description:
+ #      This function returns the simplified silhouette score, which measures
+ #      every row against the cluster centers instead of every other row: the
+ #      distance to its own center and to the nearest other center replace the
+ #      mean intra-cluster and nearest-cluster distances.  It costs O(n·k).
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  NumPy Array
+ #          featureFloatArray
+ #                          The parameter is the feature matrix.
+ #  NumPy Array
+ #          labelsIntegerArray
+ #                          The parameter is the cluster label of every row.
+ #  NumPy Array
+ #          centersFloatArray
+ #                          The parameter is the cluster centers.
+ #  NumPy Array
+ #          sampleWeightFloatArray
+ #                          The parameter is the weight of every row or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnSimplifiedSilhouetteFloatFunction \
+        (featureFloatArray,
+         labelsIntegerArray,
+         centersFloatArray,
+         sampleWeightFloatArray \
+            = None):
+
+    try:
+
+        rowIndexIntegerArray \
+            = np.arange \
+                (len(labelsIntegerArray))
+
+        # This line of code computes the distance from every row to every center.
+        centerDistanceFloatArray \
+            = np.sqrt \
+                (np.maximum \
+                     ((featureFloatArray ** 2).sum(axis = 1)[:, np.newaxis] \
+                      - 2 * featureFloatArray @ centersFloatArray.T \
+                      + (centersFloatArray ** 2).sum(axis = 1)[np.newaxis, :],
+                      0.0))
+
+        ownDistanceFloatArray \
+            = centerDistanceFloatArray \
+                [rowIndexIntegerArray, labelsIntegerArray]
+
+        centerDistanceFloatArray \
+            [rowIndexIntegerArray, labelsIntegerArray] \
+            = np.inf
+
+        otherDistanceFloatArray \
+            = centerDistanceFloatArray \
+                .min(axis = 1)
+
+        denominatorFloatArray \
+            = np.maximum \
+                (ownDistanceFloatArray,
+                 otherDistanceFloatArray)
+
+        silhouetteFloatArray \
+            = np.divide \
+                (otherDistanceFloatArray - ownDistanceFloatArray,
+                 denominatorFloatArray,
+                 out = np.zeros_like(denominatorFloatArray),
+                 where = denominatorFloatArray > 0)
+
+        # As in the exact score, the rows of single-row clusters, or of
+        # clusters with a weight of at most one, score 0.
+        silhouetteFloatArray \
+            [np.bincount \
+                 (labelsIntegerArray,
+                  weights = sampleWeightFloatArray) \
+                 [labelsIntegerArray] <= 1] \
+            = 0.0
+
+
+        return \
+            float \
+                (np.average \
+                     (silhouetteFloatArray,
+                      weights = sampleWeightFloatArray))
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnSimplifiedSilhouetteFloatFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a simplified silhouette score.')
+
+        return \
+            None
+
+
+# In[21]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnWeightedSilhouetteFloatFunction
+ #
+ #  Function Description:
+ #      This function returns the exact silhouette score of weighted rows, in
+ #      which a row with weight w counts as w copies of it.  The mean distances
+ #      a(i) and b(i) come from weighted cluster sums of the distance rows: a
+ #      row's own cluster sum over its cluster's weight less one, since the
+ #      row's other copies lie at distance zero, and the smallest other
+ #      cluster sum over that cluster's weight.  Rows of clusters with a weight
+ #      of at most one score 0, and the score is the weighted mean of the rows'
+ #      silhouettes.  The function reads the distance rows in chunks from the
+ #      distance matrix, if any, or computes them within the working memory
+ #      budget, and it matches the exact score of the duplicated rows for
+ #      integer weights.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  NumPy Array
+ #          featureFloatArray
+ #                          The parameter is the feature matrix.
+ #  NumPy Array
+ #          labelsIntegerArray
+ #                          The parameter is the cluster label of every row.
+ #  NumPy Array
+ #          sampleWeightFloatArray
+ #                          The parameter is the weight of every row.
+ #  NumPy Array
+ #          distanceFloatArray
+ #                          The parameter is the pairwise distance matrix or
+ #                          None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnWeightedSilhouetteFloatFunction \
+        (featureFloatArray,
+         labelsIntegerArray,
+         sampleWeightFloatArray,
+         distanceFloatArray \
+            = None):
+
+    try:
+
+        rowCountInteger \
+            = len(labelsIntegerArray)
+
+        clusterCountInteger \
+            = int(labelsIntegerArray.max()) + 1
+
+        clusterWeightFloatArray \
+            = np.bincount \
+                (labelsIntegerArray,
+                 weights = sampleWeightFloatArray,
+                 minlength = clusterCountInteger)
+
+        # This sparse n x k matrix holds every row's weight in its cluster's
+        # column, so a chunk of distance rows times it gives the weighted
+        # cluster sums of those rows.
+        membershipSparseArray \
+            = csr_array \
+                ((sampleWeightFloatArray,
+                  (np.arange(rowCountInteger),
+                   labelsIntegerArray)),
+                 shape = (rowCountInteger, clusterCountInteger))
+
+        if distanceFloatArray is None:
+
+            chunkIteratorObject \
+                = pairwise_distances_chunked \
+                    (featureFloatArray,
+                     working_memory \
+                         = crypto_constant.DISTANCE_WORKING_MEMORY_MB_INTEGER)
+
+        else:
+
+            chunkRowsInteger \
+                = max \
+                    (crypto_constant.DISTANCE_WORKING_MEMORY_MB_INTEGER * 2 ** 20 \
+                     // (8 * rowCountInteger),
+                     1)
+
+            chunkIteratorObject \
+                = (distanceFloatArray[firstRowInteger:firstRowInteger + chunkRowsInteger]
+                   for firstRowInteger in range(0, rowCountInteger, chunkRowsInteger))
+
+        silhouetteFloatArray \
+            = np.empty(rowCountInteger)
+
+        firstRowInteger = 0
+
+        for chunkFloatArray in chunkIteratorObject:
+
+            chunkSliceObject \
+                = slice \
+                    (firstRowInteger,
+                     firstRowInteger + len(chunkFloatArray))
+
+            ownLabelsIntegerArray \
+                = labelsIntegerArray[chunkSliceObject]
+
+            chunkIndexIntegerArray \
+                = np.arange(len(chunkFloatArray))
+
+            clusterSumFloatArray \
+                = chunkFloatArray @ membershipSparseArray
+
+            ownWeightFloatArray \
+                = clusterWeightFloatArray[ownLabelsIntegerArray]
+
+            ownDistanceFloatArray \
+                = np.divide \
+                    (clusterSumFloatArray \
+                         [chunkIndexIntegerArray, ownLabelsIntegerArray],
+                     ownWeightFloatArray - 1,
+                     out = np.zeros(len(chunkFloatArray)),
+                     where = ownWeightFloatArray > 1)
+
+            # Empty clusters and the row's own cluster are never the nearest.
+            otherDistanceFloatArray \
+                = np.divide \
+                    (clusterSumFloatArray,
+                     clusterWeightFloatArray[np.newaxis, :],
+                     out = np.full(clusterSumFloatArray.shape, np.inf),
+                     where = clusterWeightFloatArray[np.newaxis, :] > 0)
+
+            otherDistanceFloatArray \
+                [chunkIndexIntegerArray, ownLabelsIntegerArray] \
+                = np.inf
+
+            otherDistanceFloatArray \
+                = otherDistanceFloatArray \
+                    .min(axis = 1)
+
+            denominatorFloatArray \
+                = np.maximum \
+                    (ownDistanceFloatArray,
+                     otherDistanceFloatArray)
+
+            silhouetteFloatArray[chunkSliceObject] \
+                = np.where \
+                    (ownWeightFloatArray > 1,
+                     np.divide \
+                         (otherDistanceFloatArray - ownDistanceFloatArray,
+                          denominatorFloatArray,
+                          out = np.zeros(len(chunkFloatArray)),
+                          where = denominatorFloatArray > 0),
+                     0.0)
+
+            firstRowInteger \
+                += len(chunkFloatArray)
+
+
+        return \
+            float \
+                (np.average \
+                     (silhouetteFloatArray,
+                      weights = sampleWeightFloatArray))
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnWeightedSilhouetteFloatFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a weighted silhouette score.')
+
+        return \
+            None
+
+
+# In[22]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnDaviesBouldinFloatFunction
+ #
+ #  Function Description:
+ #      This function returns the Davies-Bouldin score from the cluster centers
+ #      and the mean distance of every cluster's rows to its center: the mean,
+ #      over the clusters, of the largest ratio of two clusters' summed scatter
+ #      to the distance between their centers.  It needs only the k centers and
+ #      k scatters, which the caller gathers in O(n·k), and lower is better.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  NumPy Array
+ #          clusterScatterFloatArray
+ #                          The parameter is the mean distance of every
+ #                          cluster's rows to its center.
+ #  NumPy Array
+ #          centersFloatArray
+ #                          The parameter is the cluster centers.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnDaviesBouldinFloatFunction \
+        (clusterScatterFloatArray,
+         centersFloatArray):
+
+    try:
+
+        centerDistanceFloatArray \
+            = np.sqrt \
+                (((centersFloatArray[:, np.newaxis, :] \
+                   - centersFloatArray[np.newaxis, :, :]) ** 2) \
+                 .sum(axis = 2))
+
+        # As in scikit-learn, coincident centers, including every center with
+        # itself, do not count.
+        centerDistanceFloatArray \
+            [centerDistanceFloatArray == 0] \
+            = np.inf
+
+
+        return \
+            float \
+                (np.mean \
+                     (np.max \
+                          ((clusterScatterFloatArray[:, np.newaxis] \
+                            + clusterScatterFloatArray[np.newaxis, :]) \
+                           / centerDistanceFloatArray,
+                           axis = 1)))
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnDaviesBouldinFloatFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a Davies-Bouldin score.')
+
+        return \
+            None
+
+
+# In[23]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnKMeansScoresTupleFunction
+ #
+ #  Function Description:
+ #      This function returns the Calinski-Harabasz, Davies-Bouldin, and
+ #      silhouette scores for one set of k-means labels and centers.  The
+ #      Davies-Bouldin score reads the distance of every row to its own center
+ #      only.  The sweep runs it in this process or in a
+ #      worker process.  With a distance source, the silhouette score reads the
+ #      precomputed pairwise distances instead of computing them again.  The
+ #      silhouette mode selects the exact, stratified-sample, or simplified
+ #      (centroid) score, and the function also returns the bounds of the
+ #      sampled score's confidence interval, which equal the score in the other
+ #      modes.  With sample weights, every row counts as its weight in the
+ #      Calinski-Harabasz and Davies-Bouldin scores and the exact silhouette
+ #      score, the simplified silhouette score is the weighted mean of the
+ #      rows' silhouettes, and the sampled silhouette score is unweighted.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame or Dictionary
+ #          featureSourceObject
+ #                          The parameter is the normalized input DataFrame or
+ #                          a shared feature matrix descriptor.
+ #  NumPy Array
+ #          labelsIntegerArray
+ #                          The parameter is the cluster label of every row.
+ #  Integer
+ #          threadsInteger
+ #                          The parameter is the number of native threads for
+ #                          the scoring (None for no limit).
+ #  DataFrame or Dictionary
+ #          distanceSourceObject
+ #                          The parameter is the pairwise distance DataFrame,
+ #                          its shared matrix descriptor, or None.
+ #  NumPy Array
+ #          centersFloatArray
+ #                          The parameter is the cluster centers.
+ #  String
+ #          silhouetteModeString
+ #                          The parameter is the silhouette mode ('exact',
+ #                          'sampled', or 'simplified').
+ #  NumPy Array
+ #          sampleWeightFloatArray
+ #                          The parameter is the weight of every row or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnKMeansScoresTupleFunction \
+        (featureSourceObject,
+         labelsIntegerArray,
+         threadsInteger,
+         distanceSourceObject \
+            = None,
+         centersFloatArray \
+            = None,
+         silhouetteModeString \
+            = 'exact',
+         sampleWeightFloatArray \
+            = None):
+
+    try:
+
+        # The distance computations round differently for row-major and
+        # column-major input, so the scores always use a row-major array.
+        featureFloatArray \
+            = np.ascontiguousarray \
+                (crypto_shared_memory.ReturnFeatureDataFrameFunction \
+                     (featureSourceObject) \
+                 .to_numpy())
+
+        with threadpool_limits(limits = threadsInteger):
+
+            clusterCountInteger \
+                = len(centersFloatArray)
+
+            ownDistanceFloatArray \
+                = np.sqrt \
+                    (((featureFloatArray \
+                       - centersFloatArray[labelsIntegerArray]) ** 2) \
+                     .sum(axis = 1))
+
+            if sampleWeightFloatArray is None:
+
+                calinskiHarabaszFloat \
+                    = calinski_harabasz_score \
+                        (featureFloatArray,
+                         labelsIntegerArray)
+
+                daviesBouldinFloat \
+                    = ReturnDaviesBouldinFloatFunction \
+                        (np.bincount \
+                             (labelsIntegerArray,
+                              weights = ownDistanceFloatArray,
+                              minlength = clusterCountInteger) \
+                         / np.maximum \
+                             (np.bincount \
+                                  (labelsIntegerArray,
+                                   minlength = clusterCountInteger),
+                              1),
+                         centersFloatArray)
+
+            else:
+
+                clusterWeightFloatArray \
+                    = np.bincount \
+                        (labelsIntegerArray,
+                         weights = sampleWeightFloatArray,
+                         minlength = clusterCountInteger)
+
+                featureCountInteger \
+                    = featureFloatArray.shape[1]
+
+                # As in scikit-learn, the Calinski-Harabasz score measures the
+                # dispersion about the clusters' weighted means rather than the
+                # centers; the weight sum takes the place of the row count.
+                # The flat bin of row i's feature j is label_i·d + j.
+                clusterMeanFloatArray \
+                    = np.bincount \
+                        ((labelsIntegerArray[:, np.newaxis] * featureCountInteger \
+                          + np.arange(featureCountInteger)[np.newaxis, :]) \
+                         .ravel(),
+                         weights \
+                             = (featureFloatArray \
+                                * sampleWeightFloatArray[:, np.newaxis]) \
+                               .ravel(),
+                         minlength = clusterCountInteger * featureCountInteger) \
+                      .reshape \
+                          (clusterCountInteger,
+                           featureCountInteger) \
+                      / np.maximum \
+                            (clusterWeightFloatArray,
+                             np.finfo(np.float64).tiny)[:, np.newaxis]
+
+                weightSumFloat \
+                    = clusterWeightFloatArray.sum()
+
+                withinSumOfSquaresFloat \
+                    = np.dot \
+                        (sampleWeightFloatArray,
+                         ((featureFloatArray \
+                           - clusterMeanFloatArray[labelsIntegerArray]) ** 2) \
+                         .sum(axis = 1))
+
+                betweenSumOfSquaresFloat \
+                    = np.dot \
+                        (clusterWeightFloatArray,
+                         ((clusterMeanFloatArray \
+                           - np.average \
+                                 (featureFloatArray,
+                                  axis = 0,
+                                  weights = sampleWeightFloatArray)) ** 2) \
+                         .sum(axis = 1))
+
+                calinskiHarabaszFloat \
+                    = float \
+                        (betweenSumOfSquaresFloat \
+                         * (weightSumFloat - clusterCountInteger) \
+                         / (withinSumOfSquaresFloat * (clusterCountInteger - 1))) \
+                      if withinSumOfSquaresFloat > 0 \
+                      else 1.0
+
+                daviesBouldinFloat \
+                    = ReturnDaviesBouldinFloatFunction \
+                        (np.bincount \
+                             (labelsIntegerArray,
+                              weights = sampleWeightFloatArray * ownDistanceFloatArray,
+                              minlength = clusterCountInteger) \
+                         / np.maximum \
+                             (clusterWeightFloatArray,
+                              np.finfo(np.float64).tiny),
+                         centersFloatArray)
+
+            if silhouetteModeString == 'sampled':
+
+                return \
+                    (calinskiHarabaszFloat,
+                     daviesBouldinFloat) \
+                    + ReturnSampledSilhouetteTupleFunction \
+                          (featureFloatArray,
+                           labelsIntegerArray,
+                           len(centersFloatArray))
+
+            elif silhouetteModeString == 'simplified':
+
+                silhouetteFloat \
+                    = ReturnSimplifiedSilhouetteFloatFunction \
+                        (featureFloatArray,
+                         labelsIntegerArray,
+                         centersFloatArray,
+                         sampleWeightFloatArray)
+
+            elif sampleWeightFloatArray is not None:
+
+                silhouetteFloat \
+                    = ReturnWeightedSilhouetteFloatFunction \
+                        (featureFloatArray,
+                         labelsIntegerArray,
+                         sampleWeightFloatArray,
+                         None \
+                             if distanceSourceObject is None \
+                             else crypto_shared_memory.ReturnFeatureDataFrameFunction \
+                                      (distanceSourceObject) \
+                                  .to_numpy())
+
+            elif distanceSourceObject is None:
+
+                silhouetteFloat \
+                    = silhouette_score \
+                        (featureFloatArray,
+                         labelsIntegerArray)
+
+            else:
+
+                silhouetteFloat \
+                    = silhouette_score \
+                        (crypto_shared_memory.ReturnFeatureDataFrameFunction \
+                             (distanceSourceObject) \
+                         .to_numpy(),
+                         labelsIntegerArray,
+                         metric = 'precomputed')
+
+
+        return \
+            calinskiHarabaszFloat, \
+            daviesBouldinFloat, \
+            silhouetteFloat, \
+            silhouetteFloat, \
+            silhouetteFloat
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnKMeansScoresTupleFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the k-means scores.')
+
+        return \
+            None
+
+
+# In[24]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnFeatureMatrixExecutorTupleFunction
+ #
+ #  Function Description:
+ #      This function returns a process pool, the feature source for its tasks,
+ #      and the shared memory behind it.  With more than one worker, it publishes
+ #      the DataFrame once as a shared feature matrix and attaches every worker
+ #      to it; otherwise, it returns no pool and the DataFrame itself.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          normalizedDataFrame
+ #                          The parameter is the normalized input DataFrame.
+ #  Integer
+ #          maxWorkersInteger
+ #                          The parameter is the number of worker processes.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnFeatureMatrixExecutorTupleFunction \
+        (normalizedDataFrame,
+         maxWorkersInteger):
+
+    try:
+
+        if maxWorkersInteger == None \
+            or maxWorkersInteger <= 1:
+
+            return None, normalizedDataFrame, None
+
+
+        sharedMemoryObject, descriptorDictionary \
+            = crypto_shared_memory.ReturnSharedFeatureMatrixTupleFunction \
+                (normalizedDataFrame)
+
+        # The workers receive the calibrated cost model rather than rerun the
+        # benchmark.
+        backendCostModelDictionary \
+            = None
+
+        if crypto_constant.ALGORITHM_STRING == 'auto':
+
+            backendCostModelDictionary \
+                = ReturnBackendCostModelDictionaryFunction()
+
+        executorObject \
+            = ProcessPoolExecutor \
+                (max_workers = maxWorkersInteger,
+                 initializer = crypto_shared_memory.InitializeFeatureMatrixWorker,
+                 initargs = (descriptorDictionary, backendCostModelDictionary))
+
+
+        return executorObject, descriptorDictionary, sharedMemoryObject
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnFeatureMatrixExecutorTupleFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a process pool.')
+
+        return \
+            None, normalizedDataFrame, None
+
+
+# In[25]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnWarmStartKMeansModelTupleFunction
+ #
+ #  Function Description:
+ #      This function fits the k values in increasing order and seeds each fit
+ #      from the previous solution: it splits the cluster with the highest sum of
+ #      squared errors in two with a 2-means fit on its members and runs Lloyd
+ #      iterations from the resulting centers.  A few fresh k-means++ restarts
+ #      compete with the seeded fit, and the model with the lowest inertia wins.
+ #      The function returns the List of models and a List of the Lloyd
+ #      iterations that every k value cost.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          normalizedDataFrame
+ #                          The parameter is the normalized input DataFrame.
+ #  List
+ #          kValueIntegerList
+ #                          The parameter is a List of k values in increasing
+ #                          order.
+ #  KMeans
+ #          previousKMeansObject
+ #                          The parameter is the model for the k value before
+ #                          the first one in the List or None.
+ #  NumPy Array
+ #          sampleWeightFloatArray
+ #                          The parameter is the weight of every row or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnWarmStartKMeansModelTupleFunction \
+        (normalizedDataFrame,
+         kValueIntegerList,
+         previousKMeansObject \
+            = None,
+         sampleWeightFloatArray \
+            = None):
+
+    try:
+
+        featureFloatArray \
+            = normalizedDataFrame \
+                .to_numpy \
+                    (dtype = np.float64)
+
+        modelKMeansObjectList \
+            = []
+
+        iterationsIntegerList \
+            = []
+
+        with threadpool_limits \
+                (limits = crypto_constant.SWEEP_THREADS_PER_FIT_INTEGER):
+
+            # Without a previous solution, the first k value starts with fresh
+            # restarts only.
+            for kValueInteger in kValueIntegerList:
+
+                candidateKMeansObjectList \
+                    = []
+
+                iterationsInteger = 0
+
+                # The seeded fit needs full-batch KMeans.
+                algorithmString \
+                    = ReturnKMeansAlgorithmStringFunction \
+                        (featureFloatArray.shape[0],
+                         featureFloatArray.shape[1],
+                         kValueInteger,
+                         crypto_constant.WARM_START_RESTARTS_INTEGER + 1,
+                         fullBatchFlagBoolean = True)
+
+                if previousKMeansObject != None:
+
+                    centersFloatArray \
+                        = previousKMeansObject.cluster_centers_
+
+                    labelsIntegerArray \
+                        = previousKMeansObject.labels_
+
+                    # This repetition loop splits the highest-SSE cluster until
+                    # there is one center for every cluster.
+                    while len(centersFloatArray) < kValueInteger:
+
+                        squaredErrorFloatArray \
+                            = ((featureFloatArray \
+                                - centersFloatArray[labelsIntegerArray]) ** 2) \
+                              .sum(axis = 1)
+
+                        if sampleWeightFloatArray is not None:
+
+                            squaredErrorFloatArray \
+                                = squaredErrorFloatArray * sampleWeightFloatArray
+
+                        clusterSSEFloatArray \
+                            = np.bincount \
+                                (labelsIntegerArray,
+                                 weights = squaredErrorFloatArray,
+                                 minlength = len(centersFloatArray))
+
+                        # A single-row cluster cannot be split.
+                        clusterSSEFloatArray \
+                            [np.bincount \
+                                 (labelsIntegerArray,
+                                  minlength = len(centersFloatArray)) < 2] \
+                            = -1.0
+
+                        splitClusterInteger \
+                            = int(np.argmax(clusterSSEFloatArray))
+
+                        memberBooleanArray \
+                            = labelsIntegerArray == splitClusterInteger
+
+                        splitKMeansObject \
+                            = KMeans \
+                                (n_clusters = 2,
+                                 n_init = 1,
+                                 random_state \
+                                    = crypto_constant.RANDOM_STATE_INTEGER) \
+                              .fit \
+                                  (featureFloatArray[memberBooleanArray],
+                                   sample_weight \
+                                       = None \
+                                         if sampleWeightFloatArray is None \
+                                         else sampleWeightFloatArray \
+                                                  [memberBooleanArray])
+
+                        iterationsInteger \
+                            += splitKMeansObject.n_iter_
+
+                        centersFloatArray \
+                            = np.vstack \
+                                ((np.delete \
+                                      (centersFloatArray,
+                                       splitClusterInteger,
+                                       axis = 0),
+                                  splitKMeansObject.cluster_centers_))
+
+                        # The split cluster's members move to the two new clusters
+                        # at the end of the center list.
+                        labelsIntegerArray \
+                            = np.where \
+                                (labelsIntegerArray > splitClusterInteger,
+                                 labelsIntegerArray - 1,
+                                 labelsIntegerArray)
+
+                        labelsIntegerArray[memberBooleanArray] \
+                            = len(centersFloatArray) - 2 \
+                              + splitKMeansObject.labels_
+
+
+                    seededKMeansObject \
+                        = KMeans \
+                            (n_clusters = kValueInteger,
+                             init = centersFloatArray,
+                             n_init = 1,
+                             algorithm = algorithmString) \
+                          .fit \
+                              (normalizedDataFrame,
+                               sample_weight = sampleWeightFloatArray)
+
+                    iterationsInteger \
+                        += seededKMeansObject.n_iter_
+
+                    candidateKMeansObjectList \
+                        .append \
+                            (seededKMeansObject)
+
+
+                # This repetition loop adds the fresh restarts, whose seeds
+                # derive from the random state as the restart chunks' seeds do.
+                for chunkNInitInteger, chunkRandomStateInteger \
+                        in ReturnKMeansRestartTaskTupleListFunction \
+                               (kValueInteger,
+                                crypto_constant.WARM_START_RESTARTS_INTEGER,
+                                crypto_constant.RANDOM_STATE_INTEGER,
+                                1):
+
+                    freshKMeansObject \
+                        = KMeans \
+                            (n_clusters = kValueInteger,
+                             n_init = chunkNInitInteger,
+                             random_state = chunkRandomStateInteger,
+                             algorithm = algorithmString) \
+                          .fit \
+                              (normalizedDataFrame,
+                               sample_weight = sampleWeightFloatArray)
+
+                    iterationsInteger \
+                        += freshKMeansObject.n_iter_
+
+                    candidateKMeansObjectList \
+                        .append \
+                            (freshKMeansObject)
+
+
+                previousKMeansObject \
+                    = ReturnBestKMeansModelFunction \
+                        (candidateKMeansObjectList)
+
+                modelKMeansObjectList \
+                    .append \
+                        (previousKMeansObject)
+
+                iterationsIntegerList \
+                    .append \
+                        (iterationsInteger)
+
+
+        return modelKMeansObjectList, iterationsIntegerList
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnWarmStartKMeansModelTupleFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the warm-started k-means models.')
+
+        return \
+            None, None
+
+
+# In[26]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnColdStartKMeansModelListFunction
+ #
+ #  Function Description:
+ #      This function returns the KMeans model with all of the restarts for every
+ #      k value in a List.  It fits the restart chunks of the k values that are
+ #      not in the model cache, in the process pool if there is one, and caches
+ #      the best chunk model for each of them.  With adaptive restarts, each of
+ #      those k values is one task that runs its batches until they stop
+ #      improving.  Without the cache flag, the function fits every k value and
+ #      neither reads nor stores the model cache.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          normalizedDataFrame
+ #                          The parameter is the normalized input DataFrame.
+ #  List
+ #          kValueIntegerList
+ #                          The parameter is a List of k values.
+ #  Integer
+ #          nInitChunkInteger
+ #                          The parameter is the number of restarts per chunk.
+ #  ProcessPoolExecutor
+ #          executorObject
+ #                          The parameter is the process pool or None.
+ #  DataFrame or Dictionary
+ #          featureSourceObject
+ #                          The parameter is the feature source for the tasks.
+ #  NumPy Array
+ #          sampleWeightFloatArray
+ #                          The parameter is the weight of every row or None.
+ #  Boolean
+ #          cacheFlagBoolean
+ #                          The parameter indicates whether the models go
+ #                          through the model cache.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Added the cache flag                        agent
+ #
+ #******************************************************************************************/
+
+def ReturnColdStartKMeansModelListFunction \
+        (normalizedDataFrame,
+         kValueIntegerList,
+         nInitChunkInteger,
+         executorObject,
+         featureSourceObject,
+         sampleWeightFloatArray \
+            = None,
+         cacheFlagBoolean \
+            = True):
+
+    try:
+
+        contentHashString \
+            = ReturnDataFrameContentHashStringFunction \
+                (normalizedDataFrame)
+
+        adaptiveKeyTuple \
+            = ReturnAdaptiveNInitKeyTupleFunction()
+
+        # This line of code resolves the k-means backend for every k-value.
+        algorithmStringDictionary \
+            = {kValueInteger: \
+                   ReturnKMeansAlgorithmStringFunction \
+                       (normalizedDataFrame.shape[0],
+                        normalizedDataFrame.shape[1],
+                        kValueInteger,
+                        crypto_constant.N_INIT_INTEGER)
+               for kValueInteger in kValueIntegerList}
+
+        # This line of code creates a Dictionary of model cache keys for the k-values.
+        modelKeyTupleDictionary \
+            = {kValueInteger: \
+                   (contentHashString,
+                    kValueInteger,
+                    crypto_constant.N_INIT_INTEGER,
+                    crypto_constant.RANDOM_STATE_INTEGER,
+                    algorithmStringDictionary[kValueInteger],
+                    nInitChunkInteger,
+                    adaptiveKeyTuple,
+                    ReturnSampleWeightHashStringFunction \
+                        (sampleWeightFloatArray))
+               for kValueInteger in kValueIntegerList}
+
+        # This line of code creates a List of the k-values to fit: without the
+        # cache flag, all of them.
+        fitKValueIntegerList \
+            = [kValueInteger \
+               for kValueInteger in kValueIntegerList
+               if cacheFlagBoolean == False \
+                  or modelKeyTupleDictionary[kValueInteger] \
+                      not in crypto_constant.fittedModelsOrderedDictionary]
+
+        # This Dictionary holds the models that this call fits.
+        fitKMeansObjectDictionary \
+            = {}
+
+        # With adaptive restarts, every k-value to fit is one task that runs its
+        # own batches.
+        if adaptiveKeyTuple != None:
+
+            fitModelTupleList \
+                = crypto_shared_memory.ReturnTaskResultsListFunction \
+                    (executorObject,
+                     ReturnAdaptiveKMeansModelTupleFunction,
+                     [(featureSourceObject,
+                       kValueInteger,
+                       crypto_constant.N_INIT_INTEGER,
+                       crypto_constant.RANDOM_STATE_INTEGER,
+                       algorithmStringDictionary[kValueInteger],
+                       crypto_constant.SWEEP_THREADS_PER_FIT_INTEGER,
+                       sampleWeightFloatArray)
+                      for kValueInteger in fitKValueIntegerList])
+
+            for kValueInteger, (modelKMeansObject, restartsInteger) \
+                    in zip(fitKValueIntegerList, fitModelTupleList):
+
+                log_subroutine \
+                    .PrintAndDebugWriteText \
+                        (f'The adaptive k-means fit for k = {kValueInteger} used '
+                         + f'{restartsInteger} of {crypto_constant.N_INIT_INTEGER} '
+                         + f'restarts.')
+
+                fitKMeansObjectDictionary[kValueInteger] \
+                    = ReturnCachedKMeansModelFunction \
+                        (modelKeyTupleDictionary[kValueInteger],
+                         modelKMeansObject,
+                         cacheFlagBoolean)
+
+        else:
+
+            # These lines of code create one fit task for every restart chunk of
+            # every k-value to fit.
+            chunkKValueIntegerList \
+                = []
+
+            fitArgumentTupleList \
+                = []
+
+            for kValueInteger in fitKValueIntegerList:
+
+                for chunkNInitInteger, chunkRandomStateInteger \
+                        in ReturnKMeansRestartTaskTupleListFunction \
+                               (kValueInteger,
+                                crypto_constant.N_INIT_INTEGER,
+                                crypto_constant.RANDOM_STATE_INTEGER,
+                                nInitChunkInteger):
+
+                    chunkKValueIntegerList \
+                        .append \
+                            (kValueInteger)
+
+                    fitArgumentTupleList \
+                        .append \
+                            ((featureSourceObject,
+                              kValueInteger,
+                              chunkNInitInteger,
+                              chunkRandomStateInteger,
+                              algorithmStringDictionary[kValueInteger],
+                              crypto_constant.SWEEP_THREADS_PER_FIT_INTEGER,
+                              sampleWeightFloatArray))
+
+            fitKMeansObjectList \
+                = crypto_shared_memory.ReturnTaskResultsListFunction \
+                    (executorObject,
+                     ReturnKMeansRestartsModelFunction,
+                     fitArgumentTupleList)
+
+            # This repetition loop caches the best chunk model for every fitted
+            # k-value.
+            for kValueInteger in fitKValueIntegerList:
+
+                fitKMeansObjectDictionary[kValueInteger] \
+                    = ReturnCachedKMeansModelFunction \
+                        (modelKeyTupleDictionary[kValueInteger],
+                         ReturnBestKMeansModelFunction \
+                             ([modelKMeansObject \
+                               for chunkKValueInteger, modelKMeansObject \
+                                   in zip(chunkKValueIntegerList, fitKMeansObjectList)
+                               if chunkKValueInteger == kValueInteger]),
+                         cacheFlagBoolean)
+
+
+        # This line of code returns the KMeans model for every k-value: the
+        # fitted models and, for the rest, the models from the model cache.
+        return \
+            [fitKMeansObjectDictionary[kValueInteger] \
+                 if kValueInteger in fitKMeansObjectDictionary \
+                 else ReturnFittedKMeansModelFunction \
+                          (normalizedDataFrame,
+                           kValueInteger,
+                           nInitChunkInteger = nInitChunkInteger,
+                           sampleWeightFloatArray = sampleWeightFloatArray,
+                           fullBatchFlagBoolean = False)
+             for kValueInteger in kValueIntegerList]
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnColdStartKMeansModelListFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the k-means models.')
+
+        return \
+            None
+
+
+# In[27]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnSweepDictionaryFromScoresFunction
+ #
+ #  Function Description:
+ #      This function assembles the k-sweep results Dictionary from the scores
+ #      of the k values swept so far: every method name maps to its optimal k
+ #      value and score Series, 'Iterations' maps to the Lloyd iterations, and
+ #      'Silhouette Interval' maps to the confidence bounds of the silhouette
+ #      scores.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  List
+ #          kValueIntegerList
+ #                          The parameter is a List of the swept k values.
+ #  List
+ #          inertiaFloatList
+ #                          The parameter is a List of inertia values.
+ #  List
+ #          calinskiHarabaszFloatList
+ #                          The parameter is a List of Calinski-Harabasz scores.
+ #  List
+ #          silhouetteFloatList
+ #                          The parameter is a List of silhouette scores.
+ #  List
+ #          daviesBouldinFloatList
+ #                          The parameter is a List of Davies-Bouldin scores.
+ #  List
+ #          iterationsIntegerList
+ #                          The parameter is a List of Lloyd iteration counts.
+ #  List
+ #          silhouetteIntervalTupleList
+ #                          The parameter is a List of the lower and upper
+ #                          bounds of the silhouette scores or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnSweepDictionaryFromScoresFunction \
+        (kValueIntegerList,
+         inertiaFloatList,
+         calinskiHarabaszFloatList,
+         silhouetteFloatList,
+         daviesBouldinFloatList,
+         iterationsIntegerList,
+         silhouetteIntervalTupleList \
+            = None):
+
+    try:
+
+        inertiaFloatSeries \
+            = pd.Series \
+                (inertiaFloatList,
+                 index = kValueIntegerList,
+                 name = 'Wcss Elbow')
+
+        calinskiHarabaszFloatSeries \
+            = pd.Series \
+                (calinskiHarabaszFloatList,
+                 index = kValueIntegerList,
+                 name = 'Calinski Harabasz')
+
+        silhouetteFloatSeries \
+            = pd.Series \
+                (silhouetteFloatList,
+                 index = kValueIntegerList,
+                 name = 'Silhouette')
+
+        daviesBouldinFloatSeries \
+            = pd.Series \
+                (daviesBouldinFloatList,
+                 index = kValueIntegerList,
+                 name = 'Davies Bouldin')
+
+        iterationsIntegerSeries \
+            = pd.Series \
+                (iterationsIntegerList,
+                 index = kValueIntegerList,
+                 name = 'Iterations')
+
+        if silhouetteIntervalTupleList == None:
+
+            silhouetteIntervalTupleList \
+                = [(silhouetteFloat, silhouetteFloat) \
+                   for silhouetteFloat in silhouetteFloatList]
+
+
+        silhouetteIntervalDataFrame \
+            = pd.DataFrame \
+                (silhouetteIntervalTupleList,
+                 index = kValueIntegerList,
+                 columns = ['Lower', 'Upper'])
+
+
+        return \
+            {'Wcss Elbow': \
+                 (ReturnOptimalKFromWCSSElbowSeriesFunction \
+                      (inertiaFloatSeries),
+                  inertiaFloatSeries),
+             'Calinski Harabasz': \
+                 (calinskiHarabaszFloatSeries.idxmax(),
+                  calinskiHarabaszFloatSeries),
+             'Silhouette': \
+                 (silhouetteFloatSeries.idxmax(),
+                  silhouetteFloatSeries),
+             'Davies Bouldin': \
+                 (daviesBouldinFloatSeries.idxmin(),
+                  daviesBouldinFloatSeries),
+             'Iterations': \
+                 iterationsIntegerSeries,
+             'Silhouette Interval': \
+                 silhouetteIntervalDataFrame}
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnSweepDictionaryFromScoresFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the k-sweep results.')
+
+        return \
+            None
+
+
+# In[28]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnEarlyStopFlagFunction
+ #
+ #  Function Description:
+ #      This function returns True once the chosen method's optimal k value on
+ #      the k values swept so far is followed by at least the patience number of
+ #      k values that did not improve on it.  The WCSS Elbow Method's knee
+ #      stays undecided (0) until the Kneedle method confirms one, and, since
+ #      the normalization moves as k values arrive, the sweep stops only once
+ #      the largest swept k value is at least the tail ratio times the knee and
+ #      the knees of the patience number of shorter prefixes agree with it.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  Dictionary
+ #          sweepDictionary
+ #                          The parameter is the k-sweep results so far.
+ #  String
+ #          earlyStopMethodString
+ #                          The parameter is the method name (for example,
+ #                          'Silhouette').
+ #  Integer
+ #          patienceInteger
+ #                          The parameter is the number of consecutive k values
+ #                          without improvement that ends the sweep.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnEarlyStopFlagFunction \
+        (sweepDictionary,
+         earlyStopMethodString,
+         patienceInteger):
+
+    try:
+
+        optimalKInteger, scoreFloatSeries \
+            = sweepDictionary \
+                [earlyStopMethodString]
+
+        if optimalKInteger not in scoreFloatSeries.index:
+
+            return False
+
+        if earlyStopMethodString == 'Wcss Elbow':
+
+            return \
+                scoreFloatSeries.index[-1] \
+                    >= crypto_constant.KNEEDLE_TAIL_RATIO_FLOAT * optimalKInteger \
+                and all \
+                    (ReturnOptimalKFromWCSSElbowSeriesFunction \
+                         (scoreFloatSeries.iloc[:-prefixInteger]) \
+                     == optimalKInteger
+                     for prefixInteger in range(1, patienceInteger + 1))
+
+
+        # This line of code counts the k values swept after the optimal k value.
+        return \
+            len(scoreFloatSeries) \
+            - 1 \
+            - scoreFloatSeries.index.get_loc(optimalKInteger) \
+                >= patienceInteger
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnEarlyStopFlagFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return an early stop flag.')
+
+        return \
+            False
+
+
+# In[29]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnKMeansSweepDictionaryFunction
+ #
+ #  Function Description:
+ #      This function fits one k-means model for each k value and scores every
+ #      fit with the WCSS Elbow, Calinski-Harabasz, Silhouette, and Davies-Bouldin
+ #      Methods.  It returns a Dictionary that maps each method name to its
+ #      optimal k value and score Series.  The results are cached by the content
+ #      of the input DataFrame, so the four ReturnOptimalKWith* functions share
+ #      one set of fits.
+ #
+ #      With more than one worker, the function fits the k values, and the
+ #      restart chunks if there is a chunk size, in a process pool and scores
+ #      them there as well.  The workers read the feature matrix from shared
+ #      memory.  The tasks and their seeds do not depend on the number of
+ #      workers, so the results match the serial run bit for bit.
+ #
+ #      In the 'warm' sweep mode, each k value starts from the previous k
+ #      value's solution and competes with fresh restarts instead of running
+ #      all of the restarts.  The Dictionary also holds an 'Iterations' Series
+ #      with the Lloyd iterations of every restart and chunk for every k value
+ #      in the 'cold' mode and of every fit for that k value in the 'warm' mode.
+ #
+ #      The silhouette mode selects the exact, stratified-sample, or simplified
+ #      (centroid) silhouette scores; 'auto' uses the exact scores up to the
+ #      row threshold and the large-input mode above it.  The exact scores of
+ #      all of the k values read one pairwise distance matrix, which is computed
+ #      once per input and cached.  The Dictionary also holds a 'Silhouette
+ #      Interval' DataFrame with the confidence bounds of the scores.
+ #
+ #      With an early stop method, the function sweeps the k values in waves of
+ #      one k value per worker and ends the sweep once that method's optimum is
+ #      followed by the patience number of k values without improvement; every
+ #      Series then covers only the swept k values.
+ #
+ #      With sample weights, a row with weight w counts as w copies of it in
+ #      the fits, the inertia, and the Calinski-Harabasz, Davies-Bouldin, and
+ #      exact silhouette scores; the simplified silhouette score is the
+ #      weighted mean of the rows' silhouettes, and the sampled scores ignore
+ #      the weights, which the function logs.
+ #
+ #      Without the cache flag, the function neither reads nor stores the
+ #      sweep results, fitted model, and distance matrix caches, so a search
+ #      over many derived inputs, such as the feature subsets, leaves the
+ #      cached results of the caller's own inputs in place.
+ #
+ #      A caller that already has the pairwise distance matrix, such as the
+ #      feature subset search, passes it for the exact silhouette scores.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          normalizedDataFrame
+ #                          The parameter is the normalized input DataFrame.
+ #  Integer
+ #          maxWorkersInteger
+ #                          The parameter is the number of worker processes.
+ #  Integer
+ #          nInitChunkInteger
+ #                          The parameter is the number of restarts per chunk.
+ #  String
+ #          sweepModeString
+ #                          The parameter is the sweep mode ('cold' or 'warm').
+ #  List
+ #          kValueIntegerList
+ #                          The parameter is a List of k values in increasing
+ #                          order.
+ #  String
+ #          earlyStopMethodString
+ #                          The parameter is the method name for the early stop
+ #                          policy or None for a full sweep.
+ #  Integer
+ #          patienceInteger
+ #                          The parameter is the number of consecutive k values
+ #                          without improvement that ends the sweep.
+ #  String
+ #          silhouetteModeString
+ #                          The parameter is the silhouette mode ('auto',
+ #                          'exact', 'sampled', or 'simplified').
+ #  NumPy Array
+ #          sampleWeightFloatArray
+ #                          The parameter is the weight of every row or None.
+ #  Boolean
+ #          cacheFlagBoolean
+ #                          The parameter indicates whether the sweep goes
+ #                          through the sweep results, fitted model, and
+ #                          distance matrix caches.
+ #  NumPy Array
+ #          distanceFloatArray
+ #                          The parameter is the pairwise distance matrix or
+ #                          None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Added the cache flag                        agent
+ #  10/18/2026          Counts the iterations of every restart      agent
+ #  10/18/2026          Added the distance matrix parameter         agent
+ #
+ #******************************************************************************************/
+
+def ReturnKMeansSweepDictionaryFunction \
+        (normalizedDataFrame,
+         maxWorkersInteger \
+            = None,
+         nInitChunkInteger \
+            = None,
+         sweepModeString \
+            = None,
+         kValueIntegerList \
+            = None,
+         earlyStopMethodString \
+            = None,
+         patienceInteger \
+            = None,
+         silhouetteModeString \
+            = None,
+         sampleWeightFloatArray \
+            = None,
+         cacheFlagBoolean \
+            = True,
+         distanceFloatArray \
+            = None):
+
+    executorObject \
+        = None
+
+    sharedMemoryObject \
+        = None
+
+    distanceSharedMemoryObject \
+        = None
+
+    try:
+
+        if maxWorkersInteger == None:
+
+            maxWorkersInteger \
+                = crypto_constant.SWEEP_MAX_WORKERS_INTEGER
+
+        if nInitChunkInteger == None:
+
+            nInitChunkInteger \
+                = crypto_constant.N_INIT_CHUNK_INTEGER
+
+        if sweepModeString == None:
+
+            sweepModeString \
+                = crypto_constant.SWEEP_MODE_STRING
+
+        if kValueIntegerList == None:
+
+            kValueIntegerList \
+                = crypto_constant.K_VALUE_INTEGER_LIST
+
+        if earlyStopMethodString == None:
+
+            earlyStopMethodString \
+                = crypto_constant.EARLY_STOP_METHOD_STRING
+
+        if patienceInteger == None:
+
+            patienceInteger \
+                = crypto_constant.EARLY_STOP_PATIENCE_INTEGER
+
+        silhouetteModeString \
+            = ReturnSilhouetteModeStringFunction \
+                (len(normalizedDataFrame),
+                 silhouetteModeString)
+
+        if silhouetteModeString == 'sampled' \
+            and sampleWeightFloatArray is not None:
+
+            log_subroutine \
+                .PrintAndLogWriteText \
+                    (f'The function, ReturnKMeansSweepDictionaryFunction, '
+                     + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                     + f'ignores the sample weights in the sampled silhouette scores.')
+
+
+        # This line of code creates a List with the k-values for the sweep.
+        kValueNumbersIntegerList \
+            = [int(kValueInteger) for kValueInteger in kValueIntegerList]
+
+        sweepKeyTuple \
+            = (ReturnDataFrameContentHashStringFunction \
+                   (normalizedDataFrame),
+               tuple(kValueNumbersIntegerList),
+               crypto_constant.N_INIT_INTEGER,
+               crypto_constant.RANDOM_STATE_INTEGER,
+               crypto_constant.ALGORITHM_STRING,
+               nInitChunkInteger,
+               ReturnAdaptiveNInitKeyTupleFunction(),
+               sweepModeString,
+               earlyStopMethodString,
+               patienceInteger,
+               silhouetteModeString,
+               ReturnSampleWeightHashStringFunction \
+                   (sampleWeightFloatArray))
+
+        if cacheFlagBoolean == True \
+            and sweepKeyTuple in crypto_constant.sweepResultsDictionary:
+
+            return \
+                crypto_constant \
+                    .sweepResultsDictionary \
+                        [sweepKeyTuple]
+
+
+        # This line of code starts the process pool, if any, over a shared copy of
+        # the feature matrix.
+        executorObject, featureSourceObject, sharedMemoryObject \
+            = ReturnFeatureMatrixExecutorTupleFunction \
+                (normalizedDataFrame,
+                 maxWorkersInteger)
+
+        # These lines of code compute the pairwise distances once for the exact
+        # silhouette scores of every k value and share them with the workers.
+        distanceSourceObject \
+            = None
+
+        if silhouetteModeString != 'exact':
+
+            distanceFloatArray \
+                = None
+
+        elif distanceFloatArray is None:
+
+            distanceFloatArray \
+                = ReturnPairwiseDistanceMatrixFunction \
+                    (normalizedDataFrame,
+                     cacheFlagBoolean = cacheFlagBoolean)
+
+        if distanceFloatArray is not None:
+
+            distanceSourceObject \
+                = pd.DataFrame \
+                    (distanceFloatArray,
+                     copy = False)
+
+            if executorObject != None:
+
+                distanceSharedMemoryObject, distanceSourceObject \
+                    = crypto_shared_memory.ReturnSharedFeatureMatrixTupleFunction \
+                        (distanceSourceObject,
+                         distanceFloatArray.dtype.name)
+
+
+        # Without an early stop method, all of the k values form one wave.
+        if earlyStopMethodString == None:
+
+            waveSizeInteger \
+                = len(kValueNumbersIntegerList)
+
+        else:
+
+            waveSizeInteger \
+                = max(maxWorkersInteger, 1)
+
+
+        sweptKValueIntegerList \
+            = []
+
+        modelKMeansObjectList \
+            = []
+
+        iterationsIntegerList \
+            = []
+
+        scoresTupleList \
+            = []
+
+        for firstIndexInteger \
+                in range(0, len(kValueNumbersIntegerList), waveSizeInteger):
+
+            waveKValueIntegerList \
+                = kValueNumbersIntegerList \
+                    [firstIndexInteger:firstIndexInteger + waveSizeInteger]
+
+            if sweepModeString == 'warm':
+
+                waveKMeansObjectList, waveIterationsIntegerList \
+                    = ReturnWarmStartKMeansModelTupleFunction \
+                        (normalizedDataFrame,
+                         waveKValueIntegerList,
+                         modelKMeansObjectList[-1] \
+                             if len(modelKMeansObjectList) > 0 else None,
+                         sampleWeightFloatArray)
+
+            else:
+
+                waveKMeansObjectList \
+                    = ReturnColdStartKMeansModelListFunction \
+                        (normalizedDataFrame,
+                         waveKValueIntegerList,
+                         nInitChunkInteger,
+                         executorObject,
+                         featureSourceObject,
+                         sampleWeightFloatArray,
+                         cacheFlagBoolean)
+
+                waveIterationsIntegerList \
+                    = [modelKMeansObject.total_n_iter_ \
+                       for modelKMeansObject in waveKMeansObjectList]
+
+
+            sweptKValueIntegerList \
+                += waveKValueIntegerList
+
+            modelKMeansObjectList \
+                += waveKMeansObjectList
+
+            iterationsIntegerList \
+                += waveIterationsIntegerList
+
+            scoresTupleList \
+                += crypto_shared_memory.ReturnTaskResultsListFunction \
+                       (executorObject,
+                        ReturnKMeansScoresTupleFunction,
+                        [(featureSourceObject,
+                          modelKMeansObject.labels_,
+                          crypto_constant.SWEEP_THREADS_PER_FIT_INTEGER,
+                          distanceSourceObject,
+                          modelKMeansObject.cluster_centers_,
+                          silhouetteModeString,
+                          sampleWeightFloatArray)
+                         for modelKMeansObject in waveKMeansObjectList])
+
+            sweepDictionary \
+                = ReturnSweepDictionaryFromScoresFunction \
+                    (sweptKValueIntegerList,
+                     [modelKMeansObject.inertia_ \
+                      for modelKMeansObject in modelKMeansObjectList],
+                     [scoresTuple[0] for scoresTuple in scoresTupleList],
+                     [scoresTuple[2] for scoresTuple in scoresTupleList],
+                     [scoresTuple[1] for scoresTuple in scoresTupleList],
+                     iterationsIntegerList,
+                     [scoresTuple[3:] for scoresTuple in scoresTupleList])
+
+            if earlyStopMethodString != None \
+                and ReturnEarlyStopFlagFunction \
+                        (sweepDictionary,
+                         earlyStopMethodString,
+                         patienceInteger) == True:
+
+                break
+
+
+        if cacheFlagBoolean == True:
+
+            crypto_constant \
+                .sweepResultsDictionary \
+                    [sweepKeyTuple] \
+                = sweepDictionary
+
+
+        return sweepDictionary
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnKMeansSweepDictionaryFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the k-sweep results.')
+
+        return \
+            None
+
+    finally:
+
+        crypto_shared_memory.ShutdownFeatureMatrixExecutor \
+            (executorObject,
+             sharedMemoryObject)
+
+        crypto_shared_memory.ShutdownFeatureMatrixExecutor \
+            (None,
+             distanceSharedMemoryObject)
+
+
+# In[30]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnRowChunkIteratorFunction
+ #
+ #  Function Description:
+ #      This function returns an iterator over the row chunks of an out-of-core
+ #      data source as float64 NumPy arrays.  The source is either a function
+ #      that returns a new iterator of chunks on every call (for example, a
+ #      generator function that reads a file) or an array, such as a NumPy
+ #      memory-mapped array, which the iterator slices into chunks.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  Function or Array
+ #          rowSourceObject
+ #                          The parameter is the row chunk source.
+ #  Integer
+ #          chunkRowsInteger
+ #                          The parameter is the number of rows per chunk for
+ #                          an array source.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnRowChunkIteratorFunction \
+        (rowSourceObject,
+         chunkRowsInteger \
+            = None):
+
+    if chunkRowsInteger == None:
+
+        chunkRowsInteger \
+            = crypto_constant.MINI_BATCH_CHUNK_ROWS_INTEGER
+
+
+    if callable(rowSourceObject):
+
+        for rowChunkObject in rowSourceObject():
+
+            yield \
+                np.asarray \
+                    (rowChunkObject,
+                     dtype = np.float64)
+
+    else:
+
+        for firstRowInteger in range(0, len(rowSourceObject), chunkRowsInteger):
+
+            yield \
+                np.asarray \
+                    (rowSourceObject \
+                         [firstRowInteger:firstRowInteger + chunkRowsInteger],
+                     dtype = np.float64)
+
+
+# In[31]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnMiniBatchKMeansModelListFunction
+ #
+ #  Function Description:
+ #      This function trains one MiniBatchKMeans model for each k value with
+ #      partial_fit over the row chunks of an out-of-core data source; every
+ #      epoch reads each chunk once for all of the models.  A final pass sets
+ #      inertia_ (and labels_, if requested) on every model, as full-batch
+ #      KMeans does, and collects what the sweep needs to score the models: the
+ #      row count, the total sum of squares, every cluster's mean distance to
+ #      its center, and a uniform sample of rows.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  Function or Array
+ #          rowSourceObject
+ #                          The parameter is the row chunk source.
+ #  List
+ #          kValueIntegerList
+ #                          The parameter is a List of k values.
+ #  Boolean
+ #          labelsFlagBoolean
+ #                          The parameter indicates whether to keep the label
+ #                          of every row.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnMiniBatchKMeansModelListFunction \
+        (rowSourceObject,
+         kValueIntegerList,
+         labelsFlagBoolean \
+            = False):
+
+    try:
+
+        modelMiniBatchKMeansObjectList \
+            = [MiniBatchKMeans \
+                   (n_clusters = kValueInteger,
+                    random_state = crypto_constant.RANDOM_STATE_INTEGER)
+               for kValueInteger in kValueIntegerList]
+
+        # This repetition loop trains every model on each chunk in turn.
+        for epochInteger in range(crypto_constant.MINI_BATCH_EPOCHS_INTEGER):
+
+            for rowChunkFloatArray \
+                    in ReturnRowChunkIteratorFunction \
+                           (rowSourceObject):
+
+                for modelMiniBatchKMeansObject in modelMiniBatchKMeansObjectList:
+
+                    modelMiniBatchKMeansObject \
+                        .partial_fit \
+                            (rowChunkFloatArray)
+
+
+        inertiaFloatArray \
+            = np.zeros(len(modelMiniBatchKMeansObjectList))
+
+        labelsIntegerArrayListList \
+            = [[] for modelMiniBatchKMeansObject in modelMiniBatchKMeansObjectList]
+
+        clusterDistanceFloatArrayList \
+            = [np.zeros(kValueInteger) for kValueInteger in kValueIntegerList]
+
+        clusterSizeIntegerArrayList \
+            = [np.zeros(kValueInteger, dtype = np.int64) \
+               for kValueInteger in kValueIntegerList]
+
+        rowCountInteger = 0
+
+        meanFloatArray = 0.0
+
+        totalSumOfSquaresFloat = 0.0
+
+        # The sample keeps the rows with the smallest random keys, which is a
+        # uniform sample of the whole source however it is chunked.
+        randomStateObject \
+            = np.random.RandomState \
+                (crypto_constant.RANDOM_STATE_INTEGER)
+
+        sampleKeyFloatArray \
+            = np.empty(0)
+
+        sampleRowFloatArray \
+            = None
+
+        # This repetition loop assigns every row to its nearest center for every
+        # model and accumulates the inertia, the cluster scatters, the labels,
+        # and the sample.
+        for rowChunkFloatArray \
+                in ReturnRowChunkIteratorFunction \
+                       (rowSourceObject):
+
+            for modelIndexInteger, modelMiniBatchKMeansObject \
+                    in enumerate(modelMiniBatchKMeansObjectList):
+
+                labelsIntegerArray, distanceFloatArray \
+                    = pairwise_distances_argmin_min \
+                        (rowChunkFloatArray,
+                         modelMiniBatchKMeansObject.cluster_centers_)
+
+                inertiaFloatArray[modelIndexInteger] \
+                    += np.dot(distanceFloatArray, distanceFloatArray)
+
+                clusterDistanceFloatArrayList[modelIndexInteger] \
+                    += np.bincount \
+                           (labelsIntegerArray,
+                            weights = distanceFloatArray,
+                            minlength = kValueIntegerList[modelIndexInteger])
+
+                clusterSizeIntegerArrayList[modelIndexInteger] \
+                    += np.bincount \
+                           (labelsIntegerArray,
+                            minlength = kValueIntegerList[modelIndexInteger])
+
+                if labelsFlagBoolean == True:
+
+                    labelsIntegerArrayListList[modelIndexInteger] \
+                        .append \
+                            (labelsIntegerArray.astype(np.int32))
+
+
+            # These lines of code merge the chunk into the running total sum of
+            # squares about the mean.
+            chunkRowsInteger \
+                = len(rowChunkFloatArray)
+
+            chunkMeanFloatArray \
+                = rowChunkFloatArray.mean(axis = 0)
+
+            deltaFloatArray \
+                = chunkMeanFloatArray - meanFloatArray
+
+            totalSumOfSquaresFloat \
+                += ((rowChunkFloatArray - chunkMeanFloatArray) ** 2).sum() \
+                   + np.dot(deltaFloatArray, deltaFloatArray) \
+                     * rowCountInteger * chunkRowsInteger \
+                     / (rowCountInteger + chunkRowsInteger)
+
+            meanFloatArray \
+                = meanFloatArray \
+                  + deltaFloatArray * chunkRowsInteger \
+                    / (rowCountInteger + chunkRowsInteger)
+
+            rowCountInteger \
+                += chunkRowsInteger
+
+
+            if sampleRowFloatArray is None:
+
+                sampleRowFloatArray \
+                    = rowChunkFloatArray[:0]
+
+            sampleKeyFloatArray \
+                = np.concatenate \
+                    ((sampleKeyFloatArray,
+                      randomStateObject.random_sample(chunkRowsInteger)))
+
+            sampleRowFloatArray \
+                = np.concatenate \
+                    ((sampleRowFloatArray,
+                      rowChunkFloatArray))
+
+            if len(sampleKeyFloatArray) \
+                    > crypto_constant.MINI_BATCH_SAMPLE_ROWS_INTEGER:
+
+                keepIndexIntegerArray \
+                    = np.argpartition \
+                        (sampleKeyFloatArray,
+                         crypto_constant.MINI_BATCH_SAMPLE_ROWS_INTEGER) \
+                            [:crypto_constant.MINI_BATCH_SAMPLE_ROWS_INTEGER]
+
+                sampleKeyFloatArray \
+                    = sampleKeyFloatArray[keepIndexIntegerArray]
+
+                sampleRowFloatArray \
+                    = sampleRowFloatArray[keepIndexIntegerArray]
+
+
+        for modelIndexInteger, modelMiniBatchKMeansObject \
+                in enumerate(modelMiniBatchKMeansObjectList):
+
+            modelMiniBatchKMeansObject.inertia_ \
+                = inertiaFloatArray[modelIndexInteger]
+
+            if labelsFlagBoolean == True:
+
+                modelMiniBatchKMeansObject.labels_ \
+                    = np.concatenate \
+                        (labelsIntegerArrayListList[modelIndexInteger])
+
+
+        return \
+            {'models': modelMiniBatchKMeansObjectList,
+             'rows': rowCountInteger,
+             'total sum of squares': totalSumOfSquaresFloat,
+             'cluster scatters': \
+                 [clusterDistanceFloatArray \
+                  / np.maximum(clusterSizeIntegerArray, 1)
+                  for clusterDistanceFloatArray, clusterSizeIntegerArray \
+                      in zip(clusterDistanceFloatArrayList,
+                             clusterSizeIntegerArrayList)],
+             'sample': sampleRowFloatArray}
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnMiniBatchKMeansModelListFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the mini-batch k-means models.')
+
+        return \
+            None
+
+
+# In[32]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnMiniBatchKMeansModelFunction
+ #
+ #  Function Description:
+ #      This function returns a MiniBatchKMeans model trained on an out-of-core
+ #      data source with the same inertia_, labels_, and cluster_centers_
+ #      outputs as a fitted KMeans model.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  Function or Array
+ #          rowSourceObject
+ #                          The parameter is the row chunk source.
+ #  Integer
+ #          kValueInteger
+ #                          The parameter is the number of clusters.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnMiniBatchKMeansModelFunction \
+        (rowSourceObject,
+         kValueInteger):
+
+    try:
+
+        return \
+            ReturnMiniBatchKMeansModelListFunction \
+                (rowSourceObject,
+                 [kValueInteger],
+                 True) \
+                    ['models'][0]
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnMiniBatchKMeansModelFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a mini-batch k-means model.')
+
+        return \
+            None
+
+
+# In[33]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnMiniBatchKMeansSweepDictionaryFunction
+ #
+ #  Function Description:
+ #      This function is the out-of-core counterpart of
+ #      ReturnKMeansSweepDictionaryFunction and returns a Dictionary with the same
+ #      layout.  The inertia, Calinski-Harabasz, and Davies-Bouldin scores cover
+ #      every row; the silhouette scores use the uniform row sample.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  Function or Array
+ #          rowSourceObject
+ #                          The parameter is the row chunk source.
+ #  List
+ #          kValueIntegerList
+ #                          The parameter is a List of k values.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnMiniBatchKMeansSweepDictionaryFunction \
+        (rowSourceObject,
+         kValueIntegerList \
+            = None):
+
+    try:
+
+        if kValueIntegerList == None:
+
+            kValueIntegerList \
+                = crypto_constant.K_VALUE_INTEGER_LIST
+
+
+        kValueNumbersIntegerList \
+            = [int(kValueInteger) for kValueInteger in kValueIntegerList]
+
+        modelListDictionary \
+            = ReturnMiniBatchKMeansModelListFunction \
+                (rowSourceObject,
+                 kValueNumbersIntegerList)
+
+        rowCountInteger \
+            = modelListDictionary['rows']
+
+
+        inertiaFloatList \
+            = []
+
+        calinskiHarabaszFloatList \
+            = []
+
+        silhouetteFloatList \
+            = []
+
+        for kValueNumberInteger, modelMiniBatchKMeansObject \
+                in zip(kValueNumbersIntegerList,
+                       modelListDictionary['models']):
+
+            inertiaFloat \
+                = modelMiniBatchKMeansObject.inertia_
+
+            inertiaFloatList \
+                .append \
+                    (inertiaFloat)
+
+            # The between-cluster dispersion is the total sum of squares less the
+            # within-cluster dispersion, which is the inertia.
+            calinskiHarabaszFloatList \
+                .append \
+                    (((modelListDictionary['total sum of squares'] - inertiaFloat) \
+                      / (kValueNumberInteger - 1)) \
+                     / (inertiaFloat / (rowCountInteger - kValueNumberInteger)))
+
+            silhouetteFloatList \
+                .append \
+                    (silhouette_score \
+                         (modelListDictionary['sample'],
+                          modelMiniBatchKMeansObject \
+                              .predict \
+                                  (modelListDictionary['sample'])))
+
+
+        return \
+            ReturnSweepDictionaryFromScoresFunction \
+                (kValueNumbersIntegerList,
+                 inertiaFloatList,
+                 calinskiHarabaszFloatList,
+                 silhouetteFloatList,
+                 [ReturnDaviesBouldinFloatFunction \
+                      (clusterScatterFloatArray,
+                       modelMiniBatchKMeansObject.cluster_centers_)
+                  for clusterScatterFloatArray, modelMiniBatchKMeansObject \
+                      in zip(modelListDictionary['cluster scatters'],
+                             modelListDictionary['models'])],
+                 [modelMiniBatchKMeansObject.n_steps_ \
+                  for modelMiniBatchKMeansObject in modelListDictionary['models']])
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnMiniBatchKMeansSweepDictionaryFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the mini-batch k-sweep results.')
+
+        return \
+            None
+
+
+# In[34]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnRandomizedSVDTupleFunction
+ #
+ #  Function Description:
+ #      This function returns the leading principal components of a row source
+ #      with a randomized SVD (Halko, Martinsson, and Tropp) that streams the row
+ #      chunks: the centering is implicit, (X - mean) W = X W - mean W, so
+ #      there is never a dense centered copy of the input.  The function returns
+ #      the column means, the components, their explained variances, and the
+ #      total variance.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  Function or Array
+ #          rowSourceObject
+ #                          The parameter is the row chunk source.
+ #  Integer
+ #          componentsInteger
+ #                          The parameter is the number of components.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnRandomizedSVDTupleFunction \
+        (rowSourceObject,
+         componentsInteger):
+
+    try:
+
+        # The first pass accumulates the row count, the column sums, and the
+        # column sums of squares.
+        rowCountInteger = 0
+
+        sumFloatArray \
+            = None
+
+        for chunkFloatArray \
+                in ReturnRowChunkIteratorFunction \
+                       (rowSourceObject):
+
+            if sumFloatArray is None:
+
+                sumFloatArray \
+                    = np.zeros(chunkFloatArray.shape[1])
+
+                squaresFloatArray \
+                    = np.zeros(chunkFloatArray.shape[1])
+
+            rowCountInteger \
+                += len(chunkFloatArray)
+
+            sumFloatArray \
+                += chunkFloatArray.sum(axis = 0)
+
+            squaresFloatArray \
+                += np.einsum \
+                    ('ij,ij->j',
+                     chunkFloatArray,
+                     chunkFloatArray)
+
+
+        meanFloatArray \
+            = sumFloatArray / rowCountInteger
+
+        totalVarianceFloat \
+            = float \
+                ((squaresFloatArray - rowCountInteger * meanFloatArray ** 2).sum() \
+                 / (rowCountInteger - 1))
+
+        sketchSizeInteger \
+            = min(componentsInteger + crypto_constant.REDUCTION_OVERSAMPLES_INTEGER,
+                  rowCountInteger,
+                  len(meanFloatArray))
+
+
+        # These lines of code multiply the centered rows by a d x l matrix,
+        # (X - mean) W, and by an n x l matrix, (X - mean)' Q, chunk by chunk.
+        def ReturnRowsProductFloatArray(weightFloatArray):
+
+            return \
+                np.vstack \
+                    ([chunkFloatArray @ weightFloatArray
+                      for chunkFloatArray \
+                          in ReturnRowChunkIteratorFunction \
+                                 (rowSourceObject)]) \
+                - meanFloatArray @ weightFloatArray
+
+        def ReturnColumnsProductFloatArray(orthonormalFloatArray):
+
+            productFloatArray \
+                = - np.outer \
+                      (meanFloatArray,
+                       orthonormalFloatArray.sum(axis = 0))
+
+            firstRowInteger = 0
+
+            for chunkFloatArray \
+                    in ReturnRowChunkIteratorFunction \
+                           (rowSourceObject):
+
+                productFloatArray \
+                    += chunkFloatArray.T \
+                       @ orthonormalFloatArray \
+                             [firstRowInteger:firstRowInteger + len(chunkFloatArray)]
+
+                firstRowInteger \
+                    += len(chunkFloatArray)
+
+            return productFloatArray
+
+
+        orthonormalFloatArray \
+            = np.linalg.qr \
+                (ReturnRowsProductFloatArray \
+                     (np.random.default_rng \
+                          (crypto_constant.RANDOM_STATE_INTEGER) \
+                        .standard_normal \
+                            ((len(meanFloatArray), sketchSizeInteger))))[0]
+
+        # The power iterations sharpen the sketch when the spectrum decays slowly.
+        for iterationInteger \
+                in range(crypto_constant.REDUCTION_POWER_ITERATIONS_INTEGER):
+
+            orthonormalFloatArray \
+                = np.linalg.qr \
+                    (ReturnRowsProductFloatArray \
+                         (np.linalg.qr \
+                              (ReturnColumnsProductFloatArray \
+                                   (orthonormalFloatArray))[0]))[0]
+
+
+        # The rows of the l x d matrix Q'(X - mean) span the leading components.
+        singularFloatArray, componentsFloatArray \
+            = np.linalg.svd \
+                (ReturnColumnsProductFloatArray \
+                     (orthonormalFloatArray).T,
+                 full_matrices = False)[1:]
+
+
+        return \
+            meanFloatArray, \
+            componentsFloatArray[:componentsInteger], \
+            singularFloatArray[:componentsInteger] ** 2 / (rowCountInteger - 1), \
+            totalVarianceFloat
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnRandomizedSVDTupleFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the randomized SVD.')
+
+        return \
+            None, None, None, None
+
+
+# In[35]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnReducedFeatureTupleFunction
+ #
+ #  Function Description:
+ #      This function reduces a row source to its leading principal components
+ #      for the k-sweep.  Wide sources, with at least the feature threshold of
+ #      columns, use the streaming randomized SVD; tall sources, with at least
+ #      the row threshold of rows or a chunk function, use IncrementalPCA over
+ #      the row chunks; and other sources use an exact PCA.  The number of
+ #      components is either fixed or the fewest whose cumulative explained
+ #      variance ratio reaches the threshold.  The function returns the reduced
+ #      DataFrame (PCA1, PCA2, and so on), a DataFrame of the explained
+ #      variance of every fitted component, and a projection Dictionary of the
+ #      method, the column means, and the kept components.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  Function, Array, or DataFrame
+ #          rowSourceObject
+ #                          The parameter is the row chunk source.
+ #  Integer
+ #          componentsInteger
+ #                          The parameter is the number of components (None
+ #                          selects them by the variance threshold).
+ #  Float
+ #          varianceThresholdFloat
+ #                          The parameter is the cumulative explained variance
+ #                          ratio for the component selection.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnReducedFeatureTupleFunction \
+        (rowSourceObject,
+         componentsInteger \
+            = None,
+         varianceThresholdFloat \
+            = None):
+
+    try:
+
+        if varianceThresholdFloat == None:
+
+            varianceThresholdFloat \
+                = crypto_constant.REDUCTION_VARIANCE_THRESHOLD_FLOAT
+
+
+        # A chunk function reveals its shape only through its first chunk.
+        if callable(rowSourceObject):
+
+            featureCountInteger \
+                = next(iter(ReturnRowChunkIteratorFunction(rowSourceObject))).shape[1]
+
+            rowCountInteger \
+                = None
+
+        else:
+
+            featureCountInteger \
+                = rowSourceObject.shape[1]
+
+            rowCountInteger \
+                = len(rowSourceObject)
+
+
+        fitComponentsInteger \
+            = min(crypto_constant.REDUCTION_MAX_COMPONENTS_INTEGER,
+                  featureCountInteger)
+
+        if componentsInteger != None:
+
+            fitComponentsInteger \
+                = min(componentsInteger,
+                      featureCountInteger)
+
+
+        if featureCountInteger \
+                >= crypto_constant.REDUCTION_RANDOMIZED_MIN_FEATURES_INTEGER:
+
+            methodString \
+                = 'randomized'
+
+            meanFloatArray, componentsFloatArray, \
+            explainedVarianceFloatArray, totalVarianceFloat \
+                = ReturnRandomizedSVDTupleFunction \
+                    (rowSourceObject,
+                     fitComponentsInteger)
+
+            explainedVarianceRatioFloatArray \
+                = explainedVarianceFloatArray / totalVarianceFloat
+
+        elif rowCountInteger == None \
+            or rowCountInteger \
+                >= crypto_constant.REDUCTION_INCREMENTAL_MIN_ROWS_INTEGER:
+
+            methodString \
+                = 'incremental'
+
+            incrementalPCAObject \
+                = IncrementalPCA \
+                    (n_components = fitComponentsInteger)
+
+            # A chunk with fewer rows than components cannot update the fit, so
+            # a short last chunk only takes part in the projection.
+            for chunkFloatArray \
+                    in ReturnRowChunkIteratorFunction \
+                           (rowSourceObject):
+
+                if len(chunkFloatArray) >= fitComponentsInteger:
+
+                    incrementalPCAObject \
+                        .partial_fit \
+                            (chunkFloatArray)
+
+            meanFloatArray, componentsFloatArray, \
+            explainedVarianceFloatArray, explainedVarianceRatioFloatArray \
+                = incrementalPCAObject.mean_, \
+                  incrementalPCAObject.components_, \
+                  incrementalPCAObject.explained_variance_, \
+                  incrementalPCAObject.explained_variance_ratio_
+
+        else:
+
+            methodString \
+                = 'full'
+
+            pcaObject \
+                = PCA \
+                    (n_components = min(fitComponentsInteger, rowCountInteger),
+                     svd_solver = 'full') \
+                  .fit \
+                      (rowSourceObject)
+
+            meanFloatArray, componentsFloatArray, \
+            explainedVarianceFloatArray, explainedVarianceRatioFloatArray \
+                = pcaObject.mean_, \
+                  pcaObject.components_, \
+                  pcaObject.explained_variance_, \
+                  pcaObject.explained_variance_ratio_
+
+
+        componentNameStringList \
+            = [f'PCA{componentInteger + 1}'
+               for componentInteger in range(len(componentsFloatArray))]
+
+        explainedVarianceDataFrame \
+            = pd.DataFrame \
+                ({'Explained Variance': explainedVarianceFloatArray,
+                  'Explained Variance Ratio': explainedVarianceRatioFloatArray,
+                  'Cumulative Explained Variance Ratio': \
+                      np.cumsum(explainedVarianceRatioFloatArray)},
+                 index = componentNameStringList)
+
+
+        if componentsInteger == None:
+
+            # The component count is capped by the fitted components when the
+            # threshold is out of reach.
+            componentsInteger \
+                = min(int(np.searchsorted \
+                              (explainedVarianceDataFrame \
+                                   ['Cumulative Explained Variance Ratio'] \
+                                 .to_numpy(),
+                               varianceThresholdFloat)) + 1,
+                      len(componentsFloatArray))
+
+        componentsFloatArray \
+            = componentsFloatArray[:componentsInteger]
+
+
+        reducedDataFrame \
+            = pd.DataFrame \
+                (np.vstack \
+                     ([chunkFloatArray @ componentsFloatArray.T
+                       for chunkFloatArray \
+                           in ReturnRowChunkIteratorFunction \
+                                  (rowSourceObject)]) \
+                 - meanFloatArray @ componentsFloatArray.T,
+                 columns = componentNameStringList[:componentsInteger])
+
+        if isinstance(rowSourceObject, pd.DataFrame):
+
+            reducedDataFrame.index \
+                = rowSourceObject.index
+
+
+        log_subroutine \
+            .PrintAndDebugWriteText \
+                (f'The {methodString} reduction kept {componentsInteger} of '
+                 + f'{featureCountInteger} features and explained '
+                 + f'{explainedVarianceRatioFloatArray[:componentsInteger].sum():.4f} '
+                 + f'of the variance.')
+
+
+        return \
+            reducedDataFrame, \
+            explainedVarianceDataFrame, \
+            {'method': methodString,
+             'mean': meanFloatArray,
+             'components': componentsFloatArray}
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnReducedFeatureTupleFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the reduced features.')
+
+        return \
+            None, None, None
+
+
+# In[36]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnSilhouetteModeStringFunction
+ #
+ #  Function Description:
+ #      This function resolves the silhouette mode for an input: the 'auto'
+ #      mode becomes 'exact' up to the row threshold and the large-input mode
+ #      above it.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  Integer
+ #          rowCountInteger
+ #                          The parameter is the number of input rows.
+ #  String
+ #          silhouetteModeString
+ #                          The parameter is the silhouette mode ('auto',
+ #                          'exact', 'sampled', or 'simplified').
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnSilhouetteModeStringFunction \
+        (rowCountInteger,
+         silhouetteModeString \
+            = None):
+
+    try:
+
+        if silhouetteModeString == None:
+
+            silhouetteModeString \
+                = crypto_constant.SILHOUETTE_MODE_STRING
+
+        if silhouetteModeString != 'auto':
+
+            return silhouetteModeString
+
+
+        if rowCountInteger <= crypto_constant.SILHOUETTE_EXACT_MAX_ROWS_INTEGER:
+
+            return 'exact'
+
+        else:
+
+            return crypto_constant.SILHOUETTE_LARGE_INPUT_MODE_STRING
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnSilhouetteModeStringFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a silhouette mode.')
+
+        return \
+            None
+
+
+# In[37]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnGapReferenceLogWcssListFunction
+ #
+ #  Function Description:
+ #      This function is the task for one gap statistic reference dataset: it
+ #      draws the rows uniformly from the bounding box of the input from a seed
+ #      that derives from the random state and the reference index, fits
+ #      k-means for every k value, and returns the List of the logarithms of
+ #      the inertias.  With sample weights, the reference rows carry the
+ #      input rows' weights.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  Array
+ #          minimumFloatArray
+ #                          The parameter is the features' minimums.
+ #  Array
+ #          maximumFloatArray
+ #                          The parameter is the features' maximums.
+ #  Integer
+ #          rowCountInteger
+ #                          The parameter is the number of rows.
+ #  List
+ #          kValueIntegerList
+ #                          The parameter is a List of k values.
+ #  List
+ #          algorithmStringList
+ #                          The parameter is a List of the k values' k-means
+ #                          backends.
+ #  Integer
+ #          referenceInteger
+ #                          The parameter is the reference dataset index.
+ #  NumPy Array
+ #          sampleWeightFloatArray
+ #                          The parameter is the weight of every row or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Added the sample weight parameter           agent
+ #
+ #******************************************************************************************/
+
+def ReturnGapReferenceLogWcssListFunction \
+        (minimumFloatArray,
+         maximumFloatArray,
+         rowCountInteger,
+         kValueIntegerList,
+         algorithmStringList,
+         referenceInteger,
+         sampleWeightFloatArray \
+            = None):
+
+    try:
+
+        # The third spawn key element keeps these seeds apart from the restart
+        # chunks' and the bootstrap resamples' seeds.
+        randomGeneratorObject \
+            = np.random.default_rng \
+                (np.random.SeedSequence \
+                     (crypto_constant.RANDOM_STATE_INTEGER,
+                      spawn_key = (0, int(referenceInteger), 1)))
+
+        referenceFloatArray \
+            = randomGeneratorObject \
+                .uniform \
+                    (minimumFloatArray,
+                     maximumFloatArray,
+                     (rowCountInteger, len(minimumFloatArray)))
+
+        with threadpool_limits \
+                (limits = crypto_constant.SWEEP_THREADS_PER_FIT_INTEGER):
+
+            return \
+                [float \
+                     (np.log \
+                          (KMeans \
+                               (n_clusters = kValueInteger,
+                                n_init = crypto_constant.GAP_N_INIT_INTEGER,
+                                random_state \
+                                    = int(randomGeneratorObject.integers(2 ** 31 - 1)),
+                                algorithm = algorithmString) \
+                             .fit \
+                                 (referenceFloatArray,
+                                  sample_weight = sampleWeightFloatArray) \
+                             .inertia_))
+                 for kValueInteger, algorithmString \
+                     in zip(kValueIntegerList, algorithmStringList)]
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnGapReferenceLogWcssListFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the reference dataset inertias.')
+
+        return \
+            None
+
+
+# In[38]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnColumnGramContributionsDataFrameFunction
+ #
+ #  Function Description:
+ #      This function returns every column's contribution to the squared
+ #      pairwise distances for the feature subset search: a DataFrame with one
+ #      block of rows by rows per column that holds the column's Gram matrix,
+ #      the outer product of the column with itself, whose diagonal is the
+ #      column's squared norms.  A subset's squared distances are then the sum
+ #      of its columns' contributions.  The function returns None if the
+ #      blocks would exceed the distance matrix memory cap.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          normalizedDataFrame
+ #                          The parameter is the normalized input DataFrame.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnColumnGramContributionsDataFrameFunction \
+        (normalizedDataFrame):
+
+    try:
+
+        rowCountInteger, columnCountInteger \
+            = normalizedDataFrame.shape
+
+        if columnCountInteger * rowCountInteger ** 2 * np.dtype(np.float64).itemsize \
+                > crypto_constant.DISTANCE_MATRIX_MAX_BYTES_INTEGER:
+
+            return None
+
+
+        featureFloatArray \
+            = normalizedDataFrame \
+                .to_numpy \
+                    (dtype = np.float64)
+
+        gramFloatArray \
+            = np.empty \
+                ((rowCountInteger, columnCountInteger * rowCountInteger),
+                 dtype = np.float64)
+
+        for columnInteger in range(columnCountInteger):
+
+            np.outer \
+                (featureFloatArray[:, columnInteger],
+                 featureFloatArray[:, columnInteger],
+                 out = gramFloatArray \
+                           [:, columnInteger * rowCountInteger \
+                               :(columnInteger + 1) * rowCountInteger])
+
+
+        return \
+            pd.DataFrame \
+                (gramFloatArray,
+                 copy = False)
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnColumnGramContributionsDataFrameFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the column Gram contributions.')
+
+        return \
+            None
+
+
+# In[39]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnSubsetDistanceMatrixFunction
+ #
+ #  Function Description:
+ #      This function returns the Euclidean pairwise distance matrix of a
+ #      feature subset from the per-column Gram contributions: in row chunks
+ #      within the working memory budget, it adds every subset column's
+ #      squared norms of the two rows minus twice its Gram entries in a
+ #      float64 accumulator, so no subset recomputes the products.  The
+ #      function stores the matrix in the distance data type and returns None
+ #      if the matrix would exceed its memory cap.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame or Dictionary
+ #          gramSourceObject
+ #                          The parameter is the per-column Gram contributions
+ #                          DataFrame or its shared matrix descriptor.
+ #  Tuple
+ #          columnIndexTuple
+ #                          The parameter is the subset's column positions.
+ #  String
+ #          dtypeString
+ #                          The parameter is the matrix data type ('float64'
+ #                          or 'float32').
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnSubsetDistanceMatrixFunction \
+        (gramSourceObject,
+         columnIndexTuple,
+         dtypeString \
+            = None):
+
+    try:
+
+        if dtypeString == None:
+
+            dtypeString \
+                = crypto_constant.DISTANCE_MATRIX_DTYPE_STRING
+
+
+        gramFloatArray \
+            = crypto_shared_memory.ReturnFeatureDataFrameFunction \
+                (gramSourceObject) \
+                .to_numpy()
+
+        rowCountInteger \
+            = len(gramFloatArray)
+
+        if rowCountInteger ** 2 * np.dtype(dtypeString).itemsize \
+                > crypto_constant.DISTANCE_MATRIX_MAX_BYTES_INTEGER:
+
+            return None
+
+
+        # The diagonal of every column's block holds the column's squared norms.
+        squaredNormFloatArray \
+            = gramFloatArray \
+                .reshape \
+                    (rowCountInteger, -1, rowCountInteger) \
+                .diagonal \
+                    (axis1 = 0,
+                     axis2 = 2)
+
+        chunkRowsInteger \
+            = max(crypto_constant.DISTANCE_WORKING_MEMORY_MB_INTEGER * 2 ** 20 \
+                  // (2 * rowCountInteger * np.dtype(np.float64).itemsize),
+                  1)
+
+        distanceFloatArray \
+            = np.empty \
+                ((rowCountInteger, rowCountInteger),
+                 dtype = dtypeString)
+
+        # This repetition loop fills the matrix one row chunk at a time.  Every
+        # column's term is symmetric on its own, so the accumulated matrix is
+        # symmetric as well.
+        for firstRowInteger in range(0, rowCountInteger, chunkRowsInteger):
+
+            chunkSlice \
+                = slice \
+                    (firstRowInteger,
+                     min(firstRowInteger + chunkRowsInteger, rowCountInteger))
+
+            accumulatorFloatArray \
+                = np.zeros \
+                    ((chunkSlice.stop - chunkSlice.start, rowCountInteger),
+                     dtype = np.float64)
+
+            termFloatArray \
+                = np.empty_like \
+                    (accumulatorFloatArray)
+
+            for columnInteger in columnIndexTuple:
+
+                np.add \
+                    (squaredNormFloatArray[columnInteger, chunkSlice, np.newaxis],
+                     squaredNormFloatArray[columnInteger, np.newaxis, :],
+                     out = termFloatArray)
+
+                termFloatArray \
+                    -= 2.0 \
+                       * gramFloatArray \
+                             [chunkSlice,
+                              columnInteger * rowCountInteger \
+                              :(columnInteger + 1) * rowCountInteger]
+
+                accumulatorFloatArray \
+                    += termFloatArray
+
+            # The rounding of the sums can leave tiny negative squared distances.
+            np.maximum \
+                (accumulatorFloatArray,
+                 0.0,
+                 out = accumulatorFloatArray)
+
+            distanceFloatArray[chunkSlice] \
+                = np.sqrt \
+                    (accumulatorFloatArray)
+
+
+        return distanceFloatArray
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnSubsetDistanceMatrixFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a subset distance matrix.')
+
+        return \
+            None
+
+
+# In[40]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnFeatureSubsetScoresDictionaryFunction
+ #
+ #  Function Description:
+ #      This function is the task for one feature subset: it runs the k-sweep
+ #      on the subset's columns outside of the shared caches and returns every
+ #      method's optimal k value and its score.  With the per-column Gram
+ #      contributions, the exact silhouette scores read the subset's pairwise
+ #      distances assembled from them; otherwise the sweep computes the
+ #      distances from the subset's columns.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame or Dictionary
+ #          featureSourceObject
+ #                          The parameter is a DataFrame or a shared feature
+ #                          matrix descriptor.
+ #  Tuple
+ #          columnIndexTuple
+ #                          The parameter is the subset's column positions.
+ #  List
+ #          kValueIntegerList
+ #                          The parameter is a List of k values.
+ #  DataFrame or Dictionary
+ #          gramSourceObject
+ #                          The parameter is the per-column Gram contributions
+ #                          DataFrame, its shared matrix descriptor, or None.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Added the Gram contributions parameter      agent
+ #
+ #******************************************************************************************/
+
+def ReturnFeatureSubsetScoresDictionaryFunction \
+        (featureSourceObject,
+         columnIndexTuple,
+         kValueIntegerList,
+         gramSourceObject \
+            = None):
+
+    try:
+
+        featureDataFrame \
+            = crypto_shared_memory.ReturnFeatureDataFrameFunction \
+                (featureSourceObject)
+
+        subsetDataFrame \
+            = featureDataFrame \
+                .iloc[:, list(columnIndexTuple)] \
+                .copy()
+
+        distanceFloatArray \
+            = None
+
+        if gramSourceObject is not None \
+            and ReturnSilhouetteModeStringFunction \
+                    (len(subsetDataFrame)) == 'exact':
+
+            distanceFloatArray \
+                = ReturnSubsetDistanceMatrixFunction \
+                    (gramSourceObject,
+                     columnIndexTuple)
+
+        sweepDictionary \
+            = ReturnKMeansSweepDictionaryFunction \
+                (subsetDataFrame,
+                 maxWorkersInteger = 1,
+                 kValueIntegerList = kValueIntegerList,
+                 cacheFlagBoolean = False,
+                 distanceFloatArray = distanceFloatArray)
+
+
+        return \
+            {methodString: \
+                 (int(sweepDictionary[methodString][0]),
+                  float(sweepDictionary[methodString][1] \
+                            .get(sweepDictionary[methodString][0], np.nan)))
+             for methodString \
+                 in ['Wcss Elbow',
+                     'Calinski Harabasz',
+                     'Silhouette',
+                     'Davies Bouldin']}
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnFeatureSubsetScoresDictionaryFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the feature subset scores.')
+
+        return \
+            None
+
+
+# In[ ]:
+
+
+
+
@@ -0,0 +1,384 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# In[1]:
+
+
+#*******************************************************************************************
+ #
+ #  File Name:  CryptoClusteringWard.py
+ #
+ #  File Description:
+ #      This Python script, CryptoClusteringWard.py, contains the Python
+ #      functions of the Ward hierarchy engine, which builds one Ward hierarchy
+ #      per input and cuts it for every k value.  Here is the list:
+ #
+ #      ReturnWardLinkageMatrixFunction
+ #      ReturnWardClusterLabelsFunction
+ #      ReturnWardSweepDictionaryFunction
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     agent
+ #
+ #******************************************************************************************/
+
+import CryptoClusteringConstants as crypto_constant
+import CryptoClusteringSweep as crypto_sweep
+import PyLogSubRoutines as log_subroutine
+
+import numpy as np
+import pandas as pd
+
+from scipy.cluster.hierarchy import fcluster
+from scipy.cluster.hierarchy import from_mlab_linkage
+from sklearn.cluster import ward_tree
+from sklearn.neighbors import kneighbors_graph
+
+
+# In[2]:
+
+
+CONSTANT_LOCAL_FILE_NAME \
+    = 'CryptoClusteringWard.py'
+
+
+# In[3]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnWardLinkageMatrixFunction
+ #
+ #  Function Description:
+ #      This function builds the Ward hierarchy of a DataFrame once and returns
+ #      it as a SciPy linkage matrix whose heights are the merge order, so every
+ #      cut yields exactly the requested number of clusters.  The merges follow
+ #      a sparse k-nearest-neighbor connectivity graph, which keeps the memory
+ #      sub-quadratic.  The matrices are cached by the content of the DataFrame.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          normalizedDataFrame
+ #                          The parameter is the normalized input DataFrame.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #  10/18/2026          Counts the merged rows with SciPy           agent
+ #
+ #******************************************************************************************/
+
+def ReturnWardLinkageMatrixFunction \
+        (normalizedDataFrame):
+
+    try:
+
+        linkageKeyTuple \
+            = (crypto_sweep.ReturnDataFrameContentHashStringFunction \
+                   (normalizedDataFrame),
+               crypto_constant.WARD_N_NEIGHBORS_INTEGER)
+
+        if linkageKeyTuple in crypto_constant.wardLinkageMatricesDictionary:
+
+            return \
+                crypto_constant \
+                    .wardLinkageMatricesDictionary \
+                        [linkageKeyTuple]
+
+
+        featureFloatArray \
+            = np.ascontiguousarray \
+                (normalizedDataFrame \
+                     .to_numpy \
+                         (dtype = np.float64))
+
+        rowCountInteger \
+            = len(featureFloatArray)
+
+        # The graph links every row to its nearest neighbors; ward_tree makes it
+        # symmetric and joins any disconnected components.
+        connectivityObject \
+            = kneighbors_graph \
+                (featureFloatArray,
+                 min(crypto_constant.WARD_N_NEIGHBORS_INTEGER,
+                     rowCountInteger - 1),
+                 include_self = False)
+
+        childrenIntegerArray \
+            = ward_tree \
+                (featureFloatArray,
+                 connectivity = connectivityObject)[0]
+
+        # The merges in MATLAB's 1-indexed format go through SciPy's compiled
+        # conversion, which adds the rows under every merged node.
+        linkageFloatArray \
+            = from_mlab_linkage \
+                (np.column_stack \
+                     (((childrenIntegerArray + 1).astype(np.float64),
+                       np.arange(1, rowCountInteger, dtype = np.float64))))
+
+        crypto_constant \
+            .wardLinkageMatricesDictionary \
+                [linkageKeyTuple] \
+            = linkageFloatArray
+
+
+        return linkageFloatArray
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnWardLinkageMatrixFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return a Ward linkage matrix.')
+
+        return \
+            None
+
+
+# In[4]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnWardClusterLabelsFunction
+ #
+ #  Function Description:
+ #      This function cuts the cached Ward hierarchy into k clusters and returns
+ #      the cluster label of every row, numbered from 0.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          normalizedDataFrame
+ #                          The parameter is the normalized input DataFrame.
+ #  Integer
+ #          kValueInteger
+ #                          The parameter is the number of clusters.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnWardClusterLabelsFunction \
+        (normalizedDataFrame,
+         kValueInteger):
+
+    try:
+
+        return \
+            fcluster \
+                (ReturnWardLinkageMatrixFunction \
+                     (normalizedDataFrame),
+                 int(kValueInteger),
+                 criterion = 'maxclust') \
+            - 1
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnWardClusterLabelsFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the Ward cluster labels.')
+
+        return \
+            None
+
+
+# In[5]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  ReturnWardSweepDictionaryFunction
+ #
+ #  Function Description:
+ #      This function is the Ward counterpart of
+ #      ReturnKMeansSweepDictionaryFunction and returns a Dictionary with the same
+ #      layout.  It builds one Ward hierarchy, cuts it at every k value, and
+ #      scores each cut with its cluster means as the centers; the inertia is
+ #      the within-cluster sum of squares of the cut.  There are no Lloyd
+ #      iterations, so the 'Iterations' Series is 0 for every k value.
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  DataFrame
+ #          normalizedDataFrame
+ #                          The parameter is the normalized input DataFrame.
+ #  List
+ #          kValueIntegerList
+ #                          The parameter is a List of k values.
+ #  String
+ #          silhouetteModeString
+ #                          The parameter is the silhouette mode ('auto',
+ #                          'exact', 'sampled', or 'simplified').
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         agent
+ #
+ #******************************************************************************************/
+
+def ReturnWardSweepDictionaryFunction \
+        (normalizedDataFrame,
+         kValueIntegerList \
+            = None,
+         silhouetteModeString \
+            = None):
+
+    try:
+
+        if kValueIntegerList == None:
+
+            kValueIntegerList \
+                = crypto_constant.K_VALUE_INTEGER_LIST
+
+
+        kValueNumbersIntegerList \
+            = [int(kValueInteger) for kValueInteger in kValueIntegerList]
+
+        silhouetteModeString \
+            = crypto_sweep.ReturnSilhouetteModeStringFunction \
+                (len(normalizedDataFrame),
+                 silhouetteModeString)
+
+        sweepKeyTuple \
+            = ('ward',
+               crypto_sweep.ReturnDataFrameContentHashStringFunction \
+                   (normalizedDataFrame),
+               tuple(kValueNumbersIntegerList),
+               crypto_constant.WARD_N_NEIGHBORS_INTEGER,
+               silhouetteModeString)
+
+        if sweepKeyTuple in crypto_constant.sweepResultsDictionary:
+
+            return \
+                crypto_constant \
+                    .sweepResultsDictionary \
+                        [sweepKeyTuple]
+
+
+        featureFloatArray \
+            = np.ascontiguousarray \
+                (normalizedDataFrame \
+                     .to_numpy \
+                         (dtype = np.float64))
+
+        distanceSourceObject \
+            = None
+
+        if silhouetteModeString == 'exact':
+
+            distanceFloatArray \
+                = crypto_sweep.ReturnPairwiseDistanceMatrixFunction \
+                    (normalizedDataFrame)
+
+            if distanceFloatArray is not None:
+
+                distanceSourceObject \
+                    = pd.DataFrame \
+                        (distanceFloatArray,
+                         copy = False)
+
+
+        inertiaFloatList \
+            = []
+
+        scoresTupleList \
+            = []
+
+        # This repetition loop cuts the hierarchy at every k value and scores the
+        # cut.
+        for kValueNumberInteger in kValueNumbersIntegerList:
+
+            labelsIntegerArray \
+                = ReturnWardClusterLabelsFunction \
+                    (normalizedDataFrame,
+                     kValueNumberInteger)
+
+            centersFloatArray \
+                = np.zeros \
+                    ((kValueNumberInteger, featureFloatArray.shape[1]))
+
+            np.add.at \
+                (centersFloatArray,
+                 labelsIntegerArray,
+                 featureFloatArray)
+
+            centersFloatArray \
+                /= np.bincount \
+                       (labelsIntegerArray,
+                        minlength = kValueNumberInteger)[:, np.newaxis]
+
+            inertiaFloatList \
+                .append \
+                    (float \
+                         (((featureFloatArray \
+                            - centersFloatArray[labelsIntegerArray]) ** 2) \
+                          .sum()))
+
+            scoresTupleList \
+                .append \
+                    (crypto_sweep.ReturnKMeansScoresTupleFunction \
+                         (normalizedDataFrame,
+                          labelsIntegerArray,
+                          crypto_constant.SWEEP_THREADS_PER_FIT_INTEGER,
+                          distanceSourceObject,
+                          centersFloatArray,
+                          silhouetteModeString))
+
+
+        sweepDictionary \
+            = crypto_sweep.ReturnSweepDictionaryFromScoresFunction \
+                (kValueNumbersIntegerList,
+                 inertiaFloatList,
+                 [scoresTuple[0] for scoresTuple in scoresTupleList],
+                 [scoresTuple[2] for scoresTuple in scoresTupleList],
+                 [scoresTuple[1] for scoresTuple in scoresTupleList],
+                 [0] * len(kValueNumbersIntegerList),
+                 [scoresTuple[3:] for scoresTuple in scoresTupleList])
+
+        crypto_constant \
+            .sweepResultsDictionary \
+                [sweepKeyTuple] \
+            = sweepDictionary
+
+
+        return sweepDictionary
+
+    except:
+
+        log_subroutine \
+            .PrintAndLogWriteText \
+                (f'The function, ReturnWardSweepDictionaryFunction, '
+                 + f'in source file, {CONSTANT_LOCAL_FILE_NAME}, '
+                 + f'was unable to return the Ward k-sweep results.')
+
+        return \
+            None
+
+
+# In[ ]:
+
+
+
+
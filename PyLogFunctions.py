@@ -24,13 +24,13 @@
  #  ----------      ------------------------------------    ------------------
  #  08/24/2023      Initial Development                     N. James George
  #  09/22/2023      Added ReturnStylerObjectSavePNGImage    N. James George
+ #  10/18/2026      ReturnStylerObjectSavePNGImage imports
+ #                  dataframe_image when it saves an image  agent
  #
  #******************************************************************************************/
 
 import PyLogConstants as log_constant
 
-import dataframe_image as dfi
-
 from datetime import date
 from datetime import datetime
 
@@ -308,6 +308,8 @@ def ReturnStylerObjectSavePNGImage \
         
         if log_constant.IMAGE_FLAG == True:
 
+            import dataframe_image as dfi
+
             imageFilePathStringVariable \
                 = ReturnImageFilePathString \
                     (captionString,
@@ -35,18 +35,15 @@
  #                                                          N. James George
  #  09/17/2023      Changed output file format from svg to png in SaveHVPlotImageToPNGFile
  #                                                          N. James George
+ #  10/18/2026      The image subroutines import their plotting
+ #                  libraries, so the logging subroutines load
+ #                  without them                            agent
  #
  #******************************************************************************************/
 
 import PyLogConstants as log_constant
 import PyLogFunctions as log_function
 
-import aspose.words as aw
-from bokeh.io import export_svg
-import holoviews as hv
-import matplotlib.pyplot as plt
-import hvplot.pandas
-
 import os
 import copy
 
@@ -670,6 +667,8 @@ def SavePlotImage \
         
         if log_constant.IMAGE_FLAG == True:
 
+            import matplotlib.pyplot as plt
+
             imageFilePathStringVariable \
                 = log_function \
                     .ReturnImageFilePathString \
@@ -733,6 +732,8 @@ def SaveHVPlotImageToHTMLFile \
         
         if log_constant.IMAGE_FLAG == True:
 
+            import hvplot
+
             hvPlotOverlay \
                 = copy \
                     .copy \
@@ -803,6 +804,8 @@ def ConvertSVGFileToPNG \
     
     try:
 
+        import aspose.words as aw
+
         asposeDocumentObject \
             = aw \
                 .Document()
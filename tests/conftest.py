@@ -0,0 +1,35 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+from sklearn.preprocessing import StandardScaler
+
+
+PACKAGE_DIRECTORY_STRING \
+    = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, PACKAGE_DIRECTORY_STRING)
+
+
+@pytest.fixture(scope = 'session')
+def rawDataFrame():
+
+    return \
+        pd.read_csv \
+            (os.path.join \
+                 (PACKAGE_DIRECTORY_STRING,
+                  'Resources',
+                  'CryptoMarketData.csv'),
+             index_col = 'coin_id')
+
+
+@pytest.fixture(scope = 'session')
+def normalizedDataFrame(rawDataFrame):
+
+    return \
+        pd.DataFrame \
+            (StandardScaler().fit_transform(rawDataFrame),
+             index = rawDataFrame.index,
+             columns = rawDataFrame.columns)
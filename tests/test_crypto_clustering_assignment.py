@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+import CryptoClusteringAssignment as crypto_assignment
+import CryptoClusteringPipeline as crypto_pipeline
+
+
+@pytest.fixture(scope = 'module')
+def assignmentTuple(rawDataFrame, tmp_path_factory):
+
+    pipelineObject \
+        = crypto_pipeline \
+            .CryptoClusteringPipeline \
+                (pcaComponentsInteger = 3,
+                 engineString = 'kmeans')
+
+    filePathString \
+        = str(tmp_path_factory.mktemp('model') / 'cluster_model.npz')
+
+    pipelineObject \
+        .SaveClusterModel \
+            (rawDataFrame,
+             4,
+             filePathString)
+
+    return \
+        crypto_assignment \
+            .ReturnClusterModelDictionaryFunction \
+                (filePathString), \
+        pipelineObject \
+            .ReturnClusterPredictions \
+                (rawDataFrame,
+                 [4])[0]
+
+
+def test_assignment_agrees_with_predict(rawDataFrame, assignmentTuple):
+
+    clusterModelDictionary, predictionsIntegerArray \
+        = assignmentTuple
+
+    np.testing.assert_array_equal \
+        (crypto_assignment \
+             .ReturnAssignedClustersFunction \
+                 (clusterModelDictionary,
+                  rawDataFrame),
+         predictionsIntegerArray)
+
+    # A bare array has the training column order.
+    np.testing.assert_array_equal \
+        (crypto_assignment \
+             .ReturnAssignedClustersFunction \
+                 (clusterModelDictionary,
+                  rawDataFrame.to_numpy()),
+         predictionsIntegerArray)
+
+
+def test_assignment_agrees_with_predict_for_large_features(rawDataFrame, tmp_path):
+
+    shiftedDataFrame \
+        = rawDataFrame + 1.0e6
+
+    pipelineObject \
+        = crypto_pipeline \
+            .CryptoClusteringPipeline \
+                (pcaComponentsInteger = None,
+                 engineString = 'kmeans')
+
+    filePathString \
+        = str(tmp_path / 'cluster_model.npz')
+
+    pipelineObject \
+        .SaveClusterModel \
+            (shiftedDataFrame,
+             4,
+             filePathString)
+
+    np.testing.assert_array_equal \
+        (crypto_assignment \
+             .ReturnAssignedClustersFunction \
+                 (crypto_assignment \
+                      .ReturnClusterModelDictionaryFunction \
+                          (filePathString),
+                  shiftedDataFrame),
+         pipelineObject \
+             .ReturnClusterPredictions \
+                 (shiftedDataFrame,
+                  [4])[0])
+
+
+def test_assignment_reorders_dataframe_columns(rawDataFrame, assignmentTuple):
+
+    clusterModelDictionary, predictionsIntegerArray \
+        = assignmentTuple
+
+    np.testing.assert_array_equal \
+        (crypto_assignment \
+             .ReturnAssignedClustersFunction \
+                 (clusterModelDictionary,
+                  rawDataFrame[rawDataFrame.columns[::-1]]),
+         predictionsIntegerArray)
+
+
+def test_assignment_rejects_mismatched_columns(rawDataFrame, assignmentTuple):
+
+    with pytest.raises(ValueError):
+
+        crypto_assignment \
+            .ReturnAssignedClustersFunction \
+                (assignmentTuple[0],
+                 rawDataFrame.drop(columns = rawDataFrame.columns[0]))
@@ -0,0 +1,51 @@
+import pandas as pd
+
+from sklearn.datasets import make_blobs
+
+import CryptoClusteringBootstrap as crypto_bootstrap
+
+
+def test_bootstrap_stability_is_deterministic(normalizedDataFrame):
+
+    serialTuple, parallelTuple \
+        = [crypto_bootstrap \
+               .ReturnBootstrapStabilityTupleFunction \
+                   (normalizedDataFrame,
+                    [3, 4],
+                    resamplesInteger = 4,
+                    maxWorkersInteger = maxWorkersInteger)
+           for maxWorkersInteger in (1, 2)]
+
+    pd.testing.assert_frame_equal(serialTuple[0], parallelTuple[0])
+
+    pd.testing.assert_frame_equal(serialTuple[1], parallelTuple[1])
+
+
+def test_bootstrap_stability_separates_true_and_over_split_k():
+
+    featureFloatArray, _ \
+        = make_blobs \
+            (n_samples = 300,
+             centers = 3,
+             cluster_std = 0.5,
+             random_state = 0)
+
+    stabilityDataFrame, coAssignmentDataFrame \
+        = crypto_bootstrap \
+            .ReturnBootstrapStabilityTupleFunction \
+                (pd.DataFrame(featureFloatArray),
+                 [3, 5],
+                 resamplesInteger = 4,
+                 maxWorkersInteger = 1)
+
+    # Three separated blobs are found again on every resample, while five
+    # clusters split them differently from resample to resample.
+    assert stabilityDataFrame.loc[3, 'Mean ARI'] == 1.0
+
+    assert stabilityDataFrame.loc[5, 'Mean ARI'] < 0.9
+
+    assert coAssignmentDataFrame.shape == (300, 2)
+
+    assert (coAssignmentDataFrame[3] == 1.0).all()
+
+    assert coAssignmentDataFrame[5].mean() < 0.95
@@ -0,0 +1,49 @@
+import pandas as pd
+import pytest
+
+from sklearn.cluster import KMeans
+from sklearn.datasets import make_blobs
+from sklearn.metrics import calinski_harabasz_score, silhouette_score
+
+import CryptoClusteringCoreset as crypto_coreset
+
+
+def test_coreset_scores_approximate_the_full_data_scores():
+
+    featureFloatArray \
+        = make_blobs \
+            (n_samples = 6000,
+             centers = 4,
+             cluster_std = 1.5,
+             random_state = 0)[0]
+
+    sweepDictionary \
+        = crypto_coreset \
+            .ReturnCoresetSweepDictionaryFunction \
+                (pd.DataFrame(featureFloatArray),
+                 [2, 3, 4, 5])
+
+    for kValueInteger in [2, 3, 4, 5]:
+
+        labelsIntegerArray \
+            = KMeans(n_clusters = kValueInteger, n_init = 4, random_state = 0) \
+                .fit_predict(featureFloatArray)
+
+        # A coreset row with weight w counts as w rows in the silhouette score.
+        assert sweepDictionary['Silhouette'][1][kValueInteger] \
+               == pytest.approx \
+                      (silhouette_score(featureFloatArray, labelsIntegerArray),
+                       abs = 0.02)
+
+        assert sweepDictionary['Calinski Harabasz'][1][kValueInteger] \
+               == pytest.approx \
+                      (calinski_harabasz_score(featureFloatArray, labelsIntegerArray),
+                       rel = 0.05)
+
+    checkDictionary \
+        = sweepDictionary['Coreset Check']
+
+    assert abs(checkDictionary['relative deviation']) < 0.05
+
+    assert checkDictionary['model'].cluster_centers_.shape \
+           == (checkDictionary['k'], 2)
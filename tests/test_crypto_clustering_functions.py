@@ -0,0 +1,328 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sklearn.cluster import KMeans
+from sklearn.datasets import make_blobs
+
+import CryptoClusteringConstants as crypto_constant
+import CryptoClusteringFunctions as crypto_function
+
+
+def test_rolling_memberships_keep_stable_labels():
+
+    randomGenerator \
+        = np.random.default_rng(0)
+
+    centersFloatArray \
+        = np.array([[0.0, 0.0], [10.0, 0.0], [0.0, 10.0]])
+
+    coinGroupIntegerArray \
+        = np.repeat(np.arange(3), 10)
+
+    coinStringList \
+        = [f'coin{coinInteger}' for coinInteger in range(30)]
+
+    snapshotDataFrameList \
+        = []
+
+    for snapshotInteger in range(6):
+
+        # Every snapshot lists the coins in a new order.
+        orderIntegerArray \
+            = randomGenerator.permutation(30)
+
+        snapshotDataFrameList \
+            .append \
+                (pd.DataFrame \
+                     (centersFloatArray[coinGroupIntegerArray[orderIntegerArray]]
+                      + randomGenerator.normal(scale = 0.5, size = (30, 2)),
+                      index \
+                          = pd.MultiIndex.from_product \
+                                ([[snapshotInteger],
+                                  [coinStringList[i] for i in orderIntegerArray]]),
+                      columns = ['x', 'y']))
+
+    membershipDataFrame, windowCentersFloatArray \
+        = crypto_function \
+            .ReturnRollingClusterMembershipTupleFunction \
+                (pd.concat(snapshotDataFrameList),
+                 3,
+                 windowSnapshotsInteger = 2)
+
+    assert windowCentersFloatArray.shape == (6, 3, 2)
+
+    # Every coin keeps one label in every snapshot, and the groups differ.
+    assert (membershipDataFrame.nunique() == 1).all()
+
+    firstLabelsSeries \
+        = membershipDataFrame.iloc[0][coinStringList]
+
+    assert firstLabelsSeries.groupby(coinGroupIntegerArray).nunique().eq(1).all()
+
+    assert firstLabelsSeries.nunique() == 3
+
+    # The aligned centroids of every window sit near the first window's.
+    assert np.abs(windowCentersFloatArray - windowCentersFloatArray[0]).max() < 1.0
+
+
+def test_gap_statistic_finds_the_blobs_in_serial_and_parallel(monkeypatch):
+
+    featureDataFrame \
+        = pd.DataFrame \
+            (make_blobs \
+                 (n_samples = 400,
+                  centers = 4,
+                  cluster_std = 0.6,
+                  random_state = 1)[0])
+
+    gapTupleList \
+        = []
+
+    for maxWorkersInteger in (2, 1):
+
+        monkeypatch.setattr \
+            (crypto_constant,
+             'gapReferenceDictionary',
+             {})
+
+        gapTupleList \
+            .append \
+                (crypto_function \
+                     .ReturnOptimalKWithGapStatisticFunction \
+                         (featureDataFrame,
+                          [2, 3, 4, 5, 6],
+                          referencesInteger = 5,
+                          maxWorkersInteger = maxWorkersInteger))
+
+    # The reference seeds do not depend on the worker count.
+    assert gapTupleList[0][0] == gapTupleList[1][0] == 4
+
+    pd.testing.assert_series_equal \
+        (gapTupleList[0][1],
+         gapTupleList[1][1])
+
+    assert gapTupleList[1][1].idxmax() == 4
+
+    # A second call reads the cached reference datasets.
+    referenceFloatArray \
+        = next(iter(crypto_constant.gapReferenceDictionary.values()))
+
+    crypto_function \
+        .ReturnOptimalKWithGapStatisticFunction \
+            (featureDataFrame,
+             [2, 3, 4, 5, 6],
+             referencesInteger = 5,
+             maxWorkersInteger = 1)
+
+    assert len(crypto_constant.gapReferenceDictionary) == 1
+
+    assert next(iter(crypto_constant.gapReferenceDictionary.values())) \
+           is referenceFloatArray
+
+
+def test_feature_subset_ranking_puts_the_clustered_columns_first():
+
+    randomGenerator \
+        = np.random.default_rng(0)
+
+    # Only the first two columns carry the clusters.
+    featureDataFrame \
+        = pd.DataFrame \
+            (np.hstack \
+                 ([make_blobs \
+                       (n_samples = 150,
+                        centers = 3,
+                        cluster_std = 0.5,
+                        random_state = 0)[0],
+                   randomGenerator.normal(scale = 3.0, size = (150, 2))]),
+             columns = ['a', 'b', 'noise1', 'noise2'])
+
+    rankingDataFrameList \
+        = [crypto_function \
+               .ReturnFeatureSubsetRankingDataFrameFunction \
+                   (featureDataFrame,
+                    [2, 3, 4],
+                    [2],
+                    'Silhouette',
+                    maxWorkersInteger)
+           for maxWorkersInteger in (1, 2)]
+
+    pd.testing.assert_frame_equal \
+        (rankingDataFrameList[0],
+         rankingDataFrameList[1])
+
+    assert len(rankingDataFrameList[0]) == 6
+
+    assert rankingDataFrameList[0].index[0] == 'a, b'
+
+    assert rankingDataFrameList[0].iloc[0]['Silhouette K'] == 3
+
+
+def test_cluster_diagnostics_match_a_per_cluster_loop():
+
+    featureDataFrame \
+        = pd.DataFrame \
+            (make_blobs \
+                 (n_samples = 200,
+                  n_features = 3,
+                  centers = 4,
+                  random_state = 0)[0],
+             columns = ['a', 'b', 'c'])
+
+    labelsIntegerArray \
+        = KMeans(n_clusters = 4, n_init = 4, random_state = 0) \
+            .fit_predict(featureDataFrame)
+
+    weightFloatArray \
+        = np.random.default_rng(0) \
+            .uniform(0.5, 2.0, len(featureDataFrame))
+
+    # Without centers, the centroids are the clusters' weighted means.
+    diagnosticsDataFrame \
+        = crypto_function \
+            .ReturnClusterDiagnosticsDataFrameFunction \
+                (featureDataFrame,
+                 labelsIntegerArray,
+                 None,
+                 pd.Series(weightFloatArray))
+
+    featureFloatArray \
+        = featureDataFrame.to_numpy()
+
+    centersFloatArray \
+        = np.array \
+            ([np.average \
+                  (featureFloatArray[labelsIntegerArray == clusterInteger],
+                   axis = 0,
+                   weights = weightFloatArray[labelsIntegerArray == clusterInteger])
+              for clusterInteger in range(4)])
+
+    for clusterInteger in range(4):
+
+        clusterBooleanArray \
+            = labelsIntegerArray == clusterInteger
+
+        distanceFloatArray \
+            = np.linalg.norm \
+                (featureFloatArray[clusterBooleanArray] - centersFloatArray[clusterInteger],
+                 axis = 1)
+
+        centerDistanceFloatArray \
+            = np.linalg.norm \
+                (centersFloatArray - centersFloatArray[clusterInteger],
+                 axis = 1)
+
+        centerDistanceFloatArray[clusterInteger] \
+            = np.inf
+
+        diagnosticsSeries \
+            = diagnosticsDataFrame \
+                .set_index('Cluster') \
+                .loc[clusterInteger]
+
+        assert diagnosticsSeries['Size'] == clusterBooleanArray.sum()
+
+        assert diagnosticsSeries['Weight'] \
+               == pytest.approx(weightFloatArray[clusterBooleanArray].sum())
+
+        assert diagnosticsSeries['Radius'] \
+               == pytest.approx \
+                      (np.sqrt \
+                           (np.average \
+                                (distanceFloatArray ** 2,
+                                 weights = weightFloatArray[clusterBooleanArray])))
+
+        assert diagnosticsSeries['Mean Distance'] \
+               == pytest.approx \
+                      (np.average \
+                           (distanceFloatArray,
+                            weights = weightFloatArray[clusterBooleanArray]))
+
+        assert diagnosticsSeries['Max Distance'] \
+               == pytest.approx(distanceFloatArray.max())
+
+        assert diagnosticsSeries['Nearest Cluster'] == np.argmin(centerDistanceFloatArray)
+
+        assert diagnosticsSeries['Separation'] \
+               == pytest.approx(centerDistanceFloatArray.min())
+
+        np.testing.assert_allclose \
+            (diagnosticsSeries[['a', 'b', 'c']].to_numpy(dtype = np.float64),
+             centersFloatArray[clusterInteger])
+
+
+@pytest.mark.parametrize('methodString', ['median', 'kmeans'])
+def test_outlier_screen_keeps_extreme_rows_out_of_the_fit(methodString):
+
+    # Two extreme coins next to three blobs.
+    featureDataFrame \
+        = pd.DataFrame \
+            (np.vstack \
+                 ([make_blobs \
+                       (n_samples = 200,
+                        n_features = 3,
+                        centers = 3,
+                        cluster_std = 0.8,
+                        random_state = 0)[0],
+                   [[40.0, 40.0, 40.0], [-40.0, 30.0, 0.0]]]),
+             index = [f'coin{rowInteger}' for rowInteger in range(202)],
+             columns = ['a', 'b', 'c'])
+
+    screenedDataFrame, weightSeries, screenDictionary \
+        = crypto_function \
+            .ReturnOutlierScreenTupleFunction \
+                (featureDataFrame,
+                 methodString,
+                 3.5,
+                 'exclude')
+
+    assert list(screenDictionary['outliers']) == ['coin200', 'coin201']
+
+    assert weightSeries is None
+
+    pd.testing.assert_frame_equal \
+        (screenedDataFrame,
+         featureDataFrame.iloc[:200])
+
+    # Without the screen, one extreme coin takes a k value of its own; with
+    # it, the three blobs are the clusters, and the excluded coins still get
+    # labels.
+    assert np.bincount \
+               (crypto_function \
+                    .ReturnClusterPredictionsFunction \
+                        (featureDataFrame,
+                         [3],
+                         'kmeans')[0]).min() == 1
+
+    labelsIntegerArray \
+        = crypto_function \
+            .ReturnClusterPredictionsFunction \
+                (featureDataFrame,
+                 [3],
+                 'kmeans',
+                 None,
+                 screenDictionary)[0]
+
+    assert len(labelsIntegerArray) == 202
+
+    assert np.bincount(labelsIntegerArray).min() >= 66
+
+    # The 'downweight' action keeps every row and scales the outliers' weights
+    # by the threshold over their scores.
+    screenedDataFrame, weightSeries, screenDictionary \
+        = crypto_function \
+            .ReturnOutlierScreenTupleFunction \
+                (featureDataFrame,
+                 methodString,
+                 3.5,
+                 'downweight')
+
+    assert len(screenedDataFrame) == 202
+
+    scoreFloatArray \
+        = screenDictionary['scores'].to_numpy()
+
+    np.testing.assert_allclose \
+        (weightSeries.to_numpy(),
+         np.where(scoreFloatArray > 3.5, 3.5 / scoreFloatArray, 1.0))
@@ -0,0 +1,97 @@
+import collections
+
+import numpy as np
+import pandas as pd
+
+from sklearn.decomposition import PCA
+from sklearn.preprocessing import StandardScaler
+
+import CryptoClusteringConstants as crypto_constant
+import CryptoClusteringPipeline as crypto_pipeline
+import CryptoClusteringSweep as crypto_sweep
+
+
+def test_pipeline_matches_the_manual_analysis(rawDataFrame, normalizedDataFrame):
+
+    pipelineObject \
+        = crypto_pipeline \
+            .CryptoClusteringPipeline \
+                (pcaComponentsInteger = 3,
+                 kValueIntegerList = [2, 3, 4, 5])
+
+    pd.testing.assert_frame_equal \
+        (pipelineObject.ReturnScaledDataFrame(rawDataFrame),
+         normalizedDataFrame)
+
+    pcaFloatArray \
+        = PCA(n_components = 3, random_state = crypto_constant.RANDOM_STATE_INTEGER) \
+            .fit_transform(StandardScaler().fit_transform(rawDataFrame))
+
+    featureDataFrame \
+        = pipelineObject.ReturnFeatureDataFrame(rawDataFrame)
+
+    np.testing.assert_allclose \
+        (featureDataFrame.to_numpy(),
+         pcaFloatArray)
+
+    assert pipelineObject.ReturnOptimalKDictionary(rawDataFrame) \
+           == {methodString: int(optimalKTuple[0])
+               for methodString, optimalKTuple \
+                   in crypto_sweep \
+                          .ReturnKMeansSweepDictionaryFunction \
+                              (featureDataFrame,
+                               kValueIntegerList = [2, 3, 4, 5]) \
+                          .items()
+               if methodString in ['Wcss Elbow',
+                                   'Calinski Harabasz',
+                                   'Silhouette',
+                                   'Davies Bouldin']}
+
+
+def test_stage_cache_reuses_and_evicts_stages(rawDataFrame, monkeypatch):
+
+    monkeypatch.setattr \
+        (crypto_constant,
+         'pipelineStagesOrderedDictionary',
+         collections.OrderedDict())
+
+    monkeypatch.setattr \
+        (crypto_constant,
+         'pipelineStagesCacheBytesInteger',
+         0)
+
+    pipelineObject \
+        = crypto_pipeline \
+            .CryptoClusteringPipeline \
+                (pcaComponentsInteger = 2)
+
+    scalerStageTuple \
+        = pipelineObject.ReturnScalerStageTuple(rawDataFrame)
+
+    # A second pipeline on the same input reuses the fitted scaler.
+    assert crypto_pipeline \
+               .CryptoClusteringPipeline() \
+               .ReturnScalerStageTuple(rawDataFrame) is scalerStageTuple
+
+    stageBytesInteger \
+        = int(scalerStageTuple[1].memory_usage().sum())
+
+    crypto_pipeline \
+        .ReturnCachedPipelineStageTupleFunction \
+            (('scaler',
+              crypto_sweep.ReturnDataFrameContentHashStringFunction(rawDataFrame)),
+             scalerStageTuple)
+
+    assert crypto_constant.pipelineStagesCacheBytesInteger == stageBytesInteger
+
+    # With room for one stage, the PCA stage evicts the scaler stage.
+    monkeypatch.setattr \
+        (crypto_constant,
+         'PIPELINE_STAGES_MAX_BYTES_INTEGER',
+         stageBytesInteger)
+
+    pipelineObject.ReturnFeatureDataFrame(rawDataFrame)
+
+    assert [stageKeyTuple[0]
+            for stageKeyTuple in crypto_constant.pipelineStagesOrderedDictionary] \
+           == ['pca']
@@ -0,0 +1,83 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+import CryptoClusteringConstants as crypto_constant
+import CryptoClusteringSharedMemory as crypto_shared_memory
+
+
+def test_shared_feature_matrix_round_trips_through_the_workers(normalizedDataFrame):
+
+    sharedMemoryObject, descriptorDictionary \
+        = crypto_shared_memory \
+            .ReturnSharedFeatureMatrixTupleFunction \
+                (normalizedDataFrame)
+
+    executorObject \
+        = ProcessPoolExecutor \
+            (max_workers = 2,
+             initializer = crypto_shared_memory.InitializeFeatureMatrixWorker,
+             initargs = (descriptorDictionary, None))
+
+    try:
+
+        featureDataFrameList \
+            = crypto_shared_memory \
+                .ReturnTaskResultsListFunction \
+                    (executorObject,
+                     crypto_shared_memory.ReturnFeatureDataFrameFunction,
+                     [(descriptorDictionary,)] * 4)
+
+    finally:
+
+        crypto_shared_memory \
+            .ShutdownFeatureMatrixExecutor \
+                (executorObject,
+                 sharedMemoryObject)
+
+    for featureDataFrame in featureDataFrameList:
+
+        pd.testing.assert_frame_equal \
+            (featureDataFrame,
+             normalizedDataFrame.reset_index(drop = True))
+
+    assert sharedMemoryObject.buf is None
+
+
+def test_detach_closes_the_attached_feature_matrices(normalizedDataFrame):
+
+    sharedMemoryObject, descriptorDictionary \
+        = crypto_shared_memory \
+            .ReturnSharedFeatureMatrixTupleFunction \
+                (normalizedDataFrame)
+
+    try:
+
+        featureDataFrame \
+            = crypto_shared_memory \
+                .ReturnFeatureDataFrameFunction \
+                    (descriptorDictionary)
+
+        assert (featureDataFrame.to_numpy() \
+                == normalizedDataFrame.to_numpy()).all()
+
+        attachedMemoryObject \
+            = crypto_constant \
+                .attachedFeatureMatrixDictionary \
+                    [descriptorDictionary['name']][0]
+
+        del featureDataFrame
+
+        crypto_shared_memory \
+            .DetachSharedFeatureMatrices()
+
+        assert crypto_constant.attachedFeatureMatrixDictionary == {}
+
+        assert attachedMemoryObject.buf is None
+
+    finally:
+
+        crypto_shared_memory \
+            .ShutdownFeatureMatrixExecutor \
+                (None,
+                 sharedMemoryObject)
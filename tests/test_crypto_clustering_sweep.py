@@ -0,0 +1,858 @@
+import collections
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sklearn.cluster import KMeans
+from sklearn.datasets import make_blobs
+from sklearn.decomposition import IncrementalPCA, PCA
+from sklearn.metrics import calinski_harabasz_score, davies_bouldin_score, pairwise_distances, silhouette_score
+
+import CryptoClusteringConstants as crypto_constant
+import CryptoClusteringFunctions as crypto_function
+import CryptoClusteringSweep as crypto_sweep
+
+
+def test_sweep_scores_every_method_from_one_set_of_fits(normalizedDataFrame):
+
+    sweepDictionary \
+        = crypto_sweep \
+            .ReturnKMeansSweepDictionaryFunction \
+                (normalizedDataFrame)
+
+    # The results are cached, so the four methods read the same sweep.
+    assert crypto_sweep \
+               .ReturnKMeansSweepDictionaryFunction \
+                   (normalizedDataFrame) is sweepDictionary
+
+    for methodString, optimalKFunction \
+            in [('Wcss Elbow',
+                 crypto_function.ReturnOptimalKWithWCSSElbowFunction),
+                ('Calinski Harabasz',
+                 crypto_function.ReturnOptimalKWithCalinskiHarabaszFunction),
+                ('Silhouette',
+                 crypto_function.ReturnOptimalKWithSilhouetteFunction),
+                ('Davies Bouldin',
+                 crypto_function.ReturnOptimalKWithDaviesBouldinFunction)]:
+
+        optimalKInteger, scoresFloatSeries \
+            = optimalKFunction(normalizedDataFrame)
+
+        assert optimalKInteger == sweepDictionary[methodString][0]
+
+        pd.testing.assert_series_equal \
+            (scoresFloatSeries,
+             sweepDictionary[methodString][1])
+
+    assert list(sweepDictionary['Wcss Elbow'][1].index) \
+           == crypto_constant.K_VALUE_INTEGER_LIST
+
+
+def test_sweep_scores_match_scikit_learn(normalizedDataFrame):
+
+    sweepDictionary \
+        = crypto_sweep \
+            .ReturnKMeansSweepDictionaryFunction \
+                (normalizedDataFrame,
+                 kValueIntegerList = [3, 4],
+                 silhouetteModeString = 'exact',
+                 cacheFlagBoolean = False)
+
+    for kInteger in [3, 4]:
+
+        labelsIntegerArray \
+            = KMeans \
+                (n_clusters = kInteger,
+                 n_init = 10,
+                 random_state = 0) \
+                .fit_predict(normalizedDataFrame)
+
+        # The sweep keeps the best of its restarts, which finds the same
+        # partition as scikit-learn on this small input.
+        assert sweepDictionary['Calinski Harabasz'][1][kInteger] \
+               == pytest.approx \
+                      (calinski_harabasz_score \
+                           (normalizedDataFrame,
+                            labelsIntegerArray),
+                       rel = 1e-9)
+
+        assert sweepDictionary['Silhouette'][1][kInteger] \
+               == pytest.approx \
+                      (silhouette_score \
+                           (normalizedDataFrame,
+                            labelsIntegerArray),
+                       rel = 1e-9)
+
+    assert np.all(np.diff(sweepDictionary['Wcss Elbow'][1].to_numpy()) < 0.0)
+
+
+def test_model_cache_counts_a_replaced_model_once(normalizedDataFrame, monkeypatch):
+
+    monkeypatch.setattr \
+        (crypto_constant,
+         'fittedModelsOrderedDictionary',
+         collections.OrderedDict())
+
+    monkeypatch.setattr \
+        (crypto_constant,
+         'fittedModelsCacheBytesInteger',
+         0)
+
+    modelKMeansObject \
+        = crypto_sweep \
+            .ReturnFittedKMeansModelFunction \
+                (normalizedDataFrame,
+                 3,
+                 nInitInteger = 4)
+
+    # The second call reads the cached model.
+    assert crypto_sweep \
+               .ReturnFittedKMeansModelFunction \
+                   (normalizedDataFrame,
+                    3,
+                    nInitInteger = 4) is modelKMeansObject
+
+    modelBytesInteger \
+        = modelKMeansObject.labels_.nbytes \
+          + modelKMeansObject.cluster_centers_.nbytes
+
+    assert crypto_constant.fittedModelsCacheBytesInteger == modelBytesInteger
+
+    modelKeyTuple \
+        = next(iter(crypto_constant.fittedModelsOrderedDictionary))
+
+    for _ in range(2):
+
+        crypto_sweep \
+            .ReturnCachedKMeansModelFunction \
+                (modelKeyTuple,
+                 modelKMeansObject)
+
+    assert len(crypto_constant.fittedModelsOrderedDictionary) == 1
+
+    assert crypto_constant.fittedModelsCacheBytesInteger == modelBytesInteger
+
+
+def test_model_cache_evicts_the_least_recently_used_model(normalizedDataFrame, monkeypatch):
+
+    monkeypatch.setattr \
+        (crypto_constant,
+         'fittedModelsOrderedDictionary',
+         collections.OrderedDict())
+
+    monkeypatch.setattr \
+        (crypto_constant,
+         'fittedModelsCacheBytesInteger',
+         0)
+
+    modelKMeansObjectList \
+        = [KMeans(n_clusters = kInteger, n_init = 1, random_state = 0) \
+               .fit(normalizedDataFrame)
+           for kInteger in [2, 3, 4]]
+
+    # The cap holds the two largest models but not all three.
+    monkeypatch.setattr \
+        (crypto_constant,
+         'MODEL_CACHE_MAX_BYTES_INTEGER',
+         sum(modelKMeansObject.labels_.nbytes
+             + modelKMeansObject.cluster_centers_.nbytes
+             for modelKMeansObject in modelKMeansObjectList[1:]))
+
+    for kInteger, modelKMeansObject in zip([2, 3, 4], modelKMeansObjectList):
+
+        crypto_sweep \
+            .ReturnCachedKMeansModelFunction \
+                (('key', kInteger),
+                 modelKMeansObject)
+
+    assert list(crypto_constant.fittedModelsOrderedDictionary) \
+           == [('key', 3), ('key', 4)]
+
+    assert crypto_constant.fittedModelsCacheBytesInteger \
+           == crypto_constant.MODEL_CACHE_MAX_BYTES_INTEGER
+
+
+def test_parallel_sweep_matches_serial_sweep(normalizedDataFrame):
+
+    serialDictionary, parallelDictionary \
+        = [crypto_sweep \
+               .ReturnKMeansSweepDictionaryFunction \
+                   (normalizedDataFrame,
+                    maxWorkersInteger = maxWorkersInteger,
+                    kValueIntegerList = [2, 3, 4, 5],
+                    cacheFlagBoolean = False)
+           for maxWorkersInteger in (1, 2)]
+
+    for methodString in ['Wcss Elbow',
+                         'Calinski Harabasz',
+                         'Silhouette',
+                         'Davies Bouldin']:
+
+        assert serialDictionary[methodString][0] \
+               == parallelDictionary[methodString][0]
+
+        pd.testing.assert_series_equal \
+            (serialDictionary[methodString][1],
+             parallelDictionary[methodString][1],
+             check_exact = True)
+
+
+
+def test_mini_batch_sweep_finds_the_blobs_from_row_chunks():
+
+    featureFloatArray \
+        = make_blobs \
+            (n_samples = 3000,
+             centers = 4,
+             cluster_std = 0.6,
+             random_state = 0)[0]
+
+    for rowSourceObject \
+            in [featureFloatArray,
+                lambda: (featureFloatArray[firstRowInteger:firstRowInteger + 500]
+                         for firstRowInteger in range(0, 3000, 500))]:
+
+        sweepDictionary \
+            = crypto_sweep \
+                .ReturnMiniBatchKMeansSweepDictionaryFunction \
+                    (rowSourceObject,
+                     [2, 3, 4, 5, 6])
+
+        for methodString in ['Wcss Elbow',
+                             'Calinski Harabasz',
+                             'Silhouette',
+                             'Davies Bouldin']:
+
+            assert sweepDictionary[methodString][0] == 4
+
+        assert sweepDictionary['Wcss Elbow'][1][4] \
+               == pytest.approx \
+                      (KMeans(n_clusters = 4, n_init = 4, random_state = 0) \
+                           .fit(featureFloatArray) \
+                           .inertia_,
+                       rel = 0.01)
+
+    modelMiniBatchKMeansObject \
+        = crypto_sweep \
+            .ReturnMiniBatchKMeansModelFunction \
+                (featureFloatArray,
+                 4)
+
+    np.testing.assert_array_equal \
+        (modelMiniBatchKMeansObject.labels_,
+         modelMiniBatchKMeansObject.predict(featureFloatArray))
+
+
+def test_restart_chunk_counts_the_iterations_of_every_restart(normalizedDataFrame):
+
+    modelKMeansObject \
+        = crypto_sweep \
+            .ReturnKMeansRestartsModelFunction \
+                (normalizedDataFrame,
+                 3,
+                 10,
+                 0,
+                 'lloyd',
+                 1)
+
+    # One fit with all of the restarts keeps the same model.
+    referenceKMeansObject \
+        = KMeans(n_clusters = 3, n_init = 10, random_state = 0) \
+            .fit(normalizedDataFrame)
+
+    np.testing.assert_array_equal \
+        (modelKMeansObject.cluster_centers_,
+         referenceKMeansObject.cluster_centers_)
+
+    randomStateObject \
+        = np.random.RandomState(0)
+
+    assert modelKMeansObject.total_n_iter_ \
+           == sum(KMeans(n_clusters = 3, n_init = 1, random_state = randomStateObject) \
+                      .fit(normalizedDataFrame) \
+                      .n_iter_
+                  for _ in range(10))
+
+
+def test_warm_sweep_fits_nearly_as_well_as_cold_sweep(normalizedDataFrame):
+
+    coldDictionary, warmDictionary \
+        = [crypto_sweep \
+               .ReturnKMeansSweepDictionaryFunction \
+                   (normalizedDataFrame,
+                    sweepModeString = sweepModeString,
+                    cacheFlagBoolean = False)
+           for sweepModeString in ('cold', 'warm')]
+
+    assert (warmDictionary['Wcss Elbow'][1]
+            <= coldDictionary['Wcss Elbow'][1] * 1.05).all()
+
+    # The cold sweep counts every restart, so the warm sweep saves iterations.
+    assert (warmDictionary['Iterations'] < coldDictionary['Iterations']).all()
+
+
+def test_early_stop_ends_the_sweep_after_the_patience(normalizedDataFrame):
+
+    fullDictionary \
+        = crypto_sweep \
+            .ReturnKMeansSweepDictionaryFunction \
+                (normalizedDataFrame,
+                 kValueIntegerList = list(range(2, 9)),
+                 cacheFlagBoolean = False)
+
+    stoppedDictionary \
+        = crypto_sweep \
+            .ReturnKMeansSweepDictionaryFunction \
+                (normalizedDataFrame,
+                 maxWorkersInteger = 1,
+                 kValueIntegerList = list(range(2, 9)),
+                 earlyStopMethodString = 'Silhouette',
+                 patienceInteger = 2,
+                 cacheFlagBoolean = False)
+
+    optimalKInteger \
+        = fullDictionary['Silhouette'][0]
+
+    assert stoppedDictionary['Silhouette'][0] == optimalKInteger
+
+    # The sweep stops once two k values past the optimum do not improve it.
+    assert list(stoppedDictionary['Silhouette'][1].index) \
+           == list(range(2, optimalKInteger + 3))
+
+    pd.testing.assert_series_equal \
+        (stoppedDictionary['Calinski Harabasz'][1],
+         fullDictionary['Calinski Harabasz'][1].loc[:optimalKInteger + 2])
+
+
+def test_distance_matrix_is_computed_once_per_input(normalizedDataFrame, monkeypatch):
+
+    monkeypatch.setattr \
+        (crypto_constant,
+         'distanceMatricesOrderedDictionary',
+         collections.OrderedDict())
+
+    uncachedFloatArray \
+        = crypto_sweep \
+            .ReturnPairwiseDistanceMatrixFunction \
+                (normalizedDataFrame,
+                 'float64',
+                 cacheFlagBoolean = False)
+
+    assert len(crypto_constant.distanceMatricesOrderedDictionary) == 0
+
+    np.testing.assert_allclose \
+        (uncachedFloatArray,
+         pairwise_distances(normalizedDataFrame),
+         atol = 1e-12)
+
+    distanceFloatArray \
+        = crypto_sweep \
+            .ReturnPairwiseDistanceMatrixFunction \
+                (normalizedDataFrame,
+                 'float64')
+
+    # The second call reads the cached matrix.
+    assert crypto_sweep \
+               .ReturnPairwiseDistanceMatrixFunction \
+                   (normalizedDataFrame,
+                    'float64') is distanceFloatArray
+
+    np.testing.assert_array_equal \
+        (distanceFloatArray,
+         uncachedFloatArray)
+
+
+def test_sampled_silhouette_interval_covers_the_exact_score(monkeypatch):
+
+    featureFloatArray \
+        = make_blobs \
+            (n_samples = 4000,
+             centers = 4,
+             cluster_std = 2.0,
+             random_state = 0)[0]
+
+    labelsIntegerArray \
+        = KMeans(n_clusters = 4, n_init = 4, random_state = 0) \
+            .fit_predict(featureFloatArray)
+
+    monkeypatch.setattr \
+        (crypto_constant,
+         'SILHOUETTE_SAMPLE_ROWS_INTEGER',
+         500)
+
+    meanFloat, lowerFloat, upperFloat \
+        = crypto_sweep \
+            .ReturnSampledSilhouetteTupleFunction \
+                (featureFloatArray,
+                 labelsIntegerArray,
+                 4)
+
+    assert lowerFloat <= meanFloat <= upperFloat
+
+    assert lowerFloat \
+           <= silhouette_score(featureFloatArray, labelsIntegerArray) \
+           <= upperFloat
+
+
+def test_stratified_sample_keeps_small_clusters():
+
+    labelsIntegerArray \
+        = np.repeat([0, 1], [1000, 3])
+
+    indexIntegerArray \
+        = crypto_sweep \
+            .ReturnStratifiedSampleIndexArrayFunction \
+                (labelsIntegerArray,
+                 100,
+                 np.random.default_rng(0))
+
+    assert (np.diff(indexIntegerArray) > 0).all()
+
+    assert np.bincount(labelsIntegerArray[indexIntegerArray]).tolist() == [100, 2]
+
+
+def test_simplified_silhouette_measures_rows_against_the_centers():
+
+    featureFloatArray \
+        = make_blobs \
+            (n_samples = 600,
+             centers = 3,
+             random_state = 0)[0]
+
+    modelKMeansObject \
+        = KMeans(n_clusters = 3, n_init = 4, random_state = 0) \
+            .fit(featureFloatArray)
+
+    centerDistanceFloatArray \
+        = pairwise_distances \
+            (featureFloatArray,
+             modelKMeansObject.cluster_centers_)
+
+    ownFloatArray \
+        = centerDistanceFloatArray \
+            [np.arange(600), modelKMeansObject.labels_]
+
+    centerDistanceFloatArray[np.arange(600), modelKMeansObject.labels_] \
+        = np.inf
+
+    nearestFloatArray \
+        = centerDistanceFloatArray.min(axis = 1)
+
+    assert crypto_sweep \
+               .ReturnSimplifiedSilhouetteFloatFunction \
+                   (featureFloatArray,
+                    modelKMeansObject.labels_,
+                    modelKMeansObject.cluster_centers_) \
+           == pytest.approx \
+                  (np.mean \
+                       ((nearestFloatArray - ownFloatArray)
+                        / np.maximum(nearestFloatArray, ownFloatArray)),
+                   rel = 1e-12)
+
+    assert crypto_sweep.ReturnSilhouetteModeStringFunction(600, 'auto') == 'exact'
+
+    assert crypto_sweep \
+               .ReturnSilhouetteModeStringFunction \
+                   (crypto_constant.SILHOUETTE_EXACT_MAX_ROWS_INTEGER + 1,
+                    'auto') \
+           == crypto_constant.SILHOUETTE_LARGE_INPUT_MODE_STRING
+
+
+def test_davies_bouldin_matches_scikit_learn(normalizedDataFrame):
+
+    featureFloatArray \
+        = normalizedDataFrame.to_numpy()
+
+    labelsIntegerArray \
+        = KMeans(n_clusters = 4, n_init = 4, random_state = 0) \
+            .fit_predict(featureFloatArray)
+
+    centersFloatArray \
+        = np.array \
+            ([featureFloatArray[labelsIntegerArray == clusterInteger].mean(axis = 0)
+              for clusterInteger in range(4)])
+
+    clusterScatterFloatArray \
+        = np.bincount \
+            (labelsIntegerArray,
+             weights \
+                 = np.linalg.norm \
+                       (featureFloatArray - centersFloatArray[labelsIntegerArray],
+                        axis = 1)) \
+          / np.bincount(labelsIntegerArray)
+
+    assert crypto_sweep \
+               .ReturnDaviesBouldinFloatFunction \
+                   (clusterScatterFloatArray,
+                    centersFloatArray) \
+           == pytest.approx \
+                  (davies_bouldin_score(featureFloatArray, labelsIntegerArray),
+                   rel = 1e-12)
+
+    # The sweep selects the Davies-Bouldin minimum.
+    optimalKInteger, scoresFloatSeries \
+        = crypto_sweep \
+            .ReturnKMeansSweepDictionaryFunction \
+                (normalizedDataFrame) \
+                    ['Davies Bouldin']
+
+    assert optimalKInteger == scoresFloatSeries.idxmin()
+
+
+def test_adaptive_restarts_stop_once_the_inertia_settles(monkeypatch):
+
+    featureDataFrame \
+        = pd.DataFrame \
+            (make_blobs \
+                 (n_samples = 1000,
+                  centers = 4,
+                  cluster_std = 0.5,
+                  random_state = 0)[0])
+
+    monkeypatch.setattr \
+        (crypto_constant,
+         'ADAPTIVE_N_INIT_BATCH_INTEGER',
+         10)
+
+    modelKMeansObject, restartsInteger \
+        = crypto_sweep \
+            .ReturnAdaptiveKMeansModelTupleFunction \
+                (featureDataFrame,
+                 4,
+                 100,
+                 0,
+                 'lloyd',
+                 1)
+
+    # The first batch finds the blobs, and the patience ends the restarts.
+    assert restartsInteger \
+           == 10 * (1 + crypto_constant.ADAPTIVE_N_INIT_PATIENCE_INTEGER)
+
+    assert modelKMeansObject.inertia_ \
+           == pytest.approx \
+                  (KMeans(n_clusters = 4, n_init = 100, random_state = 0) \
+                       .fit(featureDataFrame) \
+                       .inertia_,
+                   rel = 1e-9)
+
+
+def test_auto_backend_follows_the_cost_model(monkeypatch):
+
+    # The cost model predicts log seconds from log rows, features, and k
+    # values; here 'elkan' and 'minibatch' are the cheapest backends.
+    monkeypatch.setattr \
+        (crypto_constant,
+         'backendCostModelDictionary',
+         {'lloyd': np.array([0.0, 1.0, 1.0, 1.0]),
+          'elkan': np.array([-1.0, 1.0, 1.0, 1.0]),
+          'minibatch': np.array([-2.0, 1.0, 1.0, 1.0]),
+          'bisecting': np.array([0.0, 1.0, 1.0, 1.0])})
+
+    monkeypatch.setattr \
+        (crypto_constant,
+         'backendDecisionsDictionary',
+         {})
+
+    largeRowsInteger \
+        = crypto_constant.BACKEND_APPROXIMATE_MIN_ROWS_INTEGER
+
+    assert crypto_sweep \
+               .ReturnKMeansAlgorithmStringFunction \
+                   (largeRowsInteger, 5, 4, 10, 'auto') == 'minibatch'
+
+    # Full-batch callers and small inputs choose between the exact backends.
+    assert crypto_sweep \
+               .ReturnKMeansAlgorithmStringFunction \
+                   (largeRowsInteger, 5, 4, 10, 'auto',
+                    fullBatchFlagBoolean = True) == 'elkan'
+
+    assert crypto_sweep \
+               .ReturnKMeansAlgorithmStringFunction \
+                   (largeRowsInteger - 1, 5, 4, 10, 'auto') == 'elkan'
+
+    assert crypto_sweep \
+               .ReturnKMeansAlgorithmStringFunction \
+                   (largeRowsInteger, 5, 4, 10, 'lloyd') == 'lloyd'
+
+    assert len(crypto_constant.backendDecisionsDictionary) == 3
+
+
+def test_reductions_match_exact_pca():
+
+    randomGenerator \
+        = np.random.default_rng(0)
+
+    # A wide input of rank eight plus a little noise.
+    featureFloatArray \
+        = randomGenerator.normal(size = (500, 8)) \
+          @ randomGenerator.normal(size = (8, 300)) \
+          + randomGenerator.normal(scale = 0.01, size = (500, 300))
+
+    pcaObject \
+        = PCA(n_components = 8) \
+            .fit(featureFloatArray)
+
+    meanFloatArray, componentsFloatArray, varianceFloatArray, totalVarianceFloat \
+        = crypto_sweep \
+            .ReturnRandomizedSVDTupleFunction \
+                (featureFloatArray,
+                 5)
+
+    np.testing.assert_allclose \
+        (varianceFloatArray,
+         pcaObject.explained_variance_[:5],
+         rtol = 1e-6)
+
+    # The variance threshold keeps the eight real components.
+    reducedDataFrame, varianceDataFrame, projectionDictionary \
+        = crypto_sweep \
+            .ReturnReducedFeatureTupleFunction \
+                (featureFloatArray,
+                 varianceThresholdFloat = 0.99)
+
+    assert projectionDictionary['method'] == 'randomized'
+
+    assert list(reducedDataFrame.columns) \
+           == [f'PCA{componentInteger}' for componentInteger in range(1, 9)]
+
+    # A chunk function is a tall source, which IncrementalPCA reduces.
+    reducedDataFrame, varianceDataFrame, projectionDictionary \
+        = crypto_sweep \
+            .ReturnReducedFeatureTupleFunction \
+                (lambda: (featureFloatArray[firstRowInteger:firstRowInteger + 100, :20]
+                          for firstRowInteger in range(0, 500, 100)),
+                 componentsInteger = 3)
+
+    assert projectionDictionary['method'] == 'incremental'
+
+    incrementalPCAObject \
+        = IncrementalPCA \
+            (n_components = 3,
+             batch_size = 100) \
+            .fit(featureFloatArray[:, :20])
+
+    np.testing.assert_allclose \
+        (reducedDataFrame.to_numpy(),
+         incrementalPCAObject.transform(featureFloatArray[:, :20]),
+         atol = 1e-6)
+
+
+def test_kneedle_finds_the_knee_of_a_convex_decreasing_series():
+
+    inertiaFloatSeries \
+        = pd.Series \
+            ([1000.0, 400.0, 120.0, 100.0, 90.0, 82.0, 76.0, 71.0],
+             index = range(1, 9))
+
+    assert crypto_sweep \
+               .ReturnOptimalKFromWCSSElbowSeriesFunction \
+                   (inertiaFloatSeries) == 3
+
+
+def test_kneedle_finds_the_number_of_blobs():
+
+    featureFloatArray \
+        = make_blobs \
+            (n_samples = 400,
+             centers = 4,
+             cluster_std = 0.5,
+             random_state = 0)[0]
+
+    inertiaFloatSeries \
+        = pd.Series \
+            ([KMeans(n_clusters = k, n_init = 4, random_state = 0) \
+                  .fit(featureFloatArray) \
+                  .inertia_
+              for k in range(1, 11)],
+             index = range(1, 11))
+
+    assert crypto_sweep \
+               .ReturnOptimalKFromWCSSElbowSeriesFunction \
+                   (inertiaFloatSeries) == 4
+
+
+def test_subset_distances_add_up_the_column_contributions(normalizedDataFrame, monkeypatch):
+
+    gramDataFrame \
+        = crypto_sweep \
+            .ReturnColumnGramContributionsDataFrameFunction \
+                (normalizedDataFrame)
+
+    # A small working memory budget splits the rows into several chunks.
+    monkeypatch.setattr \
+        (crypto_constant,
+         'DISTANCE_WORKING_MEMORY_MB_INTEGER',
+         0)
+
+    for columnIndexTuple in [(0, 1), (2, 4, 6), tuple(range(normalizedDataFrame.shape[1]))]:
+
+        distanceFloatArray \
+            = crypto_sweep \
+                .ReturnSubsetDistanceMatrixFunction \
+                    (gramDataFrame,
+                     columnIndexTuple)
+
+        np.testing.assert_allclose \
+            (distanceFloatArray,
+             pairwise_distances(normalizedDataFrame.iloc[:, list(columnIndexTuple)]),
+             atol = 1e-6)
+
+        assert (distanceFloatArray == distanceFloatArray.T).all()
+
+        assert (np.diag(distanceFloatArray) == 0.0).all()
+
+    monkeypatch.setattr \
+        (crypto_constant,
+         'DISTANCE_MATRIX_MAX_BYTES_INTEGER',
+         normalizedDataFrame.shape[0] ** 2 * 8)
+
+    assert crypto_sweep \
+               .ReturnColumnGramContributionsDataFrameFunction \
+                   (normalizedDataFrame) is None
+
+
+@pytest.mark.parametrize('adaptiveBatchInteger', [None, 10])
+def test_uncached_sweep_leaves_the_model_cache_alone(normalizedDataFrame, monkeypatch, adaptiveBatchInteger):
+
+    monkeypatch.setattr \
+        (crypto_constant,
+         'ADAPTIVE_N_INIT_BATCH_INTEGER',
+         adaptiveBatchInteger)
+
+    monkeypatch.setattr \
+        (crypto_constant,
+         'fittedModelsOrderedDictionary',
+         collections.OrderedDict())
+
+    monkeypatch.setattr \
+        (crypto_constant,
+         'fittedModelsCacheBytesInteger',
+         0)
+
+    uncachedDictionary \
+        = crypto_sweep \
+            .ReturnKMeansSweepDictionaryFunction \
+                (normalizedDataFrame,
+                 kValueIntegerList = [2, 3, 4],
+                 cacheFlagBoolean = False)
+
+    assert len(crypto_constant.fittedModelsOrderedDictionary) == 0
+
+    assert crypto_constant.fittedModelsCacheBytesInteger == 0
+
+    # A cached model does not stand in for an uncached fit either.
+    modelKMeansObject \
+        = crypto_sweep \
+            .ReturnFittedKMeansModelFunction \
+                (normalizedDataFrame,
+                 3,
+                 fullBatchFlagBoolean = False)
+
+    assert crypto_sweep \
+               .ReturnFittedKMeansModelFunction \
+                   (normalizedDataFrame,
+                    3,
+                    fullBatchFlagBoolean = False,
+                    cacheFlagBoolean = False) is not modelKMeansObject
+
+    assert len(crypto_constant.fittedModelsOrderedDictionary) == 1
+
+    monkeypatch.setattr \
+        (crypto_constant,
+         'sweepResultsDictionary',
+         {})
+
+    cachedDictionary \
+        = crypto_sweep \
+            .ReturnKMeansSweepDictionaryFunction \
+                (normalizedDataFrame,
+                 kValueIntegerList = [2, 3, 4])
+
+    assert len(crypto_constant.fittedModelsOrderedDictionary) == 3
+
+    for methodString in ['Wcss Elbow', 'Calinski Harabasz', 'Silhouette', 'Davies Bouldin']:
+
+        pd.testing.assert_series_equal \
+            (uncachedDictionary[methodString][1],
+             cachedDictionary[methodString][1])
+
+
+
+
+def test_weighted_scores_match_duplicated_rows(normalizedDataFrame):
+
+    featureFloatArray \
+        = normalizedDataFrame.to_numpy()
+
+    weightFloatArray \
+        = np.random.default_rng(0) \
+            .integers(1, 4, len(featureFloatArray)) \
+            .astype(np.float64)
+
+    modelKMeansObject \
+        = KMeans(n_clusters = 3, n_init = 4, random_state = 0) \
+            .fit(featureFloatArray, sample_weight = weightFloatArray)
+
+    repeatsIntegerArray \
+        = weightFloatArray.astype(np.int64)
+
+    weightedTuple \
+        = crypto_sweep \
+            .ReturnKMeansScoresTupleFunction \
+                (normalizedDataFrame,
+                 modelKMeansObject.labels_,
+                 1,
+                 centersFloatArray = modelKMeansObject.cluster_centers_,
+                 silhouetteModeString = 'exact',
+                 sampleWeightFloatArray = weightFloatArray)
+
+    duplicatedTuple \
+        = crypto_sweep \
+            .ReturnKMeansScoresTupleFunction \
+                (pd.DataFrame \
+                     (np.repeat(featureFloatArray, repeatsIntegerArray, axis = 0),
+                      columns = normalizedDataFrame.columns),
+                 np.repeat(modelKMeansObject.labels_, repeatsIntegerArray),
+                 1,
+                 centersFloatArray = modelKMeansObject.cluster_centers_,
+                 silhouetteModeString = 'exact')
+
+    # The Calinski-Harabasz, Davies-Bouldin, and silhouette scores.
+    assert weightedTuple[:3] == pytest.approx(duplicatedTuple[:3], rel = 1e-9)
+
+
+def test_unique_rows_carry_the_duplicates_weights(normalizedDataFrame):
+
+    repeatsIntegerArray \
+        = np.random.default_rng(1) \
+            .integers(1, 4, len(normalizedDataFrame))
+
+    duplicatedDataFrame \
+        = normalizedDataFrame \
+            .iloc[np.repeat(np.arange(len(normalizedDataFrame)), repeatsIntegerArray)]
+
+    uniqueDataFrame, weightSeries, inverseIntegerArray \
+        = crypto_sweep \
+            .ReturnWeightedUniqueRowsTupleFunction \
+                (duplicatedDataFrame)
+
+    pd.testing.assert_frame_equal \
+        (uniqueDataFrame,
+         normalizedDataFrame)
+
+    np.testing.assert_array_equal \
+        (weightSeries.to_numpy(),
+         repeatsIntegerArray)
+
+    np.testing.assert_array_equal \
+        (uniqueDataFrame.to_numpy()[inverseIntegerArray],
+         duplicatedDataFrame.to_numpy())
+
+    # The weighted inertia of the unique rows is the inertia of every row.
+    modelKMeansObject \
+        = KMeans(n_clusters = 3, n_init = 4, random_state = 0) \
+            .fit(uniqueDataFrame, sample_weight = weightSeries.to_numpy())
+
+    assert -modelKMeansObject.score(duplicatedDataFrame) \
+           == pytest.approx(modelKMeansObject.inertia_, rel = 1e-9)
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import CryptoClusteringWard as crypto_ward
+
+
+def test_ward_cuts_are_nested_and_exact(normalizedDataFrame):
+
+    labelsIntegerArrayList \
+        = [crypto_ward \
+               .ReturnWardClusterLabelsFunction \
+                   (normalizedDataFrame,
+                    kValueInteger)
+           for kValueInteger in range(2, 11)]
+
+    for kValueInteger, labelsIntegerArray \
+            in zip(range(2, 11), labelsIntegerArrayList):
+
+        assert sorted(np.unique(labelsIntegerArray)) == list(range(kValueInteger))
+
+    # Every cut refines the cut with one cluster fewer.
+    for coarseIntegerArray, fineIntegerArray \
+            in zip(labelsIntegerArrayList[:-1], labelsIntegerArrayList[1:]):
+
+        assert (pd.Series(coarseIntegerArray) \
+                    .groupby(fineIntegerArray) \
+                    .nunique() == 1).all()
+
+
+def test_ward_sweep_scores_every_cut(normalizedDataFrame):
+
+    sweepDictionary \
+        = crypto_ward \
+            .ReturnWardSweepDictionaryFunction \
+                (normalizedDataFrame,
+                 [2, 3, 4, 5])
+
+    featureFloatArray \
+        = normalizedDataFrame.to_numpy()
+
+    for kValueInteger in [2, 3, 4, 5]:
+
+        labelsIntegerArray \
+            = crypto_ward \
+                .ReturnWardClusterLabelsFunction \
+                    (normalizedDataFrame,
+                     kValueInteger)
+
+        assert sweepDictionary['Wcss Elbow'][1][kValueInteger] \
+               == pytest.approx \
+                      (sum(((featureFloatArray[labelsIntegerArray == clusterInteger]
+                             - featureFloatArray[labelsIntegerArray == clusterInteger] \
+                                   .mean(axis = 0)) ** 2).sum()
+                           for clusterInteger in range(kValueInteger)),
+                       rel = 1e-9)
+
+    assert (sweepDictionary['Iterations'] == 0).all()